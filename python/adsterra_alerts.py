@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Script: Adsterra Alert Engine (v1.0)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Mengevaluasi aturan (rule) peringatan setiap kali data baru masuk dari
+    AdsterraClient.get_stats, baik dari laporan interaktif (a, b, c, d, z)
+    maupun dari cron.
+
+    [ATURAN] (file: ~/.config/adsterra/alerts.json)
+    - drop_vs_weekday : metrik hari ini turun >= X% dibanding rata-rata hari
+                        yang sama (misal Senin) pada N minggu terakhir.
+    - below_streak    : metrik di bawah ambang selama N hari berturut-turut.
+
+    [INKREMENTAL]
+    - State bergulir per aturan disimpan di ~/.cache/adsterra/alerts_state.json.
+    - Setiap run hanya memproses hari final yang BARU sejak evaluasi terakhir;
+      baris hari ini dievaluasi sementara tanpa mengubah state.
+    - Peringatan sementara untuk hari ini hanya dikirim sekali per aturan.
+    - State di-lock dari load sampai save (open_engine), jadi run cron dan
+      run manual yang tumpang tindih tidak mengirim peringatan yang sama dua
+      kali atau saling menimpa state aturan.
+
+    [AKSI]
+    - Terminal, file log, dan/atau perintah eksternal (misal termux-notification).
+
+Penggunaan:
+    python3 adsterra_alerts.py --init      (buat contoh file aturan)
+    python3 adsterra_alerts.py             (cek data terbaru, cocok untuk cron)
+
+    Contoh cron (setiap 10 menit):
+    */10 * * * * python3 $PREFIX/mypython/adsterra_alerts.py --quiet
+
+Dependencies:
+    - requests, colorama
+--------------------------------------------------------------------------------
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import subprocess
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+from colorama import init, Fore, Style
+
+from adsterra_cache import CACHE_DIR, HistoryCache, gmt_today, normalize_row
+from adsterra_projection import day_fraction
+from adsterra_fileio import atomic_write, file_lock
+
+# ==============================================================================
+# 1. KONFIGURASI
+# ==============================================================================
+
+class AlertConfig:
+    CONFIG_DIR = os.environ.get("ADSTERRA_CONFIG_DIR") or os.path.join(os.path.expanduser("~"), ".config", "adsterra")
+    RULES_FILE = os.path.join(CONFIG_DIR, "alerts.json")
+    STATE_FILE = os.path.join(CACHE_DIR, "alerts_state.json")
+
+    # Baris hari ini baru dievaluasi setelah porsi hari (GMT) ini berjalan
+    MIN_DAY_FRACTION = 0.1
+
+DEFAULT_RULES = {
+    "rules": [
+        {"name": "Impresi anjlok", "type": "drop_vs_weekday", "metric": "impression", "drop_pct": 40, "weeks": 4},
+        {"name": "CPM rendah", "type": "below_streak", "metric": "cpm", "threshold": 0.30, "days": 3}
+    ],
+    "actions": {
+        "terminal": True,
+        "log_file": os.path.join(CACHE_DIR, "alerts.log"),
+        "command": ["termux-notification", "--title", "Adsterra Alert", "--content", "{message}"]
+    }
+}
+
+HARI = ("Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu", "Minggu")
+
+# Metrik aditif diskalakan dengan progres hari saat mengevaluasi baris hari ini
+ADDITIVE_METRICS = ("impression", "revenue")
+
+def fmt_metric(metric, value):
+    if metric == "impression":
+        return f"{int(value):,}".replace(",", ".")
+    return f"${float(value):,.3f}"
+
+# ==============================================================================
+# 2. ATURAN (RULE)
+# ==============================================================================
+
+def rule_key(spec):
+    """ID aturan dari isinya: mengubah parameter aturan = state baru"""
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode()).hexdigest()[:12]
+
+class Rule(ABC):
+    """
+    Basis aturan: check() tidak mengubah state, observe() memajukan state.
+    Default load_state / to_state / observe = aturan tanpa state.
+    """
+
+    def __init__(self, spec, state=None):
+        self.spec = spec
+        self.name = spec.get("name", spec["type"])
+        self.metric = spec["metric"]
+        self.key = rule_key(spec)
+        self.load_state(state or {})
+
+    def load_state(self, state):
+        pass
+
+    def to_state(self):
+        return {}
+
+    @abstractmethod
+    def check(self, day, row, frac=None):
+        """Mengembalikan pesan peringatan atau None. frac != None = baris hari ini"""
+
+    def observe(self, day, row):
+        pass
+
+class DropVsWeekday(Rule):
+    """Metrik turun >= drop_pct% dibanding rata-rata hari yang sama N minggu terakhir"""
+
+    def load_state(self, state):
+        weeks = int(self.spec.get("weeks", 4))
+        self.history = [deque(state.get("history", [[]] * 7)[wd], maxlen=weeks) for wd in range(7)]
+
+    def to_state(self):
+        return {"history": [list(h) for h in self.history]}
+
+    def check(self, day, row, frac=None):
+        past = self.history[day.weekday()]
+        if len(past) < 2:
+            return None
+        expected = sum(past) / len(past)
+        if frac is not None and self.metric in ADDITIVE_METRICS:
+            expected *= frac
+        if expected <= 0:
+            return None
+
+        value = row[self.metric]
+        change = value / expected - 1
+        if change <= -float(self.spec["drop_pct"]) / 100:
+            return (f"{self.metric} {fmt_metric(self.metric, value)} turun {abs(change) * 100:.0f}% "
+                    f"vs rata-rata {HARI[day.weekday()]} ({fmt_metric(self.metric, expected)})")
+        return None
+
+    def observe(self, day, row):
+        self.history[day.weekday()].append(row[self.metric])
+
+class BelowStreak(Rule):
+    """Metrik di bawah ambang selama `days` hari berturut-turut"""
+
+    def load_state(self, state):
+        self.streak = state.get("streak", 0)
+
+    def to_state(self):
+        return {"streak": self.streak}
+
+    def check(self, day, row, frac=None):
+        threshold = float(self.spec["threshold"])
+        if frac is not None and self.metric in ADDITIVE_METRICS:
+            threshold *= frac
+        if row[self.metric] >= threshold:
+            return None
+        streak = self.streak + 1
+        if streak >= int(self.spec["days"]):
+            return (f"{self.metric} {fmt_metric(self.metric, row[self.metric])} di bawah "
+                    f"{fmt_metric(self.metric, threshold)} selama {streak} hari berturut-turut")
+        return None
+
+    def observe(self, day, row):
+        self.streak = self.streak + 1 if row[self.metric] < float(self.spec["threshold"]) else 0
+
+RULE_TYPES = {
+    "drop_vs_weekday": DropVsWeekday,
+    "below_streak": BelowStreak,
+}
+
+# ==============================================================================
+# 3. ENGINE
+# ==============================================================================
+
+def read_state(state_file=AlertConfig.STATE_FILE):
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+class AlertEngine:
+    """Buat lewat open_engine() agar state di-lock dari load sampai save"""
+
+    def __init__(self, rules_file=AlertConfig.RULES_FILE, state_file=AlertConfig.STATE_FILE):
+        self.state_file = state_file
+        with open(rules_file, "r", encoding="utf-8") as f:
+            self.config = json.load(f)
+        self.state = read_state(state_file)
+
+        rule_states = self.state.get("rules", {})
+        self.rules = []
+        for spec in self.config.get("rules", []):
+            rule_cls = RULE_TYPES.get(spec.get("type"))
+            if rule_cls is None:
+                print(f"{Fore.YELLOW}[ALERT] Tipe aturan tidak dikenal: {spec.get('type')}")
+                continue
+            self.rules.append(rule_cls(spec, rule_states.get(rule_key(spec))))
+
+    @property
+    def last_date(self):
+        return self.state.get("last_date")
+
+    def _observe(self, date_str, row):
+        day = datetime.strptime(date_str, "%Y-%m-%d").date()
+        for rule in self.rules:
+            rule.observe(day, row)
+        self.state["last_date"] = date_str
+
+    def catch_up(self, cache, before=None):
+        """
+        Hari final yang ada di cache tetapi belum dievaluasi (dan tidak ada di
+        item saat ini) diproses diam-diam agar state tetap bersambung.
+        """
+        for date_str, row in cache.rows_after(self.last_date):
+            if before and date_str >= before:
+                break
+            self._observe(date_str, row)
+
+    def evaluate(self, items, now=None):
+        """Evaluasi item baru. Mengembalikan list (nama_aturan, tanggal, pesan, sementara)"""
+        now = now or datetime.now(timezone.utc)
+        today_str = now.date().isoformat()
+        alerts = []
+
+        rows = sorted((i["date"], normalize_row(i)) for i in items if i.get("date"))
+
+        # State kosong & cache kosong: riwayat hanya dipakai sebagai dasar,
+        # agar laporan all-time pertama tidak memicu ratusan peringatan lama
+        seeding = self.last_date is None
+
+        # --- Hari final yang belum pernah dievaluasi ---
+        for date_str, row in rows:
+            if date_str >= today_str or (self.last_date and date_str <= self.last_date):
+                continue
+            if not seeding:
+                day = datetime.strptime(date_str, "%Y-%m-%d").date()
+                for rule in self.rules:
+                    message = rule.check(day, row)
+                    if message:
+                        alerts.append((rule.name, date_str, message, False))
+            self._observe(date_str, row)
+
+        # --- Baris hari ini (sementara, state tidak diubah) ---
+        fired = self.state.get("fired", {}).get(today_str, [])
+        frac = day_fraction(now)
+        for date_str, row in rows:
+            if date_str != today_str or frac < AlertConfig.MIN_DAY_FRACTION:
+                continue
+            for rule in self.rules:
+                if rule.key in fired:
+                    continue
+                message = rule.check(now.date(), row, frac)
+                if message:
+                    alerts.append((rule.name, date_str, message, True))
+                    fired.append(rule.key)
+        self.state["fired"] = {today_str: fired}
+
+        self.state["rules"] = {rule.key: rule.to_state() for rule in self.rules}
+        return alerts
+
+    def save(self):
+        """Hanya di dalam file_lock(state_file), lihat open_engine()"""
+        atomic_write(self.state_file, json.dumps(self.state))
+
+@contextmanager
+def open_engine(rules_file=AlertConfig.RULES_FILE, state_file=AlertConfig.STATE_FILE):
+    """
+    AlertEngine dengan state di-lock dari load sampai save. State disimpan
+    hanya jika blok selesai tanpa error.
+    """
+    with file_lock(state_file):
+        engine = AlertEngine(rules_file, state_file)
+        yield engine
+        engine.save()
+
+# ==============================================================================
+# 4. AKSI (TERMINAL / FILE LOG / PERINTAH)
+# ==============================================================================
+
+def dispatch(alerts, actions):
+    for rule_name, date_str, message, provisional in alerts:
+        tag = " (sementara)" if provisional else ""
+        line = f"[{date_str}] {rule_name}: {message}{tag}"
+
+        if actions.get("terminal", True):
+            print(f"{Fore.RED}{Style.BRIGHT}[ALERT]{Style.RESET_ALL} {Fore.YELLOW}{line}")
+
+        log_file = actions.get("log_file")
+        if log_file:
+            log_file = os.path.expanduser(log_file)
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            with open(log_file, "a", encoding="utf-8") as f:
+                f.write(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} {line}\n")
+
+        command = actions.get("command")
+        if command:
+            args = [part.format(message=line, rule=rule_name, date=date_str) for part in command]
+            try:
+                subprocess.run(args, timeout=15, check=False,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except (OSError, subprocess.TimeoutExpired) as e:
+                print(f"{Fore.LIGHTBLACK_EX}[ALERT] Gagal menjalankan hook: {e}")
+
+def on_new_data(items, rules_file=AlertConfig.RULES_FILE):
+    """
+    Hook untuk script laporan: evaluasi aturan pada data yang baru diterima.
+    Tidak melakukan apa-apa jika file aturan belum dibuat.
+    """
+    if not items or not os.path.isfile(rules_file):
+        return []
+    try:
+        first = min((i["date"] for i in items if i.get("date")), default=None)
+        cache = HistoryCache()
+        with open_engine(rules_file) as engine:
+            engine.catch_up(cache, before=first)
+            alerts = engine.evaluate(items)
+        dispatch(alerts, engine.config.get("actions", {}))
+        return alerts
+    except Exception as e:
+        # Aturan rusak (misal "threshold": null) tidak boleh menghentikan laporan
+        print(f"{Fore.LIGHTBLACK_EX}[ALERT] Evaluasi aturan dilewati: {type(e).__name__}: {e}")
+        return []
+
+# ==============================================================================
+# 5. MAIN (MODE CRON)
+# ==============================================================================
+
+def write_default_rules(path):
+    if os.path.exists(path):
+        print(f"{Fore.YELLOW}[INFO] File aturan sudah ada: {path}")
+        return
+    atomic_write(path, json.dumps(DEFAULT_RULES, indent=2))
+    print(f"{Fore.GREEN}[OK] Contoh aturan dibuat: {path}")
+
+if __name__ == "__main__":
+    init(autoreset=True)
+
+    from adsterra_net import parse_net_flags
+    parse_net_flags()
+
+    parser = argparse.ArgumentParser(description="Adsterra Alert Engine")
+    parser.add_argument("--init", action="store_true", help="Buat contoh file aturan")
+    parser.add_argument("--quiet", action="store_true", help="Tanpa log koneksi (untuk cron)")
+    args = parser.parse_args()
+
+    if args.init:
+        write_default_rules(AlertConfig.RULES_FILE)
+        sys.exit(0)
+
+    if not os.path.isfile(AlertConfig.RULES_FILE):
+        print(f"{Fore.RED}[ERROR] File aturan belum ada. Jalankan: python3 adsterra_alerts.py --init")
+        sys.exit(1)
+
+    from adsterra_api import AdsterraClient
+
+    cache = HistoryCache()
+
+    # Tarik hanya hari setelah evaluasi terakhir (maks 2 hari final + hari ini).
+    # State dibaca tanpa lock untuk rencana fetch; evaluate() melewati hari
+    # yang sudah dievaluasi run lain selama request berjalan.
+    today = gmt_today()
+    start = today - timedelta(days=2)
+    last_date = read_state().get("last_date")
+    if last_date:
+        start = max(start, datetime.strptime(last_date, "%Y-%m-%d").date() + timedelta(days=1))
+    start = min(start, today)
+
+    data = AdsterraClient(verbose=not args.quiet).get_stats(start.isoformat(), today.isoformat())
+    if data is None:
+        sys.exit(1)
+
+    items = data.get("items", [])
+    with open_engine() as engine:
+        engine.catch_up(cache, before=start.isoformat())
+        alerts = engine.evaluate(items)
+    dispatch(alerts, engine.config.get("actions", {}))
+
+    if not alerts and not args.quiet:
+        print(f"{Fore.GREEN}[ALERT] Tidak ada aturan yang terpicu.")
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra Anomaly Detector
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Deteksi hari yang tidak wajar (traffic drop, CPM anjlok, lonjakan revenue)
+    secara streaming, menggantikan ambang statis seperti 'rev > 12.0' atau
+    'cpm > 0.5'.
+
+    [METODE]
+    - EWMA mean & varians per metrik (revenue, impression, cpm), O(1) per hari.
+    - Nilai di-transformasi log1p agar perubahan relatif (misal -40%) setara
+      di level pendapatan berapa pun.
+    - Hari ditandai jika |z-score| >= Z_THRESHOLD dan perubahan relatif
+      >= MIN_CHANGE. Hari anomali di-winsorize sebelum masuk EWMA agar satu
+      lonjakan tidak "merusak" baseline hari berikutnya.
+    - Satu kali lintasan (single pass), riwayat cache dipakai sebagai warm-up.
+--------------------------------------------------------------------------------
+"""
+
+import math
+from colorama import Fore, Style
+from tabulate import tabulate
+
+from adsterra_cache import HistoryCache, gmt_today, normalize_row
+
+METRICS = ("revenue", "impression", "cpm")
+LABELS = {"revenue": "REV", "impression": "IMP", "cpm": "CPM"}
+
+class DetectorConfig:
+    ALPHA = 0.1          # Bobot EWMA (~ memori 10 hari)
+    WARMUP_DAYS = 7      # Minimal hari sebelum mulai menandai
+    Z_THRESHOLD = 3.0    # Batas deviasi (dalam standar deviasi)
+    MIN_CHANGE = 0.15    # Minimal perubahan relatif terhadap ekspektasi (15%)
+    CLIP_Z = 2.0         # Hari anomali di-clip ke mean +/- CLIP_Z * sd saat update
+    WARMUP_WINDOW = 180  # Hari riwayat terakhir untuk warm-up (bobot hari lebih lama ~0)
+
+class EwmaStat:
+    """Mean & varians eksponensial (skala log1p) untuk satu metrik"""
+
+    __slots__ = ("mean", "var", "n")
+
+    def __init__(self):
+        self.mean = 0.0
+        self.var = 0.0
+        self.n = 0
+
+    def score(self, x):
+        """Mengembalikan (z, ekspektasi_skala_asli) atau (None, None) saat warm-up"""
+        if self.n < DetectorConfig.WARMUP_DAYS or self.var <= 0:
+            return None, None
+        return (x - self.mean) / math.sqrt(self.var), math.expm1(self.mean)
+
+    def update(self, x, clip=False):
+        if self.n == 0:
+            self.mean = x
+        else:
+            if clip:
+                sd = math.sqrt(self.var)
+                x = min(max(x, self.mean - DetectorConfig.CLIP_Z * sd), self.mean + DetectorConfig.CLIP_Z * sd)
+            a = DetectorConfig.ALPHA
+            diff = x - self.mean
+            incr = a * diff
+            self.mean += incr
+            self.var = (1 - a) * (self.var + diff * incr)
+        self.n += 1
+
+class Anomaly:
+    __slots__ = ("date", "metric", "value", "expected", "z")
+
+    def __init__(self, date, metric, value, expected, z):
+        self.date = date
+        self.metric = metric
+        self.value = value
+        self.expected = expected
+        self.z = z
+
+    @property
+    def direction(self):
+        return "down" if self.z < 0 else "up"
+
+    @property
+    def change(self):
+        return (self.value - self.expected) / self.expected if self.expected else 0.0
+
+def detect_anomalies(rows, warmup_rows=()):
+    """
+    rows / warmup_rows: iterable (tanggal, row) urut tanggal.
+    Mengembalikan dict { "YYYY-MM-DD": [Anomaly, ...] } hanya untuk `rows`.
+    """
+    stats = {m: EwmaStat() for m in METRICS}
+    found = {}
+
+    def step(date_str, row, record):
+        for metric in METRICS:
+            value = row[metric]
+            x = math.log1p(max(value, 0.0))
+            z, expected = stats[metric].score(x)
+            flagged = False
+            if z is not None and abs(z) >= DetectorConfig.Z_THRESHOLD:
+                anomaly = Anomaly(date_str, metric, value, expected, z)
+                flagged = abs(anomaly.change) >= DetectorConfig.MIN_CHANGE
+                if flagged and record:
+                    found.setdefault(date_str, []).append(anomaly)
+            stats[metric].update(x, clip=flagged)
+
+    for date_str, row in warmup_rows:
+        step(date_str, row, record=False)
+    for date_str, row in rows:
+        step(date_str, row, record=True)
+    return found
+
+def find_anomalies(items, cache=None, today=None):
+    """
+    Deteksi anomali untuk item API (hanya hari final). Hari final ikut
+    disimpan ke HistoryCache, dan riwayat sebelum item pertama dipakai
+    sebagai warm-up detektor.
+    """
+    today_str = (today or gmt_today()).isoformat()
+    rows = sorted(
+        (i["date"], normalize_row(i)) for i in items
+        if i.get("date") and i["date"] < today_str
+    )
+    if not rows:
+        return {}
+
+    own_cache = cache is None
+    cache = cache or HistoryCache()
+    cache.merge(items, today)
+    warmup = cache.rows_before(rows[0][0], limit=DetectorConfig.WARMUP_WINDOW)
+    if own_cache:
+        try:
+            cache.save()
+        except OSError:
+            pass
+    return detect_anomalies(rows, warmup)
+
+# ==============================================================================
+# TAMPILAN
+# ==============================================================================
+
+def mark_date(date_str, day_anomalies):
+    """Sel tanggal dengan penanda anomali, misal '2026-02-10 ▼REV▼IMP'"""
+    if not day_anomalies:
+        return date_str
+    tags = "".join(f"{'▼' if a.direction == 'down' else '▲'}{LABELS[a.metric]}" for a in day_anomalies)
+    color = Fore.RED if any(a.direction == "down" for a in day_anomalies) else Fore.CYAN
+    return f"{color}{Style.BRIGHT}{date_str} {tags}{Style.RESET_ALL}"
+
+def _fmt(metric, value):
+    if metric == "impression":
+        return f"{int(value):,}".replace(",", ".")
+    return f"${float(value):,.3f}"
+
+def print_anomaly_summary(anomalies, limit=20):
+    """Ringkasan hari yang ditandai (maksimal `limit` kejadian terbaru)"""
+    print(f"\n{Fore.RED}{Style.BRIGHT}=== DETEKSI ANOMALI (EWMA z-score) ==={Style.RESET_ALL}")
+
+    events = [a for date_str in sorted(anomalies) for a in anomalies[date_str]]
+    if not events:
+        print(f"{Fore.LIGHTBLACK_EX}Tidak ada hari yang menyimpang dari pola normal.")
+        return
+
+    counts = {}
+    for a in events:
+        key = f"{'▼' if a.direction == 'down' else '▲'}{LABELS[a.metric]}"
+        counts[key] = counts.get(key, 0) + 1
+    print(f"{len(anomalies)} hari ditandai: " + ", ".join(f"{k} x{v}" for k, v in sorted(counts.items())))
+
+    rows = []
+    for a in events[-limit:]:
+        color = Fore.RED if a.direction == "down" else Fore.CYAN
+        rows.append([
+            a.date,
+            LABELS[a.metric],
+            _fmt(a.metric, a.value),
+            _fmt(a.metric, a.expected),
+            f"{color}{a.change * 100:+.0f}%{Style.RESET_ALL}",
+            f"{a.z:+.1f}",
+        ])
+    headers = ["TANGGAL", "METRIK", "NILAI", "NORMAL", "SELISIH", "Z"]
+    print(tabulate(rows, headers=headers, tablefmt="simple", stralign="right", disable_numparse=True))
+    if len(events) > limit:
+        print(f"{Fore.LIGHTBLACK_EX}(+{len(events) - limit} kejadian lebih lama tidak ditampilkan)")
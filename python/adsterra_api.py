@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra Shared API Client
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Client API Adsterra bersama untuk modul pendamping (alert, collector, dll).
+    Perilaku sama dengan AdsterraClient di z.py: rentang tanggal string
+    (YYYY-MM-DD), group_by=date, dan log status berwarna. Daftar situs &
+    placement (get_domains / get_placements) dipakai adsterra_meta.
+
+    Environment variable (opsional):
+    - ADSTERRA_API_KEY  : mengganti API key bawaan
+    - ADSTERRA_BASE_URL : mengganti endpoint (misal server lokal untuk testing)
+
+Dependencies:
+    - requests, colorama
+--------------------------------------------------------------------------------
+"""
+
+import os
+import time
+import requests
+from colorama import Fore
+
+from adsterra_net import make_session
+from adsterra_jsonlib import response_json
+
+class ApiConfig:
+    API_KEY = os.environ.get("ADSTERRA_API_KEY", "d99b6eb88c389817b16af23dd030f280")
+    BASE_URL = os.environ.get("ADSTERRA_BASE_URL", "https://api3.adsterratools.com/publisher/stats.json")
+    # domains.json & domain/{id}/placements.json berada di folder yang sama dengan stats.json
+    ROOT_URL = BASE_URL.rsplit("/", 1)[0]
+    USER_AGENT = "WahyuBot/5.0 (SharedClient)"
+    TIMEOUT = 30
+
+class AdsterraClient:
+    def __init__(self, api_key=ApiConfig.API_KEY, verbose=True):
+        self.verbose = verbose
+        self.session = make_session()
+        self.session.headers.update({
+            "X-API-Key": api_key,
+            "User-Agent": ApiConfig.USER_AGENT,
+            "Content-Type": "application/json"
+        })
+
+    def _log(self, message):
+        if self.verbose:
+            print(message)
+
+    def get_stats(self, start_date_str, finish_date_str, group_by="date"):
+        """
+        Mengambil data dari Adsterra berdasarkan rentang tanggal string (YYYY-MM-DD).
+        Mengembalikan dict JSON API, atau None jika gagal.
+        """
+        params = {
+            "start_date": start_date_str,
+            "finish_date": finish_date_str,
+            "group_by": group_by
+        }
+
+        self._log(f"{Fore.CYAN}[SYSTEM] Rentang Tarik Data: {Fore.YELLOW}{start_date_str}{Fore.CYAN} s/d {Fore.YELLOW}{finish_date_str}")
+        return self._request(ApiConfig.BASE_URL, params)
+
+    def get_domains(self):
+        """List situs {id, title, ...} dari domains.json, atau None jika gagal"""
+        data = self._request(f"{ApiConfig.ROOT_URL}/domains.json")
+        return None if data is None else data.get("items", [])
+
+    def get_placements(self, domain_id):
+        """List placement {id, title, ...} milik satu situs, atau None jika gagal"""
+        data = self._request(f"{ApiConfig.ROOT_URL}/domain/{domain_id}/placements.json")
+        return None if data is None else data.get("items", [])
+
+    def _request(self, url, params=None):
+        """GET JSON dengan log status; dict JSON API, atau None jika gagal"""
+        try:
+            start_time = time.time()
+            resp = self.session.get(url, params=params, timeout=ApiConfig.TIMEOUT)
+            duration = time.time() - start_time
+
+            if resp.status_code == 200:
+                data = response_json(resp)
+                if "errors" in data and data["errors"]:
+                    self._log(f"{Fore.RED}[API ERROR] {data['errors']}")
+                    return None
+                self._log(f"{Fore.GREEN}[SUCCESS] Data diterima dalam {duration:.2f} detik.")
+                return data
+
+            self._log(f"{Fore.RED}[ERROR] HTTP Code: {resp.status_code}")
+            return None
+        except requests.exceptions.Timeout:
+            self._log(f"{Fore.RED}[CONN] Error: Koneksi Timeout (Lebih dari {ApiConfig.TIMEOUT} detik).")
+            return None
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self._log(f"{Fore.RED}[CONN] Error: Terjadi kesalahan sistem -> {e}")
+            return None
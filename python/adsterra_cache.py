@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra History Cache
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Penyimpanan lokal data harian Adsterra yang sudah FINAL (tanggal < hari ini
+    GMT), dipakai bersama oleh script laporan (z, a, b, c, d).
+
+    - rows  : file biner fixed-width `history.bin` (lihat HistoryFile), dibuka
+              dengan mmap dan di-slice lewat binary search, sehingga membaca
+              8 hari dari riwayat 10 tahun hanya menyentuh 8 record.
+    - state : ruang simpan state inkremental milik fitur lain (misal model
+              proyeksi) di `history.json`, sehingga setiap run hanya
+              memproses hari yang baru. `revision` naik setiap kali hari
+              final yang sudah tersimpan berubah nilainya, sebagai tanda
+              bagi state yang perlu dibangun ulang.
+
+    Penulisan lewat adsterra_fileio (lock antar-penulis + atomic replace),
+    sehingga collector cron & laporan manual aman berjalan bersamaan.
+
+    Lokasi default: ~/.cache/adsterra/
+    (bisa diganti dengan environment variable ADSTERRA_CACHE_DIR)
+--------------------------------------------------------------------------------
+"""
+
+import os
+import mmap
+import struct
+import bisect
+from datetime import date, datetime, timezone
+
+from adsterra_jsonlib import load_file, dumps
+from adsterra_fileio import file_lock, atomic_write
+
+CACHE_DIR = os.environ.get("ADSTERRA_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "adsterra")
+
+def gmt_today():
+    """Tanggal hari ini menurut server Adsterra (GMT)"""
+    return datetime.now(timezone.utc).date()
+
+def normalize_row(item):
+    """Ambil 3 metrik utama dari item API dengan tipe yang konsisten"""
+    return {
+        "impression": int(item.get("impression", 0)),
+        "revenue": float(item.get("revenue", 0.0)),
+        "cpm": float(item.get("cpm", 0.0)),
+    }
+
+def _ordinal(date_str):
+    return date.fromisoformat(date_str).toordinal()
+
+# ==============================================================================
+# FILE RIWAYAT BINER (MMAP)
+# ==============================================================================
+
+class _Ordinals:
+    """Urutan ordinal tanggal langsung dari buffer mmap (untuk bisect)"""
+
+    __slots__ = ("buf", "count")
+
+    def __init__(self, buf, count):
+        self.buf = buf
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        return HistoryFile.ORDINAL.unpack_from(self.buf, HistoryFile.HEADER.size + i * HistoryFile.RECORD.size)[0]
+
+class HistoryFile:
+    """
+    Record fixed-width urut tanggal:
+        header 16 byte : magic 'ADSH', versi, ukuran record
+        record 32 byte : ordinal hari (int32), impresi (int64), revenue, cpm (float64)
+    """
+
+    FILENAME = "history.bin"
+    MAGIC = b"ADSH"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHH8x")
+    RECORD = struct.Struct("<i4xqdd")
+    ORDINAL = struct.Struct("<i")
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._mm = None
+        self.count = 0
+        self.open()
+
+    def open(self):
+        self.close()
+        try:
+            self._file = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        size = os.fstat(self._file.fileno()).st_size
+        if size < self.HEADER.size:
+            self.close()
+            return
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, rec_size = self.HEADER.unpack_from(self._mm, 0)
+        if magic != self.MAGIC or version != self.VERSION or rec_size != self.RECORD.size:
+            self.close()
+            return
+        self.count = (size - self.HEADER.size) // self.RECORD.size
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.count = 0
+
+    def _index(self, ordinal):
+        return bisect.bisect_left(_Ordinals(self._mm, self.count), ordinal)
+
+    def slice(self, lo=None, hi=None, limit=None):
+        """
+        Record dengan lo <= ordinal < hi (None = tanpa batas), maksimal `limit`
+        record terakhir. Dibaca lewat memoryview tanpa menyalin buffer.
+        """
+        if not self.count:
+            return []
+        i = self._index(lo) if lo is not None else 0
+        j = self._index(hi) if hi is not None else self.count
+        if limit is not None:
+            i = max(i, j - limit)
+        if i >= j:
+            return []
+
+        start = self.HEADER.size + i * self.RECORD.size
+        end = self.HEADER.size + j * self.RECORD.size
+        with memoryview(self._mm)[start:end] as view:
+            return [
+                (date.fromordinal(o).isoformat(), {"impression": imp, "revenue": rev, "cpm": cpm})
+                for o, imp, rev, cpm in self.RECORD.iter_unpack(view)
+            ]
+
+    def get(self, ordinal):
+        if not self.count:
+            return None
+        i = self._index(ordinal)
+        if i < self.count:
+            o, imp, rev, cpm = self.RECORD.unpack_from(self._mm, self.HEADER.size + i * self.RECORD.size)
+            if o == ordinal:
+                return {"impression": imp, "revenue": rev, "cpm": cpm}
+        return None
+
+    def _pack(self, ordinal, row):
+        return self.RECORD.pack(ordinal, row["impression"], row["revenue"], row["cpm"])
+
+    def apply(self, changes):
+        """
+        Tulis perubahan { ordinal: row } di bawah lock penulis. Tanggal baru
+        di akhir cukup di-append; mengubah/menyisipkan record lama memicu
+        tulis ulang penuh secara atomic (pembaca yang sedang membuka mmap
+        tetap melihat versi lama yang utuh).
+        """
+        if not changes:
+            return
+        with file_lock(self.path):
+            # Baca ulang: penulis lain mungkin sudah menambah record sejak open()
+            self.open()
+            last = self.ORDINAL.unpack_from(self._mm, self.HEADER.size + (self.count - 1) * self.RECORD.size)[0] if self.count else None
+            if last is not None and min(changes) <= last:
+                rows = {_ordinal(d): row for d, row in self.slice()}
+                rows.update(changes)
+                self._rewrite(rows)
+            elif self._mm is None:
+                self._rewrite(changes)
+            else:
+                self._append(sorted(changes), changes)
+            self.open()
+
+    def _append(self, ordinals, changes):
+        count = self.count
+        self.close()
+        with open(self.path, "r+b") as f:
+            # Buang record terpotong sisa proses yang mati saat append
+            f.truncate(self.HEADER.size + count * self.RECORD.size)
+            f.seek(0, os.SEEK_END)
+            f.write(b"".join(self._pack(o, changes[o]) for o in ordinals))
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _rewrite(self, rows):
+        self.close()
+        atomic_write(self.path, self.HEADER.pack(self.MAGIC, self.VERSION, self.RECORD.size)
+                     + b"".join(self._pack(o, rows[o]) for o in sorted(rows)))
+
+# ==============================================================================
+# CACHE RIWAYAT + STATE
+# ==============================================================================
+
+class HistoryCache:
+    """Riwayat harian final (history.bin) + state inkremental (history.json)"""
+
+    FILENAME = "history.json"
+    VERSION = 2
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.path = os.path.join(cache_dir, self.FILENAME)
+        self.history = HistoryFile(os.path.join(cache_dir, HistoryFile.FILENAME))
+        self.pending = {}
+        self.state = {}
+        self.revision = 0
+        self._loaded_revision = 0
+        self._dirty_keys = set()
+        self.dirty = False
+        self.load()
+
+    def _read(self):
+        try:
+            return load_file(self.path)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def load(self):
+        data = self._read()
+        if data.get("version") == self.VERSION:
+            self.state = data.get("state", {})
+            self.revision = self._loaded_revision = data.get("revision", 0)
+        elif data.get("version") == 1:
+            # Format lama: rows ada di JSON, dipindah ke history.bin saat save()
+            self.state = data.get("state", {})
+            self.pending.update(data.get("rows", {}))
+            self._dirty_keys.update(self.state)
+            self.dirty = True
+
+    def get(self, date_str):
+        if date_str in self.pending:
+            return self.pending[date_str]
+        return self.history.get(_ordinal(date_str))
+
+    def merge(self, items, today=None):
+        """
+        Menyimpan item API yang sudah final. Item hari ini (belum final)
+        diabaikan. Mengembalikan daftar tanggal yang baru/berubah (urut).
+
+        `revision` naik jika hari lama berubah ATAU hari baru masuk sebelum
+        tanggal terakhir yang tersimpan (backfill / hari yang telat datang),
+        karena state inkremental yang hanya membaca rows_after() tidak akan
+        pernah melihat hari itu.
+        """
+        today_str = (today or gmt_today()).isoformat()
+        changed = []
+        revised = False
+        newest = self.last_date()
+        for item in items:
+            date_str = item.get("date")
+            if not date_str or date_str >= today_str:
+                continue
+            row = normalize_row(item)
+            old = self.get(date_str)
+            if old != row:
+                self.pending[date_str] = row
+                changed.append(date_str)
+                revised = revised or old is not None or (newest is not None and date_str < newest)
+        if revised:
+            self.revision += 1
+        if changed:
+            self.dirty = True
+        return sorted(changed)
+
+    def last_date(self):
+        """Tanggal final terakhir yang tersimpan (None jika kosong)"""
+        rows = self._range(limit=1)
+        return rows[-1][0] if rows else None
+
+    def _range(self, lo=None, hi=None, limit=None):
+        """List (tanggal, row) urut tanggal untuk lo <= tanggal < hi"""
+        rows = self.history.slice(
+            _ordinal(lo) if lo else None,
+            _ordinal(hi) if hi else None,
+            limit,
+        )
+        pending = {d: r for d, r in self.pending.items() if (not lo or d >= lo) and (not hi or d < hi)}
+        if pending:
+            merged = dict(rows)
+            merged.update(pending)
+            rows = sorted(merged.items())
+            if limit is not None:
+                rows = rows[-limit:]
+        return rows
+
+    def rows_between(self, start_str, end_str):
+        """List (tanggal, row) urut tanggal untuk start <= tanggal <= end"""
+        end_next = date.fromordinal(_ordinal(end_str) + 1).isoformat()
+        return self._range(start_str, end_next)
+
+    def rows_before(self, date_str, limit=None):
+        """List (tanggal, row) urut tanggal untuk tanggal < date_str (maks `limit` terakhir)"""
+        return self._range(None, date_str, limit)
+
+    def rows_after(self, date_str):
+        """List (tanggal, row) urut tanggal untuk tanggal > date_str (None = semua)"""
+        if date_str is None:
+            return self._range()
+        return self._range(date.fromordinal(_ordinal(date_str) + 1).isoformat())
+
+    def set_state(self, key, value):
+        self.state[key] = value
+        self._dirty_keys.add(key)
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        if self.pending:
+            self.history.apply({_ordinal(d): row for d, row in self.pending.items()})
+            self.pending = {}
+        with file_lock(self.path):
+            # Gabung dengan state yang disimpan proses lain sejak load():
+            # hanya key yang diubah proses ini yang ditimpa
+            disk = self._read()
+            if disk.get("version") == self.VERSION:
+                state = disk.get("state", {})
+                revision = disk.get("revision", 0)
+            else:
+                state, revision = {}, 0
+            state.update({key: self.state[key] for key in self._dirty_keys})
+            revision += self.revision - self._loaded_revision
+            atomic_write(self.path, dumps({"version": self.VERSION, "revision": revision, "state": state}))
+        self.state = state
+        self.revision = self._loaded_revision = revision
+        self._dirty_keys.clear()
+        self.dirty = False
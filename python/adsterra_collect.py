@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Script: Adsterra Background Collector (v1.0)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Menarik data Adsterra di latar belakang (cron / termux-job-scheduler)
+    supaya perintah interaktif hampir selalu menemukan data lokal yang
+    hangat dan tidak perlu membayar biaya jaringan penuh di run pertama.
+
+    [YANG DITARIK]
+    - Hanya hari yang belum ada di SQLite lokal, hari final yang jatuh tempo
+      revalidasi (REVALIDATE_SCHEDULE di adsterra_store), dan hari ini (belum
+      final). Rencana panggilan API memakai plan_fetches dari adsterra_range.
+    - Semua akun di ~/.config/adsterra/accounts.json; tanpa file itu hanya
+      akun "default" dengan API key bawaan / ADSTERRA_API_KEY.
+
+    [PENULISAN]
+    - Semua hasil satu akun ditulis ke stats.sqlite3 dalam SATU transaksi
+      (baris + coverage), lalu akun "default" ikut digabung ke HistoryCache
+      dan disimpan sekali.
+    - Run yang tumpang tindih (cron berikutnya sementara run lama belum
+      selesai) langsung dilewati.
+
+    [LOG]
+    - Durasi, jumlah panggilan API, dan byte yang diunduh per run ditulis
+      ke ~/.cache/adsterra/collect.log.
+
+Penggunaan:
+    python3 adsterra_collect.py            (atau: collect)
+    python3 adsterra_collect.py --quiet    (untuk cron)
+
+    Contoh cron (setiap 30 menit):
+    */30 * * * * python3 $PREFIX/mypython/adsterra_collect.py --quiet
+
+    Contoh Termux (setiap 30 menit, tetap jalan setelah reboot):
+    termux-job-scheduler --script $PREFIX/bin/collect --period-ms 1800000 --persisted true
+
+Dependencies:
+    - requests, colorama
+--------------------------------------------------------------------------------
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+from datetime import datetime, timedelta
+
+from colorama import init, Fore
+
+from adsterra_api import AdsterraClient, ApiConfig
+from adsterra_cache import CACHE_DIR, HistoryCache, gmt_today
+from adsterra_store import StatsStore, DEFAULT_ACCOUNT, print_revisions
+from adsterra_range import plan_fetches, Config as RangeConfig
+from adsterra_net import METER, fmt_bytes, parse_net_flags
+from adsterra_fileio import file_lock, LockTimeout
+
+# ==============================================================================
+# 1. KONFIGURASI
+# ==============================================================================
+
+class CollectConfig:
+    CONFIG_DIR = os.environ.get("ADSTERRA_CONFIG_DIR") or os.path.join(os.path.expanduser("~"), ".config", "adsterra")
+    ACCOUNTS_FILE = os.path.join(CONFIG_DIR, "accounts.json")
+    LOG_FILE = os.path.join(CACHE_DIR, "collect.log")
+    LOCK_PATH = os.path.join(CACHE_DIR, "collect")
+
+    START_DATE = RangeConfig.START_DATE_ALL_TIME
+
+def load_accounts(path=CollectConfig.ACCOUNTS_FILE):
+    """
+    List akun {"name", "api_key", "start"} dari file:
+        {"accounts": [{"name": "default", "api_key": "...", "start": "2022-10-01"}, ...]}
+    """
+    if not os.path.isfile(path):
+        return [{"name": DEFAULT_ACCOUNT, "api_key": ApiConfig.API_KEY, "start": CollectConfig.START_DATE}]
+    with open(path, encoding="utf-8") as f:
+        accounts = json.load(f).get("accounts", [])
+    return [
+        {
+            "name": acc.get("name", DEFAULT_ACCOUNT),
+            "api_key": acc.get("api_key", ApiConfig.API_KEY),
+            "start": acc.get("start", CollectConfig.START_DATE),
+        }
+        for acc in accounts
+    ]
+
+# ==============================================================================
+# 2. COLLECTOR
+# ==============================================================================
+
+def collect_account(account, today, verbose=True):
+    """
+    Tarik hari yang hilang/jatuh tempo untuk satu akun lalu tulis sekaligus.
+    Mengembalikan dict ringkasan (hari, panggilan, revisi, gagal).
+    """
+    store = StatsStore(account=account["name"])
+    try:
+        start = datetime.strptime(account["start"], "%Y-%m-%d").date()
+        yesterday = today - timedelta(days=1)
+        covered = store.covered_dates(start, yesterday, today)
+        _, fetches = plan_fetches(start, today, today, covered)
+
+        client = AdsterraClient(api_key=account["api_key"], verbose=verbose)
+        items = []
+        coverage = []
+        failed = 0
+        for a, b in fetches:
+            data = client.get_stats(a.isoformat(), b.isoformat())
+            if data is None:
+                failed += 1
+                continue
+            items.extend(data.get("items", []))
+            if a <= yesterday:
+                coverage.append((a.isoformat(), min(b, yesterday).isoformat()))
+
+        revisions = store.upsert_items(items, today=today, coverage=coverage)
+        if verbose:
+            print_revisions(revisions)
+    finally:
+        store.close()
+
+    # Cache riwayat biner hanya untuk akun default (dipakai laporan a/b/c/d/z)
+    if account["name"] == DEFAULT_ACCOUNT and items:
+        cache = HistoryCache()
+        cache.merge(items, today)
+        cache.save()
+
+    return {
+        "account": account["name"],
+        "days": sum((b - a).days + 1 for a, b in fetches),
+        "calls": len(fetches),
+        "revisions": len(revisions),
+        "failed": failed,
+    }
+
+def write_log(line, path=CollectConfig.LOG_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+def run(verbose=True):
+    t0 = time.time()
+    today = gmt_today()
+    results = [collect_account(acc, today, verbose) for acc in load_accounts()]
+    duration = time.time() - t0
+    net = METER.totals()
+
+    summary = ", ".join(
+        f"{r['account']}: {r['days']} hari/{r['calls']} panggilan"
+        + (f"/{r['revisions']} revisi" if r["revisions"] else "")
+        + (f"/{r['failed']} GAGAL" if r["failed"] else "")
+        for r in results
+    )
+    line = (f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} {summary} | "
+            f"{duration:.2f} detik, unduh {fmt_bytes(net['received'])}, kirim {fmt_bytes(net['sent'])}")
+    write_log(line)
+
+    failed = any(r["failed"] for r in results)
+    if verbose:
+        color = Fore.YELLOW if failed else Fore.GREEN
+        print(f"{color}[COLLECT] {line}")
+    return not failed
+
+if __name__ == "__main__":
+    init(autoreset=True)
+    parse_net_flags()
+
+    parser = argparse.ArgumentParser(description="Collector Adsterra untuk cron / termux-job-scheduler")
+    parser.add_argument("--quiet", action="store_true", help="Tanpa output (untuk cron)")
+    args = parser.parse_args()
+
+    try:
+        with file_lock(CollectConfig.LOCK_PATH, timeout=0):
+            ok = run(verbose=not args.quiet)
+    except LockTimeout:
+        write_log(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} dilewati: collector lain masih berjalan")
+        sys.exit(0)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Script: Adsterra Hugo Dashboard Export (v1.0)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Mengekspor statistik Adsterra sebagai section dashboard Hugo:
+
+    - data/adsterra/summary.json        : total, 30 hari terakhir, papan rekor
+    - data/adsterra/months.json         : rekap bulanan + sidik jari tiap bulan
+    - data/adsterra/daily/YYYY-MM.json  : data harian per bulan
+    - static/adsterra-dashboard/*.svg   : grafik siap pakai (revenue harian,
+                                          bar bulanan, tren CPM, per bulan)
+    - content/adsterra-dashboard/_index.md
+
+    [INKREMENTAL]
+    - Sidik jari tiap bulan diambil dari SQLite lokal dalam satu query dan
+      dibandingkan dengan months.json hasil ekspor sebelumnya; hanya bulan
+      yang berubah yang data & grafiknya dibuat ulang.
+    - File hanya ditulis jika isinya berbeda (tanpa timestamp jam), sehingga
+      ekspor tanpa data baru tidak menghasilkan perubahan untuk di-commit.
+
+    [PRIVAT vs PUBLISH]
+    - Default: ditulis ke ~/.cache/adsterra/dashboard (ADSTERRA_DASHBOARD_DIR),
+      DI LUAR repo website, jadi tidak ikut di-commit, di-push, maupun
+      di-build untuk production. Pratinjau lewat mount Hugo khusus
+      environment development (lihat README).
+    - --publish: ditulis ke root website Hugo. Hugo tidak punya login, jadi
+      halaman, SVG, dan data JSON-nya PUBLIK; hanya tidak masuk list,
+      sitemap, dan diberi noindex. Data JSON ikut ter-push ke repo website.
+
+Penggunaan:
+    dash              (data dari SQLite lokal, isi dulu dengan a/b/c/d/z/r)
+    dash --fetch      (tarik dulu hari yang belum ada, lewat planner 'r')
+    dash --force      (buat ulang semua file)
+    dash --publish    (di root direktori Hugo; publik tapi tidak terdaftar)
+
+Dependencies:
+    - colorama (grafik SVG dibuat tanpa library tambahan)
+--------------------------------------------------------------------------------
+"""
+
+import os
+import sys
+import math
+import time
+import argparse
+from datetime import date, timedelta
+from xml.sax.saxutils import escape
+
+from colorama import init, Fore, Style
+
+# Modul pendamping (satu folder dengan script ini)
+from adsterra_cache import CACHE_DIR, HistoryCache, gmt_today
+from adsterra_store import StatsStore
+from adsterra_records import load_records, highlights, half_label
+from adsterra_jsonlib import dumps, load_file
+from adsterra_net import parse_net_flags
+from adsterra_fileio import atomic_write
+
+# ==============================================================================
+# 1. KONFIGURASI
+# ==============================================================================
+
+class Config:
+    # Folder ekspor default (privat, di luar repo website)
+    PRIVATE_DIR = os.environ.get("ADSTERRA_DASHBOARD_DIR") or os.path.join(CACHE_DIR, "dashboard")
+
+    SECTION = "adsterra-dashboard"
+    DATA_DIR = os.path.join("data", "adsterra")
+    STATIC_DIR = os.path.join("static", "adsterra-dashboard")
+    CONTENT_DIR = os.path.join("content", "adsterra-dashboard")
+
+    # Panjang jendela grafik ringkas
+    DAILY_WINDOW_DAYS = 90
+    CPM_WINDOW_DAYS = 180
+    CPM_MA_DAYS = 7
+
+    # Ukuran grafik SVG
+    WIDTH = 720
+    HEIGHT = 260
+
+    COLOR_REV = "#2e9d5b"
+    COLOR_BAR = "#3b7dd8"
+    COLOR_CPM = "#d89b3b"
+    COLOR_MA = "#b0413e"
+
+# ==============================================================================
+# 2. GRAFIK SVG (TANPA DEPENDENSI)
+# ==============================================================================
+
+class _Frame:
+    """Area plot & skala sumbu Y untuk satu grafik"""
+
+    LEFT, RIGHT, TOP, BOTTOM = 56, 12, 30, 28
+
+    def __init__(self, n, y_max):
+        self.n = max(n, 1)
+        self.y_max = _nice_max(y_max)
+        self.x0 = self.LEFT
+        self.x1 = Config.WIDTH - self.RIGHT
+        self.y0 = Config.HEIGHT - self.BOTTOM
+        self.y1 = self.TOP
+
+    @property
+    def step(self):
+        return (self.x1 - self.x0) / self.n
+
+    def x(self, i):
+        """Titik tengah slot ke-i"""
+        return self.x0 + self.step * (i + 0.5)
+
+    def y(self, value):
+        return self.y0 - (self.y0 - self.y1) * (value / self.y_max if self.y_max else 0)
+
+def _nice_max(value):
+    """Batas atas sumbu Y yang 'bulat' (1, 2, 2.5, 5 x 10^n)"""
+    if value <= 0:
+        return 1.0
+    magnitude = 10 ** math.floor(math.log10(value))
+    for factor in (1, 2, 2.5, 5, 10):
+        if value <= factor * magnitude:
+            return factor * magnitude
+    return 10 * magnitude
+
+def _svg(title, body):
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {Config.WIDTH} {Config.HEIGHT}" '
+        f'width="{Config.WIDTH}" height="{Config.HEIGHT}" font-family="sans-serif" font-size="11">\n'
+        f'<title>{escape(title)}</title>\n'
+        f'<rect width="100%" height="100%" fill="#ffffff"/>\n'
+        f'<text x="{_Frame.LEFT}" y="18" font-size="13" font-weight="bold" fill="#333">{escape(title)}</text>\n'
+        + "".join(body) +
+        '</svg>\n'
+    )
+
+def _axes(frame, labels, y_fmt, label_every):
+    parts = []
+    for k in range(5):
+        value = frame.y_max * k / 4
+        y = frame.y(value)
+        parts.append(f'<line x1="{frame.x0}" y1="{y:.1f}" x2="{frame.x1}" y2="{y:.1f}" stroke="#e5e5e5"/>\n')
+        parts.append(f'<text x="{frame.x0 - 6}" y="{y + 4:.1f}" text-anchor="end" fill="#666">{y_fmt(value)}</text>\n')
+    for i, label in enumerate(labels):
+        if i % label_every == 0:
+            parts.append(f'<text x="{frame.x(i):.1f}" y="{frame.y0 + 16}" text-anchor="middle" fill="#666">{escape(label)}</text>\n')
+    return parts
+
+def bar_chart(title, labels, values, color, y_fmt, label_every=1):
+    frame = _Frame(len(values), max(values, default=0))
+    parts = _axes(frame, labels, y_fmt, label_every)
+    width = max(frame.step * 0.8, 1)
+    for i, value in enumerate(values):
+        top = frame.y(value)
+        parts.append(
+            f'<rect x="{frame.x(i) - width / 2:.1f}" y="{top:.1f}" width="{width:.1f}" '
+            f'height="{frame.y0 - top:.1f}" fill="{color}"><title>{escape(labels[i])}: {y_fmt(value)}</title></rect>\n'
+        )
+    return _svg(title, parts)
+
+def line_chart(title, labels, series, y_fmt, label_every=1):
+    """series: list (values, warna, tebal); nilai None = titik dilewati"""
+    peak = max((v for values, _, _ in series for v in values if v is not None), default=0)
+    frame = _Frame(len(labels), peak)
+    parts = _axes(frame, labels, y_fmt, label_every)
+    for values, color, stroke in series:
+        points = " ".join(f"{frame.x(i):.1f},{frame.y(v):.1f}" for i, v in enumerate(values) if v is not None)
+        parts.append(f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="{stroke}"/>\n')
+    return _svg(title, parts)
+
+def _usd(value):
+    return f"${value:,.2f}" if value >= 1 or value == 0 else f"${value:.3f}"
+
+# ==============================================================================
+# 3. PENULIS FILE INKREMENTAL
+# ==============================================================================
+
+class SiteWriter:
+    """Tulis file di bawah root Hugo hanya jika isinya berubah"""
+
+    def __init__(self, root, force=False):
+        self.root = root
+        self.force = force
+        self.written = []
+        self.unchanged = 0
+
+    def path(self, *parts):
+        return os.path.join(self.root, *parts)
+
+    def write(self, rel_path, content):
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        path = self.path(rel_path)
+        if not self.force:
+            try:
+                with open(path, "rb") as f:
+                    if f.read() == data:
+                        self.unchanged += 1
+                        return False
+            except FileNotFoundError:
+                pass
+        atomic_write(path, data)
+        self.written.append(rel_path)
+        return True
+
+    def remove(self, rel_path):
+        try:
+            os.remove(self.path(rel_path))
+            self.written.append(rel_path)
+        except FileNotFoundError:
+            pass
+
+# ==============================================================================
+# 4. EKSPOR
+# ==============================================================================
+
+def month_files(month):
+    return (
+        os.path.join(Config.DATA_DIR, "daily", f"{month}.json"),
+        os.path.join(Config.STATIC_DIR, f"daily-{month}.svg"),
+    )
+
+def export_month(writer, store, month):
+    start = f"{month}-01"
+    end = f"{month}-31"
+    rows = store.days(start, end)
+    data_path, chart_path = month_files(month)
+    writer.write(data_path, dumps([
+        {"date": d, "impression": imp, "revenue": round(rev, 3), "cpm": cpm, "final": bool(final)}
+        for d, imp, rev, cpm, final in rows
+    ], indent=True))
+    writer.write(chart_path, bar_chart(
+        f"Revenue Harian {month}", [d[8:] for d, *_ in rows], [rev for _, _, rev, _, _ in rows],
+        Config.COLOR_REV, _usd, label_every=5
+    ))
+
+def export_overview(writer, store, months, today):
+    """Grafik ringkas, rekap bulanan & summary (dibangun dari data kecil)"""
+    chronological = sorted(months, key=lambda m: m["month"])
+    writer.write(os.path.join(Config.STATIC_DIR, "monthly.svg"), bar_chart(
+        "Revenue Bulanan", [m["month"][2:] for m in chronological], [m["revenue"] for m in chronological],
+        Config.COLOR_BAR, _usd, label_every=max(1, len(chronological) // 12)
+    ))
+
+    start = (today - timedelta(days=Config.DAILY_WINDOW_DAYS - 1)).isoformat()
+    daily = store.days(start, today.isoformat())
+    writer.write(os.path.join(Config.STATIC_DIR, "daily.svg"), bar_chart(
+        f"Revenue Harian ({Config.DAILY_WINDOW_DAYS} hari)", [d[5:] for d, *_ in daily],
+        [rev for _, _, rev, _, _ in daily], Config.COLOR_REV, _usd, label_every=15
+    ))
+
+    # CPM harian + rata-rata bergerak (hanya hari final)
+    start = (today - timedelta(days=Config.CPM_WINDOW_DAYS)).isoformat()
+    cpm_rows = [(d, cpm) for d, _, _, cpm, final in store.days(start, today.isoformat()) if final]
+    values = [cpm for _, cpm in cpm_rows]
+    window = Config.CPM_MA_DAYS
+    moving = [
+        sum(values[i - window + 1:i + 1]) / window if i >= window - 1 else None
+        for i in range(len(values))
+    ]
+    writer.write(os.path.join(Config.STATIC_DIR, "cpm.svg"), line_chart(
+        f"Tren CPM ({Config.CPM_WINDOW_DAYS} hari, garis merah = rata-rata {window} hari)",
+        [d[5:] for d, _ in cpm_rows],
+        [(values, Config.COLOR_CPM, 1), (moving, Config.COLOR_MA, 2)],
+        lambda v: f"${v:.2f}", label_every=30
+    ))
+
+    totals = store.totals()
+    recent = store.totals((today - timedelta(days=30)).isoformat(), (today - timedelta(days=1)).isoformat())
+    cache = HistoryCache()
+    records = load_records(cache)
+    try:
+        cache.save()
+    except OSError:
+        pass
+
+    summary = {
+        "as_of": totals["last"],
+        "first": totals["first"],
+        "total": {k: totals[k] for k in ("days", "impression", "revenue", "cpm")},
+        "last_30_days": {k: recent[k] for k in ("days", "impression", "revenue", "cpm")},
+        "records": highlights(records),
+    }
+    writer.write(os.path.join(Config.DATA_DIR, "summary.json"), dumps(summary, indent=True))
+    writer.write(os.path.join(Config.CONTENT_DIR, "_index.md"), render_index(summary, months, records))
+
+def render_index(summary, months, records):
+    """Halaman section dashboard (Markdown + gambar SVG, tanpa layout khusus)"""
+    base = "/" + Config.SECTION
+    total = summary["total"]
+    recent = summary["last_30_days"]
+    lines = [
+        "---",
+        'title: "Dashboard Adsterra"',
+        f"date: {summary['as_of']}T00:00:00+07:00",
+        "draft: false",
+        "build:",
+        "  list: never",
+        "sitemap:",
+        "  disable: true",
+        'robots: "noindex, nofollow"',
+        "---",
+        "",
+        f"Data {summary['first']} s/d {summary['as_of']} (dibuat otomatis oleh `dash`).",
+        "",
+        "| | Total | 30 Hari Terakhir |",
+        "|---|---:|---:|",
+        f"| Revenue | {_usd(total['revenue'])} | {_usd(recent['revenue'])} |",
+        f"| Impressions | {total['impression']:,} | {recent['impression']:,} |",
+        f"| CPM | ${total['cpm']:.3f} | ${recent['cpm']:.3f} |",
+        f"| Hari | {total['days']} | {recent['days']} |",
+        "",
+        f"![Revenue harian]({base}/daily.svg)",
+        "",
+        f"![Revenue bulanan]({base}/monthly.svg)",
+        "",
+        f"![Tren CPM]({base}/cpm.svg)",
+        "",
+        "## Rekor",
+        "",
+    ]
+    top = records.top_days()
+    if top:
+        lines.append(f"- Hari terbaik: {top[0][0]} ({_usd(top[0][1])})")
+    month = records.best_month()
+    if month:
+        lines.append(f"- Bulan terbaik: {month[1]} ({_usd(month[0])})")
+    half = records.best_half()
+    if half:
+        lines.append(f"- Periode terbaik: {half_label(half[1])} ({_usd(half[0])})")
+    streak = records.longest_streak()
+    if streak:
+        lines.append(f"- Streak terpanjang: {streak[2]} hari ({streak[0]} s/d {streak[1]})")
+    lines += ["", "## Bulanan", "", "| Bulan | Hari | Impressions | CPM | Revenue |", "|---|---:|---:|---:|---:|"]
+    for m in months:
+        lines.append(
+            f"| [{m['month']}]({base}/daily-{m['month']}.svg) | {m['days']} | "
+            f"{m['impression']:,} | ${m['cpm']:.3f} | {_usd(m['revenue'])} |"
+        )
+    return "\n".join(lines) + "\n"
+
+def export_dashboard(root, force=False, today=None):
+    today = today or gmt_today()
+    writer = SiteWriter(root, force)
+    index_path = os.path.join(Config.DATA_DIR, "months.json")
+
+    try:
+        previous = {m["month"]: m.get("signature") for m in load_file(writer.path(index_path))}
+    except (FileNotFoundError, ValueError, TypeError, KeyError):
+        previous = {}
+
+    store = StatsStore()
+    try:
+        signatures = store.month_signatures()
+        if not signatures:
+            return [], 0, writer
+        changed = [
+            month for month, sig in sorted(signatures.items())
+            if force or previous.get(month) != sig
+            or not all(os.path.exists(writer.path(p)) for p in month_files(month))
+        ]
+        for month in changed:
+            export_month(writer, store, month)
+        for month in sorted(set(previous) - set(signatures)):
+            for rel_path in month_files(month):
+                writer.remove(rel_path)
+
+        months = store.monthly()
+        if changed or set(previous) != set(signatures) or not os.path.exists(writer.path(index_path)):
+            writer.write(index_path, dumps([
+                dict(m, revenue=round(m["revenue"], 3), cpm=round(m["cpm"], 3), signature=signatures[m["month"]])
+                for m in months
+            ], indent=True))
+            export_overview(writer, store, months, today)
+    finally:
+        store.close()
+
+    return changed, len(signatures), writer
+
+# ==============================================================================
+# 5. MAIN
+# ==============================================================================
+
+if __name__ == "__main__":
+    init(autoreset=True)
+    parse_net_flags()
+
+    parser = argparse.ArgumentParser(description="Ekspor dashboard Adsterra untuk Hugo")
+    parser.add_argument("--publish", action="store_true",
+                        help="Tulis ke website Hugo (PUBLIK, hanya tidak terdaftar) alih-alih folder privat")
+    parser.add_argument("--site", default=".", help="Root direktori Hugo untuk --publish (default: folder saat ini)")
+    parser.add_argument("--fetch", action="store_true", help="Tarik dulu hari yang belum ada di SQLite lokal")
+    parser.add_argument("--force", action="store_true", help="Buat ulang semua file dashboard")
+    args = parser.parse_args()
+
+    if args.publish:
+        if not any(os.path.exists(os.path.join(args.site, name)) for name in ("hugo.toml", "hugo.yaml", "config.toml", "config.yaml", "content")):
+            print(f"{Fore.RED}[ERROR] {os.path.abspath(args.site)} bukan root website Hugo.")
+            print(f"{Fore.YELLOW}Jalankan di root direktori Hugo Anda, atau gunakan --site DIR.")
+            sys.exit(1)
+        root = args.site
+    else:
+        root = Config.PRIVATE_DIR
+
+    t0 = time.time()
+    today = gmt_today()
+
+    if args.fetch:
+        from adsterra_range import Config as RangeConfig, plan_fetches, fetch_missing
+        start = date.fromisoformat(RangeConfig.START_DATE_ALL_TIME)
+        store = StatsStore()
+        _, fetches = plan_fetches(start, today, today, store.covered_dates(start, today, today))
+        if fetches and not fetch_missing(store, fetches, today):
+            print(f"{Fore.YELLOW}[WARN] Sebagian data gagal ditarik, dashboard memakai data lokal yang ada.")
+        store.close()
+
+    changed, total_months, writer = export_dashboard(root, args.force, today)
+    if not total_months:
+        print(f"{Fore.YELLOW}[INFO] SQLite lokal masih kosong. Jalankan laporan (a/b/c/d/z) atau 'dash --fetch'.")
+        sys.exit(0)
+
+    print(f"{Fore.CYAN}[DASH] {len(changed)} dari {total_months} bulan diperbarui"
+          + (f" ({', '.join(changed[-3:])}{'...' if len(changed) > 3 else ''})" if changed else ""))
+    for rel_path in writer.written:
+        print(f"{Fore.GREEN}  ✔ {rel_path}")
+    print(f"{Fore.LIGHTBLACK_EX}[SYSTEM] {len(writer.written)} file ditulis, {writer.unchanged} tidak berubah, "
+          f"{time.time() - t0:.2f} detik.")
+    if not args.publish:
+        print(f"{Fore.CYAN}[DASH] Dashboard privat di {os.path.abspath(root)} (tidak ikut push).")
+    elif writer.written:
+        print(f"{Fore.YELLOW}[DASH] PUBLIK setelah di-push: siapa pun yang tahu URL /{Config.SECTION}/ bisa membukanya.")
+        print(f"{Style.BRIGHT}Jalankan 'push' untuk commit & publish dashboard.")
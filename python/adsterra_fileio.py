@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra File I/O (Locking & Atomic Write)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Satu jalur untuk semua penulisan data lokal (cache riwayat, state,
+    ekspor JSON, dashboard), agar collector cron dan laporan
+    manual (misal 'd') aman berjalan bersamaan, dan proses yang dibunuh
+    Android di tengah penulisan tidak merusak file.
+
+    - file_lock(path)        : lock eksklusif antar-PENULIS (flock pada
+                               `<file>.lock`), dengan batas waktu tunggu.
+    - atomic_write(path, b)  : tulis ke file sementara di folder yang sama,
+                               fsync, lalu os.replace. Pembaca selalu melihat
+                               versi lama atau versi baru yang utuh, jadi
+                               pembaca tidak perlu (dan tidak pernah) lock.
+    - Pemulihan crash        : file sementara yatim dari proses yang mati
+                               dibersihkan pada penulisan berikutnya.
+--------------------------------------------------------------------------------
+"""
+
+import os
+import time
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Bukan POSIX: lock dilewati, penulisan tetap atomic
+    fcntl = None
+
+class IOConfig:
+    # Batas menunggu penulis lain (detik)
+    LOCK_TIMEOUT = float(os.environ.get("ADSTERRA_LOCK_TIMEOUT", "15"))
+    LOCK_POLL = 0.05
+
+    # File sementara lebih tua dari ini dianggap sisa proses yang mati
+    STALE_TEMP_SEC = 600
+
+class LockTimeout(OSError):
+    """Penulis lain memegang lock lebih lama dari LOCK_TIMEOUT"""
+
+@contextmanager
+def file_lock(path, timeout=None):
+    """Lock eksklusif antar-penulis untuk `path` (reentrant tidak didukung)"""
+    if fcntl is None:
+        yield
+        return
+
+    timeout = IOConfig.LOCK_TIMEOUT if timeout is None else timeout
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd = os.open(path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise LockTimeout(f"Menunggu lock {path} lebih dari {timeout:.0f} detik")
+                time.sleep(IOConfig.LOCK_POLL)
+        yield
+    finally:
+        # Lock otomatis lepas saat fd ditutup (juga jika proses mati)
+        os.close(fd)
+
+def _temp_prefix(path):
+    return f".{os.path.basename(path)}."
+
+def cleanup_stale_temps(path):
+    """Hapus file sementara yatim milik `path` (sisa crash)"""
+    directory = os.path.dirname(path) or "."
+    prefix = _temp_prefix(path)
+    now = time.time()
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return
+    for name in names:
+        if name.startswith(prefix) and name.endswith(".tmp"):
+            full = os.path.join(directory, name)
+            try:
+                if now - os.stat(full).st_mtime > IOConfig.STALE_TEMP_SEC:
+                    os.unlink(full)
+            except FileNotFoundError:
+                pass
+
+def _fsync_dir(directory):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def atomic_write(path, data):
+    """Ganti isi `path` dengan `data` (bytes/str) secara atomic + fsync"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    cleanup_stale_temps(path)
+
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=_temp_prefix(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_dir(directory)
+
+def locked_atomic_write(path, data, timeout=None):
+    """atomic_write di bawah file_lock (untuk file yang ditulis banyak proses)"""
+    with file_lock(path, timeout):
+        atomic_write(path, data)
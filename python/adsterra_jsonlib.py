@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra JSON Backend (orjson / ujson / stdlib)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Decode respon API, load cache riwayat, dan encode file ekspor memakai
+    library JSON tercepat yang terpasang:
+        orjson  ->  ujson  ->  json (stdlib)
+    Tidak ada dependency wajib; tanpa orjson/ujson semuanya tetap jalan
+    memakai stdlib.
+
+    Backend bisa dipaksa dengan ADSTERRA_JSON=orjson|ujson|stdlib.
+
+    Output dumps(indent=True) sama persis dengan json.dump(..., indent=2)
+    stdlib untuk data laporan (ASCII, float biasa); cek dengan --bench
+    atau tests/test_jsonlib.py (ikut suite pytest).
+    Tanpa indent, output ringkas (tanpa spasi) dan hanya dipakai untuk
+    file cache internal.
+
+Penggunaan:
+    python3 adsterra_jsonlib.py --bench [--years 10]
+--------------------------------------------------------------------------------
+"""
+
+import os
+import sys
+import json
+import time
+
+class JsonConfig:
+    PREFERENCE = ("orjson", "ujson", "stdlib")
+    FORCED = os.environ.get("ADSTERRA_JSON", "").strip().lower()
+
+# ==============================================================================
+# BACKEND
+# ==============================================================================
+
+def _stdlib_backend():
+    def loads(data):
+        return json.loads(data)
+
+    def dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+    return loads, dumps
+
+def _orjson_backend():
+    import orjson
+
+    def dumps(obj, indent=False):
+        # OPT_NON_STR_KEYS: key int di state cache diubah jadi string seperti stdlib
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+
+    return orjson.loads, dumps
+
+def _ujson_backend():
+    import ujson
+
+    def loads(data):
+        return ujson.loads(data)
+
+    def dumps(obj, indent=False):
+        return ujson.dumps(obj, indent=2 if indent else 0, escape_forward_slashes=False).encode("utf-8")
+
+    return loads, dumps
+
+BACKENDS = {
+    "orjson": _orjson_backend,
+    "ujson": _ujson_backend,
+    "stdlib": _stdlib_backend,
+}
+
+def load_backend(name):
+    """(loads, dumps) untuk backend `name`; ImportError jika belum terpasang"""
+    return BACKENDS[name]()
+
+def available_backends():
+    names = []
+    for name in JsonConfig.PREFERENCE:
+        try:
+            load_backend(name)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+def _select():
+    order = JsonConfig.PREFERENCE
+    if JsonConfig.FORCED in BACKENDS:
+        order = (JsonConfig.FORCED,) + order
+    for name in order:
+        try:
+            return (name,) + load_backend(name)
+        except ImportError:
+            continue
+
+BACKEND, _loads, _dumps = _select()
+
+def loads(data):
+    """str/bytes JSON -> objek Python (ValueError jika tidak valid)"""
+    return _loads(data)
+
+def dumps(obj, indent=False):
+    """Objek Python -> bytes JSON (UTF-8); indent=True memakai indent 2 spasi"""
+    return _dumps(obj, indent)
+
+def response_json(resp):
+    """Pengganti resp.json() dari requests"""
+    return _loads(resp.content)
+
+def load_file(path):
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+# ==============================================================================
+# BENCHMARK & UJI KOMPATIBILITAS
+# ==============================================================================
+
+def synthetic_payload(days):
+    """Payload mirip respon stats.json group_by=date sepanjang `days` hari"""
+    import random
+    from datetime import date, timedelta
+
+    rnd = random.Random(42)
+    start = date(2026, 1, 1) - timedelta(days=days)
+    items = []
+    for i in range(days):
+        imp = rnd.randint(5000, 60000)
+        rev = round(rnd.uniform(0.5, 30.0), 3)
+        items.append({
+            "date": (start + timedelta(days=i)).isoformat(),
+            "impression": imp,
+            "clicks": rnd.randint(0, 200),
+            "ctr": round(rnd.uniform(0, 1), 2),
+            "cpm": round(rev / imp * 1000, 3),
+            "revenue": rev,
+        })
+    return json.dumps({"items": items, "dbDateTime": "2026-10-18 00:00:00"}).encode("utf-8")
+
+def _best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def bench(years=10, repeat=7):
+    from cek_semua_data_adsterra_json import process_smart_json
+
+    payload = synthetic_payload(365 * years)
+    print(f"Payload: {years} tahun, {len(payload) / 1024:.1f} KB")
+
+    # Struktur ekspor dibuat sekali dari decode stdlib (generated_at sama)
+    ref_items = json.loads(payload)["items"]
+    ref_export = process_smart_json(ref_items)
+    ref_bytes = json.dumps(ref_export, indent=2).encode("utf-8")
+
+    ok = True
+    print(f"\n{'BACKEND':<8} {'DECODE':>10} {'ENCODE':>10}  KOMPATIBEL")
+    for name in available_backends():
+        b_loads, b_dumps = load_backend(name)
+        t_dec = _best_of(lambda: b_loads(payload), repeat)
+        t_enc = _best_of(lambda: b_dumps(ref_export, True), repeat)
+
+        # Decode identik -> meta/daily_stats identik; encode ekspor harus sama byte-per-byte
+        same_decode = b_loads(payload)["items"] == ref_items
+        same_encode = b_dumps(ref_export, True) == ref_bytes
+        same_compact = json.loads(b_dumps(ref_export)) == ref_export
+        compatible = same_decode and same_encode and same_compact
+        ok = ok and compatible
+        print(f"{name:<8} {t_dec * 1000:>8.2f}ms {t_enc * 1000:>8.2f}ms  {'ya' if compatible else 'TIDAK'}")
+
+    print(f"\nBackend aktif: {BACKEND}")
+    return ok
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark backend JSON Adsterra")
+    parser.add_argument("--bench", action="store_true", help="Bandingkan kecepatan & kompatibilitas backend")
+    parser.add_argument("--years", type=int, default=10, help="Panjang payload sintetis (tahun)")
+    args = parser.parse_args()
+
+    if args.bench:
+        sys.exit(0 if bench(args.years) else 1)
+    print(f"Backend aktif: {BACKEND} (terpasang: {', '.join(available_backends())})")
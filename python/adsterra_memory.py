@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra Memory Budget (tracemalloc)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Mengukur puncak memori (alokasi Python, lewat tracemalloc) pada mode
+    all-time (d) dan ekspor JSON, dua perintah yang memegang seluruh riwayat
+    sekaligus di memori HP.
+
+    [--memory]  (atau ADSTERRA_MEMORY=1)
+    - Pada d dan ekspor JSON: tampilkan puncak memori di akhir perintah,
+      dinormalisasi per 1.000 hari riwayat, dibanding batas (BUDGET).
+
+    [--check]
+    - Uji regresi: jalankan jalur all-time & ekspor pada riwayat sintetis
+      (default 1.000 dan 3.650 hari, cache kosong, output dibuang), lalu
+      exit 1 jika puncak melewati BASE_KB + batas per 1.000 hari. Jalankan setelah
+      mengubah d, ekspor JSON, atau modul yang dipakainya. check() yang sama
+      juga dijalankan tests/test_memory.py bersama suite pytest.
+
+    Batas dipasang dari hasil ukur + ruang ~25%; puncak all-time didominasi
+    tabulate yang menyusun seluruh tabel harian sekaligus.
+
+Penggunaan:
+    python3 adsterra_memory.py --check [--days 1000 3650]
+    d --memory
+--------------------------------------------------------------------------------
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import tracemalloc
+
+class MemConfig:
+    ENABLED = os.environ.get("ADSTERRA_MEMORY") == "1"
+
+    # Batas puncak alokasi (KB) per 1.000 hari riwayat, plus ruang tetap
+    # untuk overhead yang tidak bergantung panjang riwayat (respon HTTP, SQLite)
+    BUDGET_KB_PER_1000_DAYS = {
+        "alltime": 2900,
+        "export": 1300,
+    }
+    BASE_KB = 512
+
+    CHECK_DAYS = (1000, 3650)
+
+LABELS = {"alltime": "All-time (d)", "export": "Ekspor JSON"}
+
+def parse_mem_flag(argv=None):
+    """Ambil --memory dari argv lalu mulai tracemalloc (panggil di awal __main__)"""
+    argv = sys.argv if argv is None else argv
+    while "--memory" in argv:
+        argv.remove("--memory")
+        MemConfig.ENABLED = True
+    if MemConfig.ENABLED and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def per_1000_days(peak, days):
+    return peak / 1024.0 / max(days, 1) * 1000
+
+def budget_kb(path, days):
+    """Batas puncak (KB) jalur `path` untuk riwayat `days` hari"""
+    return MemConfig.BASE_KB + MemConfig.BUDGET_KB_PER_1000_DAYS[path] * days / 1000.0
+
+def report_peak(path, days):
+    """Cetak puncak memori sejak parse_mem_flag (ke stderr); no-op jika tidak aktif"""
+    if not tracemalloc.is_tracing():
+        return
+    _, peak = tracemalloc.get_traced_memory()
+    limit = budget_kb(path, days)
+    status = "OK" if peak / 1024.0 <= limit else "MELEWATI BATAS"
+    sys.stderr.write(
+        f"[MEMORI] {LABELS[path]}: puncak {peak / 1048576:.1f} MB untuk {days} hari "
+        f"({per_1000_days(peak, days):,.0f} KB / 1.000 hari; batas {limit / 1024:.1f} MB) {status}\n"
+    )
+
+# ==============================================================================
+# UJI REGRESI (--check)
+# ==============================================================================
+
+def runners(output_dir):
+    """Jalur yang diukur. Modul di-import di sini, di luar pengukuran"""
+    from cek_semua_data_adsterra import display_clean_report
+    import cek_semua_data_adsterra_json as exporter
+    exporter.Config.OUTPUT_DIR = output_dir
+
+    def run_alltime(payload, loads):
+        display_clean_report({"items": loads(payload)["items"]})
+
+    def run_export(payload, loads):
+        raw = loads(payload)["items"]
+        exporter.save_file(exporter.process_smart_json(raw, exporter.update_records(raw)))
+
+    return {"alltime": run_alltime, "export": run_export}
+
+def measure(run, payload, cache_dir):
+    """Puncak alokasi (byte) satu jalur, dari decode sampai output, dengan cache kosong"""
+    from adsterra_jsonlib import loads
+
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.makedirs(cache_dir)
+
+    stdout = sys.stdout
+    with open(os.devnull, "w", encoding="utf-8") as sink:
+        sys.stdout = sink
+        tracemalloc.start()
+        try:
+            run(payload, loads)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            sys.stdout = stdout
+    return peak
+
+def check(days_list=MemConfig.CHECK_DAYS, quiet=False):
+    """
+    Ukur semua jalur untuk setiap panjang riwayat. Mengembalikan (lolos,
+    [(jalur, hari, puncak_byte, batas_kb), ...]).
+
+    Isi cache (ADSTERRA_CACHE_DIR) DIHAPUS sebelum setiap pengukuran, jadi
+    env itu harus menunjuk folder sementara sebelum modul laporan di-import.
+    """
+    from adsterra_cache import CACHE_DIR
+    from adsterra_jsonlib import synthetic_payload
+
+    if CACHE_DIR != os.environ.get("ADSTERRA_CACHE_DIR"):
+        raise RuntimeError("ADSTERRA_CACHE_DIR harus folder sementara (isinya dihapus saat --check)")
+
+    work = tempfile.mkdtemp(prefix="adsterra_mem_")
+    results = []
+    if not quiet:
+        print(f"{'JALUR':<14} {'HARI':>6} {'PUNCAK':>9} {'BATAS':>9} {'KB/1000 HARI':>13}  STATUS")
+    try:
+        paths = runners(os.path.join(work, "output_json"))
+        for days in days_list:
+            payload = synthetic_payload(days)
+            for path, run in paths.items():
+                peak = measure(run, payload, CACHE_DIR)
+                limit = budget_kb(path, days)
+                results.append((path, days, peak, limit))
+                if not quiet:
+                    print(f"{LABELS[path]:<14} {days:>6} {peak / 1048576:>7.1f}MB {limit / 1024:>7.1f}MB "
+                          f"{per_1000_days(peak, days):>13,.0f}  {'OK' if peak / 1024.0 <= limit else 'GAGAL'}")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    return all(peak / 1024.0 <= limit for _, _, peak, limit in results), results
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Uji batas memori mode all-time & ekspor JSON")
+    parser.add_argument("--check", action="store_true", help="Jalankan uji regresi memori")
+    parser.add_argument("--days", type=int, nargs="+", default=list(MemConfig.CHECK_DAYS),
+                        help="Panjang riwayat sintetis (hari)")
+    args = parser.parse_args()
+
+    if not args.check:
+        parser.print_help()
+        sys.exit(0)
+
+    # Cache sementara; harus sebelum modul laporan di-import (CACHE_DIR dibaca saat import)
+    cache_dir = tempfile.mkdtemp(prefix="adsterra_mem_cache_")
+    os.environ["ADSTERRA_CACHE_DIR"] = cache_dir
+    try:
+        ok, _ = check(args.days)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra Metadata Cache (Situs & Placement)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Nama situs dan placement untuk memberi label breakdown group_by=domain /
+    placement, diambil dari domains.json dan domain/{id}/placements.json.
+
+    [CACHE]
+    - Disimpan di ~/.cache/adsterra/meta.json dengan TTL panjang (7 hari),
+      karena daftar situs & placement jarang berubah.
+    - Jika breakdown memuat ID yang tidak ada di cache, cache ditandai basi
+      dan disegarkan pada run berikutnya. Run yang sedang berjalan tetap
+      memakai nama dari item API / "#ID", jadi tidak ada round-trip tambahan.
+      ID yang tetap tidak ada setelah disegarkan (misal situs dihapus) tidak
+      memicu penyegaran ulang sampai TTL habis.
+
+    [FETCH PARALEL]
+    - refresh_async() memulai thread latar yang menarik domains.json lalu
+      placements.json tiap situs secara paralel, bersamaan dengan request
+      stats.json. Jika cache masih segar, tidak ada request metadata sama sekali.
+
+Penggunaan:
+    python3 adsterra_meta.py                      (breakdown per situs, 30 hari)
+    python3 adsterra_meta.py --by placement last 7d
+    python3 adsterra_meta.py prev month --format csv
+    python3 adsterra_meta.py --refresh            (paksa tarik ulang daftar)
+
+Dependencies:
+    - requests, tabulate, colorama
+--------------------------------------------------------------------------------
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from adsterra_api import AdsterraClient, ApiConfig
+from adsterra_cache import CACHE_DIR, gmt_today
+from adsterra_jsonlib import dumps, load_file
+from adsterra_fileio import locked_atomic_write
+
+# ==============================================================================
+# 1. KONFIGURASI
+# ==============================================================================
+
+class MetaConfig:
+    CACHE_FILE = os.path.join(CACHE_DIR, "meta.json")
+    TTL = 7 * 24 * 3600
+
+    # placements.json ditarik per situs; sebanyak ini sekaligus
+    MAX_WORKERS = 4
+
+    KINDS = ("domain", "placement")
+    DEFAULT_RANGE = "last 30d"
+
+def _empty():
+    return {
+        "fetched": 0,
+        "names": {kind: {} for kind in MetaConfig.KINDS},
+        "unknown": {kind: [] for kind in MetaConfig.KINDS},
+        "missing": {kind: [] for kind in MetaConfig.KINDS},
+    }
+
+# ==============================================================================
+# 2. METADATA CACHE
+# ==============================================================================
+
+class MetadataCache:
+    """
+    names   : {kind: {id: nama}}
+    unknown : ID yang muncul di breakdown tapi belum ada di names (memicu penyegaran)
+    missing : ID yang tetap tidak ada setelah penyegaran terakhir
+    """
+
+    def __init__(self, path=MetaConfig.CACHE_FILE, api_key=ApiConfig.API_KEY):
+        self.path = path
+        self.api_key = api_key
+        self.data = _empty()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._dirty = False
+        try:
+            loaded = load_file(path)
+            if isinstance(loaded, dict) and isinstance(loaded.get("names"), dict):
+                self.data.update(loaded)
+        except (OSError, ValueError):
+            pass
+
+    def fresh(self, now=None):
+        now = time.time() if now is None else now
+        if now - self.data["fetched"] > MetaConfig.TTL:
+            return False
+        return not any(self.data["unknown"][kind] for kind in MetaConfig.KINDS)
+
+    def refresh_async(self, force=False):
+        """Mulai penyegaran di thread latar jika cache basi; True jika dimulai"""
+        if (self.fresh() and not force) or self._thread is not None:
+            return False
+        self._thread = threading.Thread(target=self._refresh, name="adsterra-meta", daemon=True)
+        self._thread.start()
+        return True
+
+    def wait(self, timeout=ApiConfig.TIMEOUT):
+        """Tunggu penyegaran (jika ada) lalu simpan; panggil setelah request stats selesai"""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if not self._thread.is_alive():
+                self._thread = None
+        self.save()
+
+    def _fetch_placements(self, domain_id):
+        # Satu client (session) per thread: requests.Session tidak thread-safe
+        return AdsterraClient(api_key=self.api_key, verbose=False).get_placements(domain_id)
+
+    def _refresh(self):
+        domains = AdsterraClient(api_key=self.api_key, verbose=False).get_domains()
+        if domains is None:
+            return
+        with ThreadPoolExecutor(max_workers=MetaConfig.MAX_WORKERS) as pool:
+            results = list(pool.map(self._fetch_placements, [d["id"] for d in domains]))
+
+        names = {
+            "domain": {str(d["id"]): d.get("title") or str(d["id"]) for d in domains},
+            "placement": {},
+        }
+        complete = True
+        for placements in results:
+            if placements is None:
+                complete = False
+                continue
+            for p in placements:
+                names["placement"][str(p["id"])] = p.get("title") or p.get("alias") or str(p["id"])
+
+        with self._lock:
+            if not complete:
+                # Sebagian gagal: pertahankan nama lama, coba lagi di run berikutnya
+                for key, name in self.data["names"]["placement"].items():
+                    names["placement"].setdefault(key, name)
+            self.data = {
+                "fetched": time.time() if complete else self.data["fetched"],
+                "names": names,
+                "unknown": {kind: [] for kind in MetaConfig.KINDS},
+                "missing": {
+                    kind: sorted(set(self.data["unknown"][kind] + self.data["missing"][kind]) - set(names[kind]))
+                    for kind in MetaConfig.KINDS
+                },
+            }
+            self._dirty = True
+
+    def name(self, kind, item_id, fallback=None):
+        """Nama untuk ID; ID baru ditandai agar cache disegarkan di run berikutnya"""
+        key = str(item_id)
+        with self._lock:
+            name = self.data["names"][kind].get(key)
+            if name is None and key not in self.data["missing"][kind] and key not in self.data["unknown"][kind]:
+                self.data["unknown"][kind].append(key)
+                self._dirty = True
+        return name or fallback or f"#{key}"
+
+    def label(self, kind, item):
+        """(id, nama) untuk item breakdown group_by=kind"""
+        value = item.get(f"{kind}_id", item.get(kind))
+        text = item.get(kind)
+        fallback = text if isinstance(text, str) and not text.isdigit() else None
+        return value, self.name(kind, value, fallback)
+
+    def save(self):
+        if not self._dirty:
+            return
+        with self._lock:
+            payload = dumps(self.data)
+            self._dirty = False
+        try:
+            locked_atomic_write(self.path, payload)
+        except OSError:
+            pass
+
+def fetch_breakdown(client, meta, start_str, end_str, kind):
+    """Tarik stats group_by=kind; metadata (jika basi) ditarik paralel di latar"""
+    meta.refresh_async()
+    data = client.get_stats(start_str, end_str, group_by=kind)
+    meta.wait()
+    return None if data is None else data.get("items", [])
+
+def breakdown_rows(items, meta, kind):
+    """Baris per situs/placement (revenue terbesar dulu) dengan nama dari cache"""
+    total = sum(float(i.get("revenue", 0.0)) for i in items) or 1.0
+    rows = []
+    for item in items:
+        item_id, name = meta.label(kind, item)
+        imp = int(item.get("impression", 0))
+        rev = float(item.get("revenue", 0.0))
+        rows.append({
+            "id": item_id,
+            "name": name,
+            "impression": imp,
+            "clicks": int(item.get("clicks", 0)),
+            "cpm": (rev / imp * 1000) if imp else 0.0,
+            "revenue": rev,
+            "share": rev / total * 100,
+        })
+    rows.sort(key=lambda r: r["revenue"], reverse=True)
+    return rows
+
+# ==============================================================================
+# 3. LAPORAN BREAKDOWN
+# ==============================================================================
+
+def show_breakdown(rows, kind, start, end):
+    from tabulate import tabulate
+    from colorama import Fore, Style
+    from adsterra_range import format_usd, format_num
+
+    title = "SITUS" if kind == "domain" else "PLACEMENT"
+    print(f"\n{Fore.CYAN}=== BREAKDOWN PER {title}: {start} s/d {end} ==={Style.RESET_ALL}")
+    table = [
+        [r["name"], r["id"], format_num(r["impression"]), format_usd(r["cpm"]),
+         f"{Fore.GREEN}{format_usd(r['revenue'])}{Style.RESET_ALL}", f"{r['share']:.1f}%"]
+        for r in rows
+    ]
+    print(tabulate(table, headers=[title, "ID", "IMPRESSIONS", "CPM", "REVENUE", "PORSI"],
+                   tablefmt="simple_grid", stralign="right"))
+    print(f"{Fore.WHITE}TOTAL: {Fore.GREEN}{Style.BRIGHT}{format_usd(sum(r['revenue'] for r in rows))}{Style.RESET_ALL}")
+
+if __name__ == "__main__":
+    from colorama import init, Fore
+    from adsterra_net import parse_net_flags
+    from adsterra_output import parse_format_flag, stream_rows
+    from adsterra_range import parse_range
+
+    init(autoreset=True)
+    parse_net_flags()
+    # --format json|jsonl|csv|tsv (lihat adsterra_output.py)
+    fmt = parse_format_flag()
+
+    parser = argparse.ArgumentParser(description="Breakdown Adsterra per situs / placement dengan nama")
+    parser.add_argument("expr", nargs="*", help=f"Ekspresi rentang (default: {MetaConfig.DEFAULT_RANGE})")
+    parser.add_argument("--by", choices=MetaConfig.KINDS, default="domain", help="Dimensi breakdown")
+    parser.add_argument("--refresh", action="store_true", help="Tarik ulang daftar situs & placement")
+    args = parser.parse_args()
+
+    try:
+        start, end = parse_range(" ".join(args.expr) or MetaConfig.DEFAULT_RANGE, gmt_today())
+    except ValueError as e:
+        print(f"{Fore.RED}[ERROR] {e}")
+        sys.exit(1)
+
+    meta = MetadataCache()
+    if args.refresh:
+        meta.refresh_async(force=True)
+    t0 = time.time()
+    items = fetch_breakdown(AdsterraClient(), meta, start.isoformat(), end.isoformat(), args.by)
+    if items is None:
+        sys.exit(1)
+
+    rows = breakdown_rows(items, meta, args.by)
+    meta.save()
+    if fmt:
+        stream_rows(rows, ("id", "name", "impression", "clicks", "cpm", "revenue", "share"))
+    else:
+        show_breakdown(rows, args.by, start, end)
+        print(f"{Fore.LIGHTBLACK_EX}[SYSTEM] Selesai dalam {time.time() - t0:.2f} detik.")
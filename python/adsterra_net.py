@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra Network (Bandwidth Accounting & Low-Data Mode)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Session HTTP bersama untuk semua client Adsterra, ditujukan untuk Termux
+    di koneksi data seluler (kuota terbatas).
+
+    [--profile]  (atau ADSTERRA_PROFILE=1)
+    - Mencatat ukuran request, header respon, body di kabel (terkompresi),
+      dan body setelah di-decode per panggilan, lalu menampilkan total dan
+      rasio kompresi saat perintah selesai.
+
+    [--low-data]  (atau ADSTERRA_LOW_DATA=1)
+    - Meminta respon terkompresi (gzip/deflate, plus br jika brotli ada).
+    - Hari final yang sudah ada di SQLite lokal tidak diminta ulang, kecuali
+      yang jatuh tempo revalidasi (REVALIDATE_SCHEDULE di adsterra_store).
+      Request statistik dipersempit menjadi sub-rentang yang hilang / jatuh
+      tempo / belum final (planner adsterra_range), lalu respon digabung
+      dengan data lokal sehingga script laporan menerima data rentang penuh
+      seperti biasa.
+--------------------------------------------------------------------------------
+"""
+
+import os
+import sys
+import atexit
+import importlib.util
+from datetime import date, timedelta
+
+import requests
+from colorama import Fore, Style
+
+from adsterra_jsonlib import response_json, dumps
+
+class NetConfig:
+    PROFILE = os.environ.get("ADSTERRA_PROFILE") == "1"
+    LOW_DATA = os.environ.get("ADSTERRA_LOW_DATA") == "1"
+
+def _has_brotli():
+    # urllib3 hanya men-decode "br" jika modul brotli terpasang
+    return importlib.util.find_spec("brotli") is not None
+
+# ==============================================================================
+# PENCATAT BANDWIDTH
+# ==============================================================================
+
+def _header_bytes(first_line, headers):
+    return len(first_line) + 2 + sum(len(k) + len(str(v)) + 4 for k, v in headers.items()) + 2
+
+class BandwidthMeter:
+    """Mengumpulkan respon lewat hook requests; ukuran dihitung saat laporan"""
+
+    def __init__(self):
+        self.responses = []
+        self.local_days = 0
+        self.skipped_requests = 0
+
+    def hook(self, resp, *args, **kwargs):
+        self.responses.append(resp)
+        return resp
+
+    def transfers(self):
+        """List dict per respon: url, sent, header, wire, body, encoding"""
+        rows = []
+        for resp in self.responses:
+            req = resp.request
+            body = req.body or b""
+            sent = _header_bytes(f"{req.method} {req.path_url} HTTP/1.1", req.headers) + len(body)
+
+            # Pastikan body sudah dibaca; raw.tell() = byte dari socket (sebelum decode)
+            decoded = len(resp.content or b"")
+            try:
+                wire = resp.raw.tell()
+            except (AttributeError, ValueError):
+                wire = decoded
+            rows.append({
+                "url": req.path_url.split("?")[0],
+                "sent": sent,
+                "header": _header_bytes(f"HTTP/1.1 {resp.status_code} {resp.reason}", resp.headers),
+                "wire": wire,
+                "body": getattr(resp, "_decoded_size", decoded),
+                "encoding": resp.headers.get("Content-Encoding", "identity"),
+            })
+        return rows
+
+    def totals(self):
+        rows = self.transfers()
+        return {
+            "requests": len(rows),
+            "sent": sum(r["sent"] for r in rows),
+            "received": sum(r["header"] + r["wire"] for r in rows),
+            "wire": sum(r["wire"] for r in rows),
+            "body": sum(r["body"] for r in rows),
+        }
+
+    def report(self):
+        rows = self.transfers()
+        t = self.totals()
+        print(f"\n{Fore.CYAN}{Style.BRIGHT}=== PROFIL BANDWIDTH ==={Style.RESET_ALL}")
+        for r in rows:
+            ratio = r["body"] / r["wire"] if r["wire"] else 0
+            print(f"{Fore.LIGHTBLACK_EX}  {r['url']}: kirim {fmt_bytes(r['sent'])}, terima "
+                  f"{fmt_bytes(r['header'] + r['wire'])} ({r['encoding']}, body {fmt_bytes(r['body'])}, x{ratio:.1f})")
+        ratio = t["body"] / t["wire"] if t["wire"] else 0
+        print(f"  Request          : {t['requests']}" + (f" (+{self.skipped_requests} dilayani lokal)" if self.skipped_requests else ""))
+        print(f"  Upload           : {fmt_bytes(t['sent'])}")
+        print(f"  Download (kabel) : {Fore.YELLOW}{fmt_bytes(t['received'])}{Style.RESET_ALL}")
+        print(f"  Body di-decode   : {fmt_bytes(t['body'])} (rasio kompresi x{ratio:.1f})")
+        if self.local_days:
+            print(f"  Hari dari lokal  : {self.local_days} hari (mode hemat data)")
+
+def fmt_bytes(n):
+    for unit in ("B", "KB", "MB"):
+        if n < 1024 or unit == "MB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024.0
+
+METER = BandwidthMeter()
+
+def parse_net_flags(argv=None):
+    """
+    Ambil --profile dan --low-data dari argv (dihapus agar argparse/skrip
+    lain tidak terganggu). Dipanggil di awal blok __main__ setiap perintah.
+    """
+    argv = sys.argv if argv is None else argv
+    for flag, attr in (("--profile", "PROFILE"), ("--low-data", "LOW_DATA")):
+        while flag in argv:
+            argv.remove(flag)
+            setattr(NetConfig, attr, True)
+    if NetConfig.PROFILE:
+        atexit.register(METER.report)
+
+# ==============================================================================
+# SESSION
+# ==============================================================================
+
+class AdsterraSession(requests.Session):
+    """requests.Session + pencatat bandwidth + mode hemat data"""
+
+    def __init__(self):
+        super().__init__()
+        self.hooks["response"].append(METER.hook)
+        if NetConfig.LOW_DATA:
+            self.headers["Accept-Encoding"] = "br, gzip, deflate" if _has_brotli() else "gzip, deflate"
+
+    def get(self, url, params=None, **kwargs):
+        if NetConfig.LOW_DATA and params and params.get("group_by") == "date" and "start_date" in params:
+            return self._get_low_data(url, params, **kwargs)
+        return super().get(url, params=params, **kwargs)
+
+    def _get_low_data(self, url, params, **kwargs):
+        from adsterra_cache import gmt_today
+        from adsterra_store import StatsStore, print_revisions
+        from adsterra_range import plan_fetches
+
+        start = date.fromisoformat(params["start_date"])
+        finish = date.fromisoformat(params["finish_date"])
+        today = gmt_today()
+        yesterday = today - timedelta(days=1)
+
+        store = StatsStore()
+        try:
+            # Hari final lokal yang tidak jatuh tempo revalidasi dilayani lokal;
+            # sisanya (hari hilang, jadwal revalidasi, hari ini) ditarik per sub-rentang
+            covered = store.covered_dates(start, min(finish, yesterday), today)
+            local_days, fetches = plan_fetches(start, finish, today, covered)
+
+            resp = None
+            items = []
+            fetched = set()
+            for a, b in fetches:
+                resp = super().get(url, params=dict(params, start_date=a.isoformat(), finish_date=b.isoformat()),
+                                   **kwargs)
+                if resp.status_code != 200:
+                    return resp
+                try:
+                    data = response_json(resp)
+                except ValueError:
+                    return resp
+                if data.get("errors"):
+                    return resp
+                part = data.get("items", [])
+                coverage = [(a.isoformat(), min(b, yesterday).isoformat())] if a <= yesterday else []
+                print_revisions(store.upsert_items(part, today=today, coverage=coverage))
+                items.extend(part)
+                day = a
+                while day <= b:
+                    fetched.add(day.isoformat())
+                    day += timedelta(days=1)
+
+            if resp is None:
+                resp = self._local_response(url)
+                METER.skipped_requests += 1
+            else:
+                resp._decoded_size = len(resp.content)
+
+            local = [
+                {"date": d, "impression": imp, "revenue": rev, "cpm": cpm}
+                for d, imp, rev, cpm, final in store.days(start.isoformat(), finish.isoformat())
+                if final and d not in fetched
+            ]
+        finally:
+            store.close()
+
+        METER.local_days += local_days
+        resp._content = dumps({"items": sorted(local + items, key=lambda i: i.get("date", ""))})
+        return resp
+
+    @staticmethod
+    def _local_response(url):
+        """Respon 200 tanpa jaringan (seluruh rentang tersedia lokal)"""
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.reason = "OK (lokal)"
+        resp.url = url
+        resp.encoding = "utf-8"
+        resp._content = b""
+        return resp
+
+def make_session():
+    return AdsterraSession()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra Machine-Readable Output (--format)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Mode output untuk pipe & scripting pada semua perintah laporan
+    (a, b, c, d, z, r, stats, ekspor JSON):
+
+        d --format csv | sort -t, -k6 -n
+        r last 30d --format jsonl | jq .revenue
+        stats months --format tsv > bulan.tsv
+
+    - json  : satu array JSON (ditulis bertahap, baris demi baris)
+    - jsonl : satu objek JSON per baris
+    - csv / tsv : baris header lalu data
+
+    Baris ditulis ke stdout begitu dihasilkan, tanpa colorama dan tabulate.
+    Semua print lain (banner, log koneksi, peringatan, profil bandwidth)
+    dialihkan ke stderr, jadi stdout hanya berisi data.
+--------------------------------------------------------------------------------
+"""
+
+import os
+import sys
+import csv
+
+from adsterra_jsonlib import dumps
+
+class OutputConfig:
+    FORMATS = ("json", "jsonl", "csv", "tsv")
+    FORMAT = None
+
+# Kolom baris harian dari item API (group_by=date)
+ITEM_FIELDS = ("date", "impression", "clicks", "ctr", "cpm", "revenue", "final")
+
+def parse_format_flag(argv=None):
+    """
+    Ambil --format X / --format=X dari argv (dihapus seperti parse_net_flags).
+    Jika ada, stdout dialihkan ke stderr dan format dikembalikan; None jika tidak.
+    """
+    argv = sys.argv if argv is None else argv
+    fmt = None
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--format" and i + 1 < len(argv):
+            fmt = argv[i + 1]
+            del argv[i:i + 2]
+        elif arg.startswith("--format="):
+            fmt = arg.split("=", 1)[1]
+            del argv[i]
+        else:
+            i += 1
+
+    if fmt is None:
+        return None
+    fmt = fmt.lower()
+    if fmt not in OutputConfig.FORMATS:
+        sys.stderr.write(f"[ERROR] --format harus salah satu dari: {', '.join(OutputConfig.FORMATS)}\n")
+        sys.exit(2)
+
+    OutputConfig.FORMAT = fmt
+    sys.stdout = sys.stderr
+    return fmt
+
+class RowWriter:
+    """Tulis baris (dict) ke stdout asli dalam format mesin"""
+
+    def __init__(self, fields, fmt=None, stream=None):
+        self.fields = list(fields)
+        self.fmt = fmt or OutputConfig.FORMAT
+        # sys.__stdout__: lewati pembungkus colorama & pengalihan ke stderr
+        self.stream = stream or sys.__stdout__
+        self.count = 0
+        self._csv = None
+        if self.fmt in ("csv", "tsv"):
+            self._csv = csv.writer(self.stream, delimiter="," if self.fmt == "csv" else "\t", lineterminator="\n")
+            self._csv.writerow(self.fields)
+        elif self.fmt == "json":
+            self.stream.write("[")
+
+    def write(self, row):
+        if self._csv is not None:
+            # bool -> 1/0 agar mudah difilter (awk, sort)
+            self._csv.writerow([int(v) if isinstance(v, bool) else v for v in (row.get(f, "") for f in self.fields)])
+        else:
+            text = dumps({f: row.get(f) for f in self.fields}).decode("utf-8")
+            if self.fmt == "json":
+                text = ("\n" if self.count == 0 else ",\n") + text
+            else:
+                text += "\n"
+            self.stream.write(text)
+        self.count += 1
+
+    def close(self):
+        if self.fmt == "json":
+            self.stream.write("\n]\n" if self.count else "]\n")
+        self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def stream_rows(rows, fields, fmt=None):
+    """Tulis semua baris dari iterable `rows`; mengembalikan jumlah baris"""
+    try:
+        with RowWriter(fields, fmt) as writer:
+            for row in rows:
+                writer.write(row)
+    except BrokenPipeError:
+        # Pembaca berhenti lebih awal (misal `| head`): keluar tanpa traceback
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.__stdout__.fileno())
+        sys.exit(1)
+    return writer.count
+
+def item_rows(items, today=None):
+    """Baris harian (ITEM_FIELDS) dari item API, urut tanggal"""
+    from adsterra_cache import gmt_today
+
+    today_str = (today or gmt_today()).isoformat()
+    for item in sorted((i for i in items if i.get("date")), key=lambda i: i["date"]):
+        yield {
+            "date": item["date"],
+            "impression": int(item.get("impression", 0)),
+            "clicks": int(item.get("clicks", 0)),
+            "ctr": float(item.get("ctr", 0.0)),
+            "cpm": float(item.get("cpm", 0.0)),
+            "revenue": float(item.get("revenue", 0.0)),
+            "final": item["date"] < today_str,
+        }
+
+def stream_items(items, today=None, fmt=None):
+    return stream_rows(item_rows(items, today), ITEM_FIELDS, fmt)
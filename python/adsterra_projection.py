@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra Revenue Projection
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Proyeksi total pendapatan akhir periode (1-15 / 16-akhir bulan) dan akhir
+    bulan berdasarkan:
+    - Laju (level) harian terkini      -> EWMA revenue yang sudah di-deseasonalize
+    - Profil hari dalam seminggu       -> faktor pengali per hari (Senin..Minggu)
+    - Progres intraday baris hari ini  -> porsi hari GMT yang sudah berjalan
+    - Rentang keyakinan                -> dari varians residual model (90%)
+
+    Model diperbarui secara inkremental: setiap run hanya memproses hari final
+    yang baru masuk cache (O(hari baru)), state disimpan di HistoryCache.
+    Jika ada hari lama yang direvisi atau di-backfill (HistoryCache.revision
+    berubah), model dibangun ulang sekali dari seluruh riwayat.
+--------------------------------------------------------------------------------
+"""
+
+import math
+from datetime import datetime, timedelta
+
+STATE_KEY = "projection"
+
+# Z-score untuk rentang keyakinan 90%
+Z_90 = 1.645
+
+class RevenueModel:
+    """Level EWMA + faktor hari-dalam-minggu + varians residual (semua O(1) per hari)"""
+
+    ALPHA_LEVEL = 0.2
+    ALPHA_DOW = 0.1
+    ALPHA_VAR = 0.1
+
+    def __init__(self, state=None):
+        state = state or {}
+        self.level = state.get("level")
+        self.dow = state.get("dow", [1.0] * 7)
+        self.var = state.get("var", 0.0)
+        self.n = state.get("n", 0)
+        self.last_date = state.get("last_date")
+        self.revision = state.get("revision", 0)
+
+    def to_state(self):
+        return {
+            "level": self.level,
+            "dow": self.dow,
+            "var": self.var,
+            "n": self.n,
+            "last_date": self.last_date,
+            "revision": self.revision,
+        }
+
+    def expected(self, day):
+        if self.level is None:
+            return None
+        return max(self.level * self.dow[day.weekday()], 0.0)
+
+    def sigma(self):
+        return math.sqrt(self.var)
+
+    def update(self, date_str, revenue):
+        day = datetime.strptime(date_str, "%Y-%m-%d").date()
+        wd = day.weekday()
+
+        if self.level is None:
+            self.level = revenue
+        else:
+            # Residual dihitung sebelum model "melihat" hari ini
+            err = revenue - self.expected(day)
+            self.var = err * err if self.n == 1 else (1 - self.ALPHA_VAR) * self.var + self.ALPHA_VAR * err * err
+
+            if self.level > 0:
+                ratio = revenue / self.level
+                self.dow[wd] = (1 - self.ALPHA_DOW) * self.dow[wd] + self.ALPHA_DOW * ratio
+
+            deseason = revenue / self.dow[wd] if self.dow[wd] > 0 else revenue
+            self.level = (1 - self.ALPHA_LEVEL) * self.level + self.ALPHA_LEVEL * deseason
+
+        self.n += 1
+        self.last_date = date_str
+
+def load_model(cache):
+    """
+    Ambil model dari cache lalu proses HANYA hari final yang belum pernah dilihat.
+    Dibangun ulang dari awal jika ada hari lama yang direvisi atau di-backfill.
+    """
+    model = RevenueModel(cache.state.get(STATE_KEY))
+    rebuilt = model.revision != cache.revision
+    if rebuilt:
+        model = RevenueModel()
+        model.revision = cache.revision
+
+    new_rows = cache.rows_after(model.last_date)
+    for date_str, row in new_rows:
+        model.update(date_str, row["revenue"])
+    if new_rows or rebuilt:
+        cache.set_state(STATE_KEY, model.to_state())
+    return model
+
+def day_fraction(now):
+    """Porsi hari (GMT) yang sudah berjalan, 0..1"""
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return min(max((now - midnight).total_seconds() / 86400.0, 0.0), 1.0)
+
+def project_total(model, finalized_sum, today_revenue, now, end_date, fallback_daily=0.0):
+    """
+    Proyeksi total dari hari final + hari ini + sisa hari hingga end_date.
+    Mengembalikan dict {total, low, high, today_estimate, remaining_days}.
+    """
+    today = now.date()
+    frac = day_fraction(now)
+    sigma = model.sigma() if model.n >= 2 else fallback_daily * 0.5
+
+    def expected(day):
+        value = model.expected(day)
+        return fallback_daily if value is None else value
+
+    # --- Hari ini: gabungkan laju intraday dan profil hari ---
+    e_today = expected(today)
+    if today_revenue is None:
+        today_total = e_today
+        variance = sigma ** 2
+    else:
+        # Estimasi satu hari penuh: bobot laju intraday naik seiring jam berjalan
+        full_day = today_revenue + (1 - frac) * e_today
+        today_total = today_revenue + (1 - frac) * full_day
+        variance = ((1 - frac) * sigma) ** 2
+
+    # --- Sisa hari setelah hari ini ---
+    remaining = 0.0
+    remaining_days = 0
+    day = today + timedelta(days=1)
+    while day <= end_date:
+        remaining += expected(day)
+        remaining_days += 1
+        day += timedelta(days=1)
+    variance += remaining_days * sigma ** 2
+
+    total = finalized_sum + today_total + remaining
+    band = Z_90 * math.sqrt(variance)
+    floor = finalized_sum + (today_revenue or 0.0)
+
+    return {
+        "total": total,
+        "low": max(total - band, floor),
+        "high": total + band,
+        "today_estimate": today_total,
+        "remaining_days": remaining_days,
+    }
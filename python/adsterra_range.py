@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Script: Adsterra Date Range Report (v1.0)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Satu perintah untuk rentang tanggal bebas, menggantikan rentang yang
+    di-hardcode per script (8 hari, 30 hari, 90 hari, all-time, half-month).
+
+    [EKSPRESI RENTANG]
+    - --from 2025-01-01 --to 2025-06-30
+    - last 14d / last 2w         (termasuk hari ini)
+    - today / yesterday
+    - this half / prev half      (periode 1-15 atau 16-akhir bulan)
+    - this month / prev month
+    - 2025-03                    (satu bulan penuh)
+    - all                        (sejak 2022-10-01)
+
+    [PLANNER CACHE vs API]
+    - Hari final yang sudah ada di SQLite lokal (atau rentang yang pernah
+      ditarik utuh) dilayani lokal, kecuali yang jatuh tempo revalidasi
+      (lihat REVALIDATE_SCHEDULE di adsterra_store).
+    - Sisa hari dikelompokkan menjadi sub-rentang berurutan; celah lokal yang
+      pendek (<= MERGE_GAP_DAYS) ikut ditarik agar jumlah panggilan API minimal.
+    - Hari ini (belum final) selalu ditarik ulang.
+
+Penggunaan:
+    python3 adsterra_range.py last 14d
+    python3 adsterra_range.py --from 2025-01-01 --to 2025-06-30
+    python3 adsterra_range.py prev month --plan   (tampilkan rencana saja)
+    python3 adsterra_range.py last 90d --format csv  (baris harian ke stdout)
+
+Dependencies:
+    - requests, tabulate, colorama
+--------------------------------------------------------------------------------
+"""
+
+import re
+import sys
+import time
+import calendar
+import argparse
+from datetime import datetime, timedelta
+
+try:
+    from tabulate import tabulate
+    from colorama import init, Fore, Style, Back
+    init(autoreset=True)
+except ImportError as e:
+    print("Error: Library pendukung tidak ditemukan.")
+    print(f"Detail: {e}")
+    print("Solusi: Jalankan perintah 'pip install tabulate colorama requests'")
+    sys.exit(1)
+
+# Modul pendamping (satu folder dengan script ini)
+from adsterra_api import AdsterraClient
+from adsterra_cache import HistoryCache, gmt_today
+from adsterra_store import StatsStore, print_revisions
+from adsterra_net import parse_net_flags
+from adsterra_spark import print_trends
+from adsterra_output import parse_format_flag, stream_rows
+
+# ==============================================================================
+# 1. KONFIGURASI
+# ==============================================================================
+
+class Config:
+    START_DATE_ALL_TIME = "2022-10-01"
+
+    # Celah hari lokal sependek ini di antara dua rentang yang hilang ikut
+    # ditarik, karena satu panggilan API lebih mahal dari beberapa baris ekstra
+    MERGE_GAP_DAYS = 3
+
+    # Rentang lebih panjang dari ini ikut menampilkan rekap bulanan
+    MONTHLY_VIEW_DAYS = 31
+
+# ==============================================================================
+# 2. PARSER EKSPRESI RENTANG
+# ==============================================================================
+
+def _parse_date(text):
+    try:
+        return datetime.strptime(text, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"Format tanggal tidak valid: '{text}' (gunakan YYYY-MM-DD)")
+
+def half_bounds(day):
+    """Periode half-month (1-15 / 16-akhir) yang memuat `day`"""
+    if day.day <= 15:
+        return day.replace(day=1), day.replace(day=15)
+    last = calendar.monthrange(day.year, day.month)[1]
+    return day.replace(day=16), day.replace(day=last)
+
+def month_bounds(day):
+    last = calendar.monthrange(day.year, day.month)[1]
+    return day.replace(day=1), day.replace(day=last)
+
+def parse_range(expr, today):
+    """Ekspresi rentang -> (start, end). end dibatasi maksimal hari ini."""
+    text = " ".join(expr.lower().split())
+
+    if text == "today":
+        start, end = today, today
+    elif text == "yesterday":
+        start = end = today - timedelta(days=1)
+    elif text == "all":
+        start, end = _parse_date(Config.START_DATE_ALL_TIME), today
+    elif text in ("this half", "prev half"):
+        start, end = half_bounds(today)
+        if text == "prev half":
+            start, end = half_bounds(start - timedelta(days=1))
+    elif text in ("this month", "prev month"):
+        start, end = month_bounds(today)
+        if text == "prev month":
+            start, end = month_bounds(start - timedelta(days=1))
+    else:
+        m = re.fullmatch(r"last (\d+) ?([dw])", text)
+        if m:
+            days = int(m.group(1)) * (7 if m.group(2) == "w" else 1)
+            if days < 1:
+                raise ValueError("Jumlah hari minimal 1")
+            start, end = today - timedelta(days=days - 1), today
+        elif re.fullmatch(r"\d{4}-\d{2}", text):
+            start, end = month_bounds(_parse_date(text + "-01"))
+        elif re.fullmatch(r"\d{4}-\d{2}-\d{2}", text):
+            start = end = _parse_date(text)
+        else:
+            raise ValueError(f"Ekspresi rentang tidak dikenal: '{expr}'")
+
+    return start, min(end, today)
+
+# ==============================================================================
+# 3. PLANNER (LOKAL vs API)
+# ==============================================================================
+
+def plan_fetches(start, end, today, covered, merge_gap=Config.MERGE_GAP_DAYS):
+    """
+    covered : set tanggal final yang bisa dilayani lokal (StatsStore.covered_dates)
+    Mengembalikan (jumlah_hari_lokal, [(start, end), ...] yang harus ditarik).
+    """
+    # Kelompokkan hari yang hilang menjadi rentang berurutan
+    runs = []
+    local_days = 0
+    day = start
+    while day <= end:
+        if day < today and day.isoformat() in covered:
+            local_days += 1
+        elif runs and (day - runs[-1][1]).days == 1:
+            runs[-1][1] = day
+        else:
+            runs.append([day, day])
+        day += timedelta(days=1)
+
+    # Gabungkan rentang yang hanya dipisah celah lokal pendek
+    merged = []
+    for run in runs:
+        if merged and (run[0] - merged[-1][1]).days - 1 <= merge_gap:
+            merged[-1][1] = run[1]
+        else:
+            merged.append(run)
+
+    return local_days, [(a, b) for a, b in merged]
+
+def fetch_missing(store, fetches, today):
+    """Tarik sub-rentang dari API lalu simpan ke store & cache riwayat"""
+    client = AdsterraClient()
+    cache = HistoryCache()
+    yesterday = today - timedelta(days=1)
+    ok = True
+
+    for start, end in fetches:
+        data = client.get_stats(start.isoformat(), end.isoformat())
+        if data is None:
+            ok = False
+            continue
+        items = data.get("items", [])
+        print_revisions(store.upsert_items(items, today=today))
+        cache.merge(items, today)
+        # Rentang final yang sudah ditarik utuh (termasuk hari tanpa data)
+        if start <= yesterday:
+            store.add_coverage(start.isoformat(), min(end, yesterday).isoformat())
+
+    try:
+        cache.save()
+    except OSError as e:
+        print(f"{Fore.LIGHTBLACK_EX}[CACHE] Gagal menyimpan cache: {e}")
+    return ok
+
+# ==============================================================================
+# 4. TAMPILAN
+# ==============================================================================
+
+def format_usd(val):
+    return f"${float(val):,.3f}"
+
+def format_num(val):
+    return f"{int(val):,}".replace(",", ".")
+
+def show_range(store, start, end):
+    rows = store.days(start.isoformat(), end.isoformat())
+    if not rows:
+        print(f"{Fore.YELLOW}[INFO] Tidak ada data pendapatan pada rentang ini.")
+        return
+
+    table = []
+    for date_str, imp, rev, cpm, final in rows:
+        rev_str = format_usd(rev)
+        if rev > 0:
+            rev_str = f"{Fore.GREEN}{rev_str}{Style.RESET_ALL}"
+        else:
+            rev_str = f"{Fore.LIGHTBLACK_EX}{rev_str}{Style.RESET_ALL}"
+        cpm_str = format_usd(cpm)
+        if cpm > 0.5:
+            cpm_str = f"{Fore.YELLOW}{cpm_str}{Style.RESET_ALL}"
+        label = date_str if final else f"{Fore.CYAN}{date_str} (live){Style.RESET_ALL}"
+        table.append([label, format_num(imp), cpm_str, rev_str])
+
+    headers = ["TANGGAL", "IMPRESSIONS", "CPM", "REVENUE"]
+    print(tabulate(table, headers=headers, tablefmt="simple_grid", stralign="right"))
+    print_trends([
+        {"date": date_str, "impression": imp, "revenue": rev, "cpm": cpm}
+        for date_str, imp, rev, cpm, _ in rows
+    ])
+
+    if (end - start).days + 1 > Config.MONTHLY_VIEW_DAYS:
+        monthly = [
+            [m["month"], m["days"], format_num(m["impression"]), format_usd(m["cpm"]),
+             format_usd(m["revenue"] / m["days"]), f"{Fore.GREEN}{format_usd(m['revenue'])}{Style.RESET_ALL}"]
+            for m in store.monthly(start.isoformat(), end.isoformat())
+        ]
+        headers_monthly = ["BULAN", "HARI", "TOT IMPRESS", "AVG CPM", "RATA2 / HARI", "TOT REVENUE"]
+        print(f"\n{Fore.CYAN}=== REKAP BULANAN ==={Style.RESET_ALL}")
+        print(tabulate(monthly, headers=headers_monthly, tablefmt="simple_grid", stralign="right", disable_numparse=True))
+
+    t = store.totals(start.isoformat(), end.isoformat())
+    print("\n" + "=" * 40)
+    print(f"{Back.BLUE}{Fore.WHITE}  RINGKASAN RENTANG  {Style.RESET_ALL}")
+    print("=" * 40)
+    summary = [
+        ["Rentang", f"{start.isoformat()} s/d {end.isoformat()}"],
+        ["Hari Berdata", f"{t['days']} Hari"],
+        ["Total Impressions", format_num(t["impression"])],
+        ["Rata-rata CPM", format_usd(t["cpm"])],
+        ["Rata-rata Revenue/Hari", format_usd(t["revenue"] / t["days"] if t["days"] else 0)],
+        ["TOTAL PENDAPATAN", f"{Fore.GREEN}{Style.BRIGHT}{format_usd(t['revenue'])}{Style.RESET_ALL}"],
+    ]
+    print(tabulate(summary, tablefmt="plain"))
+    print("=" * 40 + "\n")
+
+# ==============================================================================
+# 5. MAIN
+# ==============================================================================
+
+if __name__ == "__main__":
+    parse_net_flags()
+    # --format json|jsonl|csv|tsv (lihat adsterra_output.py)
+    fmt = parse_format_flag()
+
+    parser = argparse.ArgumentParser(description="Laporan Adsterra untuk rentang tanggal bebas")
+    parser.add_argument("expr", nargs="*", help="Ekspresi rentang, misal: last 14d, this half, prev month")
+    parser.add_argument("--from", dest="start", help="Tanggal awal (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", help="Tanggal akhir (YYYY-MM-DD)")
+    parser.add_argument("--plan", action="store_true", help="Tampilkan rencana tanpa menarik data")
+    parser.add_argument("--offline", action="store_true", help="Hanya pakai data lokal")
+    args = parser.parse_args()
+
+    today = gmt_today()
+    try:
+        if args.start or args.end:
+            start = _parse_date(args.start) if args.start else _parse_date(Config.START_DATE_ALL_TIME)
+            end = min(_parse_date(args.end), today) if args.end else today
+        else:
+            start, end = parse_range(" ".join(args.expr) or "this half", today)
+    except ValueError as e:
+        print(f"{Fore.RED}[ERROR] {e}")
+        sys.exit(1)
+
+    if start > end:
+        print(f"{Fore.RED}[ERROR] Tanggal awal ({start}) setelah tanggal akhir ({end}).")
+        sys.exit(1)
+
+    store = StatsStore()
+    t0 = time.time()
+    due = store.revalidation_due(start, end, today)
+    local_days, fetches = plan_fetches(start, end, today, store.covered_dates(start, end, today))
+    total_days = (end - start).days + 1
+
+    print(f"{Fore.CYAN}[PLAN] {start} s/d {end}: {total_days} hari, {local_days} lokal, "
+          f"{len(due)} revalidasi, {len(fetches)} panggilan API")
+    for a, b in fetches:
+        print(f"{Fore.LIGHTBLACK_EX}       - tarik {a} s/d {b} ({(b - a).days + 1} hari)")
+
+    if args.plan:
+        sys.exit(0)
+
+    if fetches and not args.offline:
+        if not fetch_missing(store, fetches, today):
+            print(f"{Fore.YELLOW}[WARN] Sebagian rentang gagal ditarik, data mungkin tidak lengkap.")
+
+    if fmt:
+        fields = ("date", "impression", "cpm", "revenue", "final")
+        stream_rows((dict(zip(("date", "impression", "revenue", "cpm", "final"), r), final=bool(r[4]))
+                     for r in store.days(start.isoformat(), end.isoformat())), fields)
+    else:
+        show_range(store, start, end)
+        print(f"{Fore.LIGHTBLACK_EX}[SYSTEM] Selesai dalam {time.time() - t0:.2f} detik.")
+    store.close()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra Records (Leaderboard)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Papan rekor yang diperbarui secara inkremental dari hari final di
+    HistoryCache, tanpa men-scan ulang seluruh riwayat setiap run:
+    - Top-N / bottom-N hari (revenue)     -> min-heap / max-heap ukuran N
+    - Bulan & periode half-month terbaik  -> heap periode yang sudah tutup
+                                             + akumulator periode berjalan
+    - Streak revenue positif terpanjang   -> run berjalan + rekor
+
+    Setiap hari baru O(log N). State (termasuk heap) disimpan di HistoryCache.
+    Jika Adsterra merevisi hari lama, atau hari yang hilang masuk belakangan
+    (HistoryCache.revision berubah), papan dibangun ulang sekali dari riwayat.
+--------------------------------------------------------------------------------
+"""
+
+import heapq
+import calendar
+from datetime import date
+
+from colorama import Fore, Style
+from tabulate import tabulate
+
+STATE_KEY = "records"
+
+class RecordsConfig:
+    # Jumlah entri yang disimpan per papan
+    TOP_N = 5
+
+# ==============================================================================
+# PAPAN REKOR
+# ==============================================================================
+
+def _period_keys(date_str):
+    """(bulan 'YYYY-MM', awal half-month 'YYYY-MM-01' / 'YYYY-MM-16')"""
+    month = date_str[:7]
+    return month, f"{month}-{'01' if int(date_str[8:10]) <= 15 else '16'}"
+
+def _push(heap, entry, n):
+    """Simpan maksimal n entri terbesar (min-heap), O(log n)"""
+    if len(heap) < n:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+class Leaderboard:
+    """
+    Entri heap berupa list (bukan tuple) agar tetap bisa dibandingkan setelah
+    state dibaca kembali dari JSON:
+        top    : [revenue, tanggal, cpm]
+        bottom : [-revenue, tanggal, cpm]   (max-heap lewat nilai negatif)
+        months : [revenue, 'YYYY-MM', hari]
+        halves : [revenue, 'YYYY-MM-01|16', hari]
+        open_* : periode berjalan [revenue, kunci, hari] (belum masuk heap)
+        streak : run berjalan [awal, akhir, hari]; best_streak sama
+    """
+
+    def __init__(self, state=None, n=RecordsConfig.TOP_N):
+        state = state or {}
+        self.n = n
+        self.last_date = state.get("last_date")
+        self.revision = state.get("revision", 0)
+        self.top = state.get("top", [])
+        self.bottom = state.get("bottom", [])
+        self.months = state.get("months", [])
+        self.halves = state.get("halves", [])
+        self.open_month = state.get("open_month")
+        self.open_half = state.get("open_half")
+        self.streak = state.get("streak")
+        self.best_streak = state.get("best_streak")
+
+    def to_state(self):
+        return {
+            "last_date": self.last_date,
+            "revision": self.revision,
+            "top": self.top,
+            "bottom": self.bottom,
+            "months": self.months,
+            "halves": self.halves,
+            "open_month": self.open_month,
+            "open_half": self.open_half,
+            "streak": self.streak,
+            "best_streak": self.best_streak,
+        }
+
+    def _roll(self, heap, current, key, revenue):
+        """Tambah revenue ke periode berjalan; periode lama ditutup ke heap"""
+        if current is not None and current[1] != key:
+            _push(heap, current, self.n)
+            current = None
+        if current is None:
+            current = [0.0, key, 0]
+        current[0] += revenue
+        current[2] += 1
+        return current
+
+    def update(self, date_str, row):
+        rev = row["revenue"]
+        cpm = row["cpm"]
+
+        _push(self.top, [rev, date_str, cpm], self.n)
+        # Hari tanpa impresi (akun belum aktif / belum ada traffic) tidak dihitung "terburuk"
+        if row["impression"] > 0:
+            _push(self.bottom, [-rev, date_str, cpm], self.n)
+
+        month, half = _period_keys(date_str)
+        self.open_month = self._roll(self.months, self.open_month, month, rev)
+        self.open_half = self._roll(self.halves, self.open_half, half, rev)
+
+        # Streak putus jika revenue 0 atau ada tanggal yang hilang
+        if rev > 0:
+            consecutive = (
+                self.streak is not None
+                and date.fromisoformat(date_str).toordinal() - date.fromisoformat(self.streak[1]).toordinal() == 1
+            )
+            if consecutive:
+                self.streak[1] = date_str
+                self.streak[2] += 1
+            else:
+                self.streak = [date_str, date_str, 1]
+            if self.best_streak is None or self.streak[2] > self.best_streak[2]:
+                self.best_streak = list(self.streak)
+        else:
+            self.streak = None
+
+        self.last_date = date_str
+
+    # --- Query ---
+
+    def top_days(self):
+        return [(d, rev, cpm) for rev, d, cpm in sorted(self.top, reverse=True)]
+
+    def bottom_days(self):
+        return [(d, -neg, cpm) for neg, d, cpm in sorted(self.bottom, reverse=True)]
+
+    @staticmethod
+    def _best(heap, current):
+        candidates = heap + ([current] if current else [])
+        return max(candidates) if candidates else None
+
+    def best_month(self):
+        """[revenue, 'YYYY-MM', hari] (bulan berjalan ikut dibandingkan)"""
+        return self._best(self.months, self.open_month)
+
+    def best_half(self):
+        """[revenue, awal periode, hari] (periode berjalan ikut dibandingkan)"""
+        return self._best(self.halves, self.open_half)
+
+    def current_streak(self):
+        return self.streak
+
+    def longest_streak(self):
+        return self.best_streak
+
+def load_records(cache):
+    """
+    Ambil papan rekor dari cache lalu proses HANYA hari final yang baru.
+    Dibangun ulang dari awal jika ada hari lama yang direvisi atau di-backfill.
+    """
+    records = Leaderboard(cache.state.get(STATE_KEY))
+    rebuilt = records.revision != cache.revision
+    if rebuilt:
+        records = Leaderboard()
+        records.revision = cache.revision
+
+    new_rows = cache.rows_after(records.last_date)
+    for date_str, row in new_rows:
+        records.update(date_str, row)
+    if new_rows or rebuilt:
+        cache.set_state(STATE_KEY, records.to_state())
+    return records
+
+# ==============================================================================
+# OUTPUT (JSON & TERMINAL)
+# ==============================================================================
+
+def half_label(start_str):
+    """'2026-10-16' -> '16-31 Oct 2026'"""
+    start = date.fromisoformat(start_str)
+    end = 15 if start.day == 1 else calendar.monthrange(start.year, start.month)[1]
+    return f"{start.day:02d}-{end:02d} {start.strftime('%b %Y')}"
+
+def highlights(records):
+    """Rekor dalam bentuk dict untuk meta.highlights ekspor JSON"""
+    def day(entry):
+        d, rev, cpm = entry
+        return {"date": d, "revenue": round(rev, 3), "cpm": cpm}
+
+    def period(entry, key):
+        if entry is None:
+            return None
+        rev, start, days = entry
+        return {key: start, "revenue": round(rev, 3), "days": days}
+
+    def streak(entry):
+        if entry is None:
+            return None
+        start, end, days = entry
+        return {"start": start, "end": end, "days": days}
+
+    return {
+        "top_days": [day(e) for e in records.top_days()],
+        "bottom_days": [day(e) for e in records.bottom_days()],
+        "best_month": period(records.best_month(), "month"),
+        "best_half_month": period(records.best_half(), "start"),
+        "longest_positive_streak": streak(records.longest_streak()),
+        "current_positive_streak": streak(records.current_streak()),
+        "as_of": records.last_date,
+    }
+
+def _usd(value):
+    return f"${float(value):,.3f}"
+
+def print_records(records, limit=3):
+    """Ringkasan rekor untuk laporan terminal"""
+    print(f"\n{Fore.MAGENTA}{Style.BRIGHT}=== PAPAN REKOR (hari final) ==={Style.RESET_ALL}")
+    if records.last_date is None:
+        print(f"{Fore.LIGHTBLACK_EX}Belum ada riwayat final.")
+        return
+
+    rows = []
+    for i, (d, rev, _) in enumerate(records.top_days()[:limit], 1):
+        rows.append([f"Hari Terbaik #{i}", d, f"{Fore.GREEN}{_usd(rev)}{Style.RESET_ALL}"])
+    for i, (d, rev, _) in enumerate(records.bottom_days()[:limit], 1):
+        rows.append([f"Hari Terburuk #{i}", d, f"{Fore.RED}{_usd(rev)}{Style.RESET_ALL}"])
+
+    month = records.best_month()
+    if month:
+        rows.append(["Bulan Terbaik", f"{month[1]} ({month[2]} hari)", f"{Fore.GREEN}{_usd(month[0])}{Style.RESET_ALL}"])
+    half = records.best_half()
+    if half:
+        rows.append(["Periode Terbaik", f"{half_label(half[1])} ({half[2]} hari)", f"{Fore.GREEN}{_usd(half[0])}{Style.RESET_ALL}"])
+
+    best = records.longest_streak()
+    if best:
+        rows.append(["Streak Terpanjang", f"{best[0]} s/d {best[1]}", f"{best[2]} hari"])
+    current = records.current_streak()
+    rows.append(["Streak Saat Ini", f"sejak {current[0]}" if current else "-", f"{current[2] if current else 0} hari"])
+
+    print(tabulate(rows, tablefmt="plain", disable_numparse=True))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra Render Cache (Tabel Harian)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Tabel harian laporan panjang (all-time, 90 hari) dengan baris hari FINAL
+    diambil dari cache, sehingga tabulate hanya memproses baris baru atau
+    baris hari ini. Output sama persis dengan tabulate(..., **TABLE).
+
+    Memformat sel (format_currency + warna) hanya ~3 mikrodetik per baris;
+    yang mahal adalah tabulate (deteksi tipe, lebar, dan perataan setiap
+    sel), ~150 mikrodetik per baris. Karena itu yang di-cache adalah baris
+    tabel yang SUDAH JADI, bukan sel:
+
+    - Lokasi  : tabel `render_rows` di stats.sqlite3 (lihat adsterra_store.py)
+    - Kunci   : profil (nama laporan + header + versi tabulate) + tanggal
+    - Validasi: sel baris dihitung ulang setiap run (murah) dan harus sama
+                persis dengan sel yang di-cache, jadi perubahan data, penanda
+                anomali, maupun fungsi format otomatis membuat baris dibuat
+                ulang. Tidak ada sidik jari kode.
+    - Lebar   : baris baru di-render bersama baris "pin" selebar sel terlebar
+                di cache. Jika garis tepi tabel berbeda dengan garis tepi saat
+                baris di-cache (kolom melebar/menyempit), seluruh tabel
+                di-render ulang dan cache diperbarui.
+
+Penggunaan:
+    python3 adsterra_render.py --bench [--days 1500]
+--------------------------------------------------------------------------------
+"""
+
+import re
+import sys
+import time
+import sqlite3
+
+from tabulate import tabulate, __version__ as TABULATE_VERSION
+
+try:
+    from wcwidth import wcswidth
+except ImportError:  # tabulate juga memakai len() jika wcwidth tidak ada
+    wcswidth = None
+
+from adsterra_cache import gmt_today
+
+# Format tabel harian; disable_numparse agar isi sel tidak diubah tabulate
+# (misal impresi "12.300" terbaca float lalu ditampilkan "12.3")
+TABLE = {"tablefmt": "simple_grid", "stralign": "right", "disable_numparse": True}
+
+SEP = "\x1f"
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+
+def visible_width(cell):
+    """Lebar tampilan sel (tanpa kode warna), sama dengan perhitungan tabulate"""
+    plain = _ANSI.sub("", cell.strip())
+    return wcswidth(plain) if wcswidth else len(plain)
+
+def profile_of(name, headers):
+    return f"{name}:{TABULATE_VERSION}:{SEP.join(headers)}"
+
+def render_table(rows, headers, store, name, today=None):
+    """
+    Tabel untuk rows = [(tanggal, sel), ...] urut tanggal, identik dengan
+    tabulate([sel, ...], headers=headers, **TABLE).
+    """
+    if not rows:
+        return tabulate([], headers=headers, **TABLE)
+
+    today_str = (today or gmt_today()).isoformat()
+    profile = profile_of(name, headers)
+    keys = [SEP.join(cells) for _, cells in rows]
+    cached = store.render_lines(profile, rows[0][0], rows[-1][0])
+
+    hits = {}
+    for i, (date_str, _) in enumerate(rows):
+        entry = cached.get(date_str)
+        if entry and date_str < today_str and entry[0] == keys[i]:
+            hits[i] = entry
+
+    if hits:
+        fresh = [i for i in range(len(rows)) if i not in hits]
+        widths = [max(col) for col in zip(*([int(w) for w in e[1].split(",")] for e in hits.values()))]
+        pin = ["x" * w for w in widths]
+        lines = tabulate([rows[i][1] for i in fresh] + [pin, pin], headers=headers, **TABLE).split("\n")
+        border = lines[0]
+        if len(lines) == 2 * (len(fresh) + 2) + 3 and all(e[2] == border for e in hits.values()):
+            body = dict(zip(fresh, lines[3:-1:2]))
+            out = lines[:3]
+            for i in range(len(rows)):
+                if i:
+                    out.append(lines[4])
+                out.append(body[i] if i in body else hits[i][3])
+            out.append(lines[-1])
+            _save(store, profile, rows, keys, [(i, body[i]) for i in fresh], border, today_str)
+            return "\n".join(out)
+
+    # Cache kosong / lebar kolom berubah: render penuh lalu simpan ulang
+    table = tabulate([cells for _, cells in rows], headers=headers, **TABLE)
+    lines = table.split("\n")
+    if len(lines) == 2 * len(rows) + 3:
+        _save(store, profile, rows, keys, enumerate(lines[3:-1:2]), lines[0], today_str)
+    return table
+
+def _save(store, profile, rows, keys, rendered, border, today_str):
+    entries = []
+    for i, line in rendered:
+        date_str, cells = rows[i]
+        if date_str < today_str:
+            widths = ",".join(str(visible_width(c)) for c in cells)
+            entries.append((date_str, keys[i], widths, border, line))
+    if entries:
+        try:
+            store.save_render_lines(profile, entries)
+        except sqlite3.Error:
+            # Cache gagal ditulis (misal database terkunci) tidak boleh menghentikan laporan
+            pass
+
+# ==============================================================================
+# BENCHMARK
+# ==============================================================================
+
+def _best_of(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def bench(days=1500, repeat=5):
+    import json
+    import tempfile
+    from datetime import date, timedelta
+    from adsterra_jsonlib import synthetic_payload
+    from adsterra_store import StatsStore
+    from cek_semua_data_adsterra import render_daily_row
+
+    items = json.loads(synthetic_payload(days))["items"]
+    today = date.fromisoformat(items[-1]["date"])
+    rows = [(i["date"], render_daily_row(i["date"], i["impression"], i["cpm"], i["revenue"], None)) for i in items]
+    headers = ["TANGGAL", "IMPRESSIONS", "CPM", "REVENUE"]
+    print(f"Tabel: {days} baris (baris terakhir = hari ini)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = StatsStore(path=f"{tmp}/stats.sqlite3")
+        expected = tabulate([cells for _, cells in rows], headers=headers, **TABLE)
+
+        t_plain = _best_of(lambda: tabulate([cells for _, cells in rows], headers=headers, **TABLE), repeat)
+        t0 = time.perf_counter()
+        cold = render_table(rows, headers, store, "bench", today)
+        t_cold = time.perf_counter() - t0
+        t_warm = _best_of(lambda: render_table(rows, headers, store, "bench", today), repeat)
+        warm = render_table(rows, headers, store, "bench", today)
+
+        # Hari berikutnya: satu hari final baru + hari ini yang baru
+        tomorrow = today + timedelta(days=1)
+        nxt = rows + [(tomorrow.isoformat(), render_daily_row(tomorrow.isoformat(), 20000, 0.4, 8.0, None))]
+        t0 = time.perf_counter()
+        next_day = render_table(nxt, headers, store, "bench", tomorrow)
+        t_next = time.perf_counter() - t0
+        store.close()
+
+    same = cold == expected and warm == expected
+    same_next = next_day == tabulate([cells for _, cells in nxt], headers=headers, **TABLE)
+    print(f"\n{'MODE':<22} {'WAKTU':>10}")
+    print(f"{'tabulate (tanpa cache)':<22} {t_plain * 1000:>8.2f}ms")
+    print(f"{'cache dingin':<22} {t_cold * 1000:>8.2f}ms")
+    print(f"{'cache hangat':<22} {t_warm * 1000:>8.2f}ms")
+    print(f"{'hari berikutnya':<22} {t_next * 1000:>8.2f}ms")
+    print(f"\nOutput identik: {'ya' if same and same_next else 'TIDAK'}")
+    return same and same_next
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark render cache tabel harian Adsterra")
+    parser.add_argument("--bench", action="store_true", help="Bandingkan kecepatan & output dengan tabulate biasa")
+    parser.add_argument("--days", type=int, default=1500, help="Jumlah baris tabel sintetis")
+    args = parser.parse_args()
+
+    if args.bench:
+        sys.exit(0 if bench(args.days) else 1)
+    parser.print_help()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Module: Adsterra Terminal Charts (Sparkline & Bar)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Grafik tren di terminal untuk semua mode laporan (revenue, impresi, CPM),
+    dipaskan ke lebar layar Termux.
+
+    [DOWNSAMPLING]
+    Riwayat panjang (ribuan hari) diperkecil ke lebar terminal dalam waktu
+    linear sebelum digambar:
+    - lttb   : Largest-Triangle-Three-Buckets, menjaga bentuk tren & puncak
+               (default grafik revenue)
+    - minmax : nilai min & max tiap bucket (lonjakan/anjlok tidak hilang)
+    - mean   : rata-rata tiap bucket; dipakai sparkline 1 baris (impresi,
+               CPM) karena lttb/minmax pada data harian yang bising
+               menghasilkan pola naik-turun bergantian, bukan tren
+
+    Setiap kolom digambar dengan blok Unicode 1/8 (▁▂▃▄▅▆▇█), jadi grafik
+    setinggi N baris punya resolusi 8N level.
+--------------------------------------------------------------------------------
+"""
+
+import os
+import shutil
+
+from colorama import Fore, Style
+
+class SparkConfig:
+    # lttb | minmax | mean (bisa diganti dengan ADSTERRA_DOWNSAMPLE)
+    METHOD = os.environ.get("ADSTERRA_DOWNSAMPLE", "lttb")
+    SPARK_METHOD = "mean"
+
+    # Lebar label di kiri grafik & batas lebar maksimal
+    LABEL_WIDTH = 11
+    MAX_WIDTH = 120
+
+    # Tinggi grafik revenue (baris); impresi & CPM 1 baris (sparkline)
+    REVENUE_HEIGHT = 4
+
+    # Bar bulanan hanya untuk rentang panjang, maksimal N bulan terakhir
+    MONTHLY_MIN_DAYS = 62
+    MONTHLY_MAX_BARS = 12
+
+BLOCKS = " ▁▂▃▄▅▆▇█"
+
+# ==============================================================================
+# DOWNSAMPLING (O(n))
+# ==============================================================================
+
+def lttb(values, threshold):
+    """
+    Largest-Triangle-Three-Buckets: pilih `threshold` titik dari `values`
+    (x = indeks) yang paling menjaga bentuk garis. Titik pertama & terakhir
+    selalu ikut.
+    """
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return list(values)
+
+    sampled = [values[0]]
+    bucket = (n - 2) / (threshold - 2)
+    a = 0  # indeks titik terpilih sebelumnya
+
+    for i in range(threshold - 2):
+        start = int(i * bucket) + 1
+        end = int((i + 1) * bucket) + 1
+
+        # Rata-rata bucket berikutnya sebagai titik acuan ketiga
+        next_start = end
+        next_end = min(int((i + 2) * bucket) + 1, n)
+        count = next_end - next_start
+        avg_x = (next_start + next_end - 1) / 2.0
+        avg_y = sum(values[next_start:next_end]) / count if count else values[-1]
+
+        ax, ay = a, values[a]
+        best_area = -1.0
+        best = start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (values[j] - ay) - (ax - j) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+        sampled.append(values[best])
+        a = best
+
+    sampled.append(values[-1])
+    return sampled
+
+def minmax(values, threshold):
+    """Min & max tiap bucket (urutan sesuai posisi), total ~threshold titik"""
+    n = len(values)
+    if threshold >= n or threshold < 2:
+        return list(values)
+
+    buckets = threshold // 2
+    size = n / buckets
+    sampled = []
+    for i in range(buckets):
+        chunk = values[int(i * size):int((i + 1) * size)]
+        if not chunk:
+            continue
+        lo = min(range(len(chunk)), key=chunk.__getitem__)
+        hi = max(range(len(chunk)), key=chunk.__getitem__)
+        sampled.extend(chunk[k] for k in sorted({lo, hi}))
+    return sampled
+
+def bucket_mean(values, threshold):
+    """Rata-rata tiap bucket, tepat `threshold` titik"""
+    n = len(values)
+    if threshold >= n or threshold < 1:
+        return list(values)
+    size = n / threshold
+    sampled = []
+    for i in range(threshold):
+        chunk = values[int(i * size):int((i + 1) * size)]
+        sampled.append(sum(chunk) / len(chunk))
+    return sampled
+
+DOWNSAMPLERS = {"lttb": lttb, "minmax": minmax, "mean": bucket_mean}
+
+def downsample(values, width, method=None):
+    return DOWNSAMPLERS.get(method or SparkConfig.METHOD, lttb)(values, width)
+
+# ==============================================================================
+# GAMBAR
+# ==============================================================================
+
+def chart_width():
+    columns = shutil.get_terminal_size((80, 24)).columns
+    return max(10, min(columns, SparkConfig.MAX_WIDTH) - SparkConfig.LABEL_WIDTH - 1)
+
+def render_columns(values, height=1, floor=None):
+    """List `height` baris teks (atas ke bawah) untuk satu nilai per kolom"""
+    if not values:
+        return [""] * height
+    lo = min(values) if floor is None else floor
+    hi = max(values)
+    span = (hi - lo) or 1.0
+    levels = height * 8
+    # Deret datar: di tengah jika tanpa floor, di dasar jika semuanya = floor
+    # (misal revenue $0 semua, jangan digambar seperti ada pendapatan)
+    flat = (levels // 2 or 1) if floor is None else 1
+    rows = [[] for _ in range(height)]
+    for value in values:
+        # Minimal 1 level agar nilai terendah tetap terlihat
+        level = max(1, round((value - lo) / span * levels)) if hi > lo else flat
+        for r in range(height):
+            fill = level - (height - 1 - r) * 8
+            rows[r].append(BLOCKS[min(max(fill, 0), 8)])
+    return ["".join(row) for row in rows]
+
+def sparkline(values, width=None, height=1, floor=None, method=None):
+    width = width or chart_width()
+    return render_columns(downsample(values, width, method), height, floor)
+
+def _label(text):
+    return f"{text:<{SparkConfig.LABEL_WIDTH}}"
+
+def print_trends(items, title="TREN"):
+    """
+    Sparkline revenue (beberapa baris), impresi & CPM untuk item API urut
+    tanggal, plus bar revenue bulanan untuk rentang panjang.
+    """
+    rows = [i for i in items if i.get("date")]
+    if len(rows) < 2:
+        return
+
+    revenue = [float(i.get("revenue", 0.0)) for i in rows]
+    impression = [float(i.get("impression", 0)) for i in rows]
+    cpm = [float(i.get("cpm", 0.0)) for i in rows]
+    width = chart_width()
+
+    print(f"\n{Fore.CYAN}{Style.BRIGHT}=== {title} ({rows[0]['date']} s/d {rows[-1]['date']}, {len(rows)} hari) ==={Style.RESET_ALL}")
+
+    chart = sparkline(revenue, width, SparkConfig.REVENUE_HEIGHT, floor=0.0)
+    labels = [f"${max(revenue):,.2f}"] + [""] * (len(chart) - 2) + ["$0"]
+    for label, line in zip(labels, chart):
+        print(f"{Fore.LIGHTBLACK_EX}{_label(label)}{Fore.GREEN}{line}{Style.RESET_ALL}")
+    print(f"{_label('Revenue')}{Fore.LIGHTBLACK_EX}{rows[0]['date']}{rows[-1]['date']:>{max(len(chart[0]) - 10, 11)}}{Style.RESET_ALL}")
+
+    for name, values, color, fmt in (
+        ("Impresi", impression, Fore.BLUE, lambda v: f"{int(v):,}".replace(",", ".")),
+        ("CPM", cpm, Fore.YELLOW, lambda v: f"${v:.3f}"),
+    ):
+        line = sparkline(values, width, method=SparkConfig.SPARK_METHOD)[0]
+        print(f"{_label(name)}{color}{line}{Style.RESET_ALL} {Fore.LIGHTBLACK_EX}({fmt(min(values))} s/d {fmt(max(values))}){Style.RESET_ALL}")
+
+    if len(rows) >= SparkConfig.MONTHLY_MIN_DAYS:
+        print_monthly_bars(rows, width)
+
+def print_monthly_bars(rows, width=None):
+    """Bar horizontal revenue per bulan (N bulan terakhir)"""
+    width = (width or chart_width()) - 12
+    months = {}
+    for item in rows:
+        key = item["date"][:7]
+        months[key] = months.get(key, 0.0) + float(item.get("revenue", 0.0))
+    recent = sorted(months.items())[-SparkConfig.MONTHLY_MAX_BARS:]
+    peak = max(v for _, v in recent) or 1.0
+
+    print(f"{Fore.LIGHTBLACK_EX}Revenue per bulan ({len(recent)} bulan terakhir):{Style.RESET_ALL}")
+    for month, value in recent:
+        eighths = round(value / peak * width * 8)
+        bar = "█" * (eighths // 8) + (BLOCKS[eighths % 8] if eighths % 8 else "")
+        print(f"{_label(month)}{Fore.GREEN}{bar}{Style.RESET_ALL} ${value:,.2f}")
@@ -0,0 +1,581 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Script: Adsterra Stats Store (SQLite)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Penyimpanan statistik Adsterra di SQLite lokal, sehingga ringkasan
+    (total periode, rekap bulanan, hari terbaik) cukup satu query ber-index
+    tanpa perlu download ulang lalu di-loop di Python.
+
+    Tabel `stats`:
+        date, account, dims, impression, revenue, cpm, final
+        - account : nama akun (default "default")
+        - dims    : kunci dimensi, misal "" (total harian) atau "domain=123"
+        - final   : 1 jika tanggal < hari ini (GMT)
+        - hash    : sidik jari isi baris (impresi, revenue, cpm)
+        - checked : tanggal (GMT) terakhir baris ini ditarik dari API
+    Index: PRIMARY KEY (account, dims, date) dan index tambahan pada date.
+
+    Tabel `coverage`: rentang hari final yang sudah pernah ditarik utuh dari
+    API (termasuk hari tanpa data), dipakai planner rentang tanggal.
+
+    Tabel `snapshots`: total periode yang sudah tutup (bulan, half-month)
+    dibekukan sekali (hari, impresi, revenue, CPM riil, rata-rata harian),
+    sehingga laporan multi-periode hanya mengagregasi periode yang masih
+    berjalan. Snapshot dihapus otomatis jika ada hari di dalamnya yang
+    berubah atau baru masuk (misal revisi Adsterra).
+
+    Tabel `render_rows`: baris tabel harian yang sudah jadi (hasil tabulate)
+    untuk hari final, lihat adsterra_render.py.
+
+    [REVISI DATA]
+    Adsterra bisa merevisi hari yang sudah lewat. Hari final dijadwalkan
+    ditarik ulang menurut REVALIDATE_SCHEDULE (3 hari terakhir setiap run,
+    14 hari harian, 60 hari mingguan); jika hash berubah, perubahan dicatat
+    di tabel `revisions` dan ditampilkan.
+
+    Lokasi: ~/.cache/adsterra/stats.sqlite3 (ikut ADSTERRA_CACHE_DIR)
+
+Penggunaan (offline, tanpa API):
+    python3 adsterra_store.py summary [--from YYYY-MM-DD] [--to YYYY-MM-DD]
+    python3 adsterra_store.py months  [--from ...] [--to ...]
+    python3 adsterra_store.py best    [-n 10] [--worst]
+    python3 adsterra_store.py revisions [-n 20]
+    python3 adsterra_store.py import  (isi dari ~/.cache/adsterra/history.json)
+    Semua mode (kecuali import) menerima --format json|jsonl|csv|tsv.
+--------------------------------------------------------------------------------
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import hashlib
+import calendar
+import argparse
+from datetime import datetime, timedelta
+
+from colorama import Fore
+
+from adsterra_cache import CACHE_DIR, HistoryCache, gmt_today, normalize_row
+from adsterra_fileio import IOConfig
+from adsterra_output import parse_format_flag, stream_rows
+
+DEFAULT_ACCOUNT = "default"
+DB_FILENAME = "stats.sqlite3"
+
+# (umur hari maksimal, minimal hari sejak terakhir dicek); 0 = setiap run
+REVALIDATE_SCHEDULE = ((3, 0), (14, 1), (60, 7))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats (
+    date       TEXT    NOT NULL,
+    account    TEXT    NOT NULL DEFAULT 'default',
+    dims       TEXT    NOT NULL DEFAULT '',
+    impression INTEGER NOT NULL DEFAULT 0,
+    revenue    REAL    NOT NULL DEFAULT 0,
+    cpm        REAL    NOT NULL DEFAULT 0,
+    final      INTEGER NOT NULL DEFAULT 0,
+    hash       TEXT    NOT NULL DEFAULT '',
+    checked    TEXT    NOT NULL DEFAULT '',
+    PRIMARY KEY (account, dims, date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_stats_date ON stats (date);
+CREATE TABLE IF NOT EXISTS revisions (
+    account        TEXT    NOT NULL,
+    dims           TEXT    NOT NULL,
+    date           TEXT    NOT NULL,
+    detected       TEXT    NOT NULL,
+    old_impression INTEGER NOT NULL,
+    old_revenue    REAL    NOT NULL,
+    new_impression INTEGER NOT NULL,
+    new_revenue    REAL    NOT NULL
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    account TEXT NOT NULL,
+    dims    TEXT NOT NULL,
+    start   TEXT NOT NULL,
+    end     TEXT NOT NULL,
+    PRIMARY KEY (account, dims, start, end)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS snapshots (
+    account    TEXT    NOT NULL,
+    dims       TEXT    NOT NULL,
+    start      TEXT    NOT NULL,
+    end        TEXT    NOT NULL,
+    days       INTEGER NOT NULL,
+    impression INTEGER NOT NULL,
+    revenue    REAL    NOT NULL,
+    cpm        REAL    NOT NULL,
+    avg_daily  REAL    NOT NULL,
+    first      TEXT,
+    last       TEXT,
+    frozen     TEXT    NOT NULL,
+    PRIMARY KEY (account, dims, start, end)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS render_rows (
+    profile TEXT NOT NULL,
+    date    TEXT NOT NULL,
+    cells   TEXT NOT NULL,
+    widths  TEXT NOT NULL,
+    border  TEXT NOT NULL,
+    line    TEXT NOT NULL,
+    PRIMARY KEY (profile, date)
+) WITHOUT ROWID;
+"""
+
+# Kolom yang ditambahkan setelah versi awal tabel `stats`
+MIGRATIONS = {
+    "hash": "ALTER TABLE stats ADD COLUMN hash TEXT NOT NULL DEFAULT ''",
+    "checked": "ALTER TABLE stats ADD COLUMN checked TEXT NOT NULL DEFAULT ''",
+}
+
+def row_hash(row):
+    """Sidik jari isi satu hari (row hasil normalize_row)"""
+    payload = json.dumps([row["impression"], row["revenue"], row["cpm"]])
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+class StatsStore:
+    """Query ringkasan ber-index di atas tabel `stats`"""
+
+    def __init__(self, path=None, account=DEFAULT_ACCOUNT):
+        self.path = path or os.path.join(CACHE_DIR, DB_FILENAME)
+        self.account = account
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # WAL: pembaca tidak diblok penulis; penulis lain ditunggu hingga LOCK_TIMEOUT
+        self.conn = sqlite3.connect(self.path, timeout=IOConfig.LOCK_TIMEOUT)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        columns = {r[1] for r in self.conn.execute("PRAGMA table_info(stats)")}
+        with self.conn:
+            for column, sql in MIGRATIONS.items():
+                if column not in columns:
+                    self.conn.execute(sql)
+
+    def close(self):
+        self.conn.close()
+
+    # --------------------------------------------------------------------------
+    # Tulis
+    # --------------------------------------------------------------------------
+
+    def upsert_items(self, items, dims="", today=None, coverage=()):
+        """
+        Simpan/ganti item API (group_by=date). Mengembalikan daftar revisi:
+        (tanggal, impresi_lama, revenue_lama, impresi_baru, revenue_baru)
+        untuk hari yang sudah final sebelumnya tetapi isinya berubah.
+
+        coverage : rentang final [(start, end), ...] yang ikut ditandai
+                   (lihat add_coverage) dalam transaksi yang sama.
+        """
+        today_str = (today or gmt_today()).isoformat()
+        dated = [(item["date"], normalize_row(item)) for item in items if item.get("date")]
+        if not dated and not coverage:
+            return []
+
+        previous = {}
+        if dated:
+            clause, params = self._where(min(d for d, _ in dated), max(d for d, _ in dated), dims)
+            previous = {
+                d: (imp, rev, final, h) for d, imp, rev, final, h in self.conn.execute(
+                    f"SELECT date, impression, revenue, final, hash FROM stats WHERE {clause}", params
+                )
+            }
+
+        rows = []
+        revisions = []
+        changed = []
+        for date_str, row in dated:
+            h = row_hash(row)
+            old = previous.get(date_str)
+            if old and old[2] and old[3] and old[3] != h:
+                revisions.append((date_str, old[0], old[1], row["impression"], row["revenue"]))
+            if not old or old[3] != h:
+                changed.append(date_str)
+            rows.append((date_str, self.account, dims, row["impression"], row["revenue"],
+                         row["cpm"], int(date_str < today_str), h, today_str))
+
+        detected = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO stats (date, account, dims, impression, revenue, cpm, final, hash, checked) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self.conn.executemany(
+                "INSERT INTO revisions (account, dims, date, detected, old_impression, old_revenue, "
+                "new_impression, new_revenue) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(self.account, dims, d, detected, oi, orv, ni, nr) for d, oi, orv, ni, nr in revisions]
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO coverage (account, dims, start, end) VALUES (?, ?, ?, ?)",
+                [(self.account, dims, start, end) for start, end in coverage]
+            )
+            # Snapshot yang memuat hari baru/berubah tidak berlaku lagi
+            self.conn.executemany(
+                "DELETE FROM snapshots WHERE account = ? AND dims = ? AND start <= ? AND end >= ?",
+                [(self.account, dims, d, d) for d in changed]
+            )
+        return revisions
+
+    def add_coverage(self, start, end, dims=""):
+        """Tandai rentang hari final [start, end] sudah ditarik lengkap"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO coverage (account, dims, start, end) VALUES (?, ?, ?, ?)",
+                (self.account, dims, start, end)
+            )
+
+    def save_render_lines(self, profile, rows):
+        """Simpan/ganti baris tabel hari final: [(date, cells, widths, border, line), ...]"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO render_rows (profile, date, cells, widths, border, line) "
+                "VALUES (?, ?, ?, ?, ?, ?)", [(profile,) + tuple(row) for row in rows]
+            )
+
+    # --------------------------------------------------------------------------
+    # Query
+    # --------------------------------------------------------------------------
+
+    def render_lines(self, profile, start, end):
+        """dict {date: (cells, widths, border, line)} untuk start <= date <= end"""
+        return {
+            d: (cells, widths, border, line) for d, cells, widths, border, line in self.conn.execute(
+                "SELECT date, cells, widths, border, line FROM render_rows "
+                "WHERE profile = ? AND date >= ? AND date <= ?", (profile, start, end)
+            )
+        }
+
+    def days(self, start=None, end=None, dims=""):
+        """List (date, impression, revenue, cpm, final) urut tanggal"""
+        clause, params = self._where(start, end, dims)
+        return self.conn.execute(
+            f"SELECT date, impression, revenue, cpm, final FROM stats WHERE {clause} ORDER BY date", params
+        ).fetchall()
+
+    def local_dates(self, start, end, dims=""):
+        """Set tanggal dalam [start, end] yang bisa dilayani lokal (final / tercakup)"""
+        clause, params = self._where(start, end, dims)
+        known = {d for (d,) in self.conn.execute(f"SELECT date FROM stats WHERE {clause} AND final = 1", params)}
+        ranges = self.conn.execute(
+            "SELECT start, end FROM coverage WHERE account = ? AND dims = ? AND end >= ? AND start <= ?",
+            (self.account, dims, start, end)
+        ).fetchall()
+        return known, ranges
+
+    def revalidation_due(self, start, end, today, dims=""):
+        """Tanggal final dalam [start, end] yang jatuh tempo ditarik ulang"""
+        horizon = today - timedelta(days=REVALIDATE_SCHEDULE[-1][0])
+        lo = max(start, horizon)
+        hi = min(end, today - timedelta(days=1))
+        if lo > hi:
+            return set()
+
+        clause, params = self._where(lo.isoformat(), hi.isoformat(), dims)
+        checked = dict(self.conn.execute(f"SELECT date, checked FROM stats WHERE {clause}", params))
+
+        due = set()
+        day = lo
+        while day <= hi:
+            date_str = day.isoformat()
+            age = (today - day).days
+            for max_age, every in REVALIDATE_SCHEDULE:
+                if age > max_age:
+                    continue
+                last = checked.get(date_str)
+                if every == 0 or not last or (today - datetime.strptime(last, "%Y-%m-%d").date()).days >= every:
+                    due.add(date_str)
+                break
+            day += timedelta(days=1)
+        return due
+
+    def recent_revisions(self, n=20, dims=""):
+        return self.conn.execute(
+            "SELECT date, detected, old_impression, old_revenue, new_impression, new_revenue FROM revisions "
+            "WHERE account = ? AND dims = ? ORDER BY detected DESC, date DESC LIMIT ?",
+            (self.account, dims, n)
+        ).fetchall()
+
+    def covered_dates(self, start, end, today, dims="", revalidate=True):
+        """
+        Set tanggal final dalam [start, end] yang bisa dilayani lokal:
+        ada barisnya atau masuk rentang coverage, dan (jika revalidate)
+        tidak jatuh tempo revalidasi.
+        """
+        known, ranges = self.local_dates(start.isoformat(), end.isoformat(), dims)
+        covered = set(known)
+        for a, b in ranges:
+            day = max(datetime.strptime(a, "%Y-%m-%d").date(), start)
+            stop = min(datetime.strptime(b, "%Y-%m-%d").date(), end)
+            while day <= stop:
+                covered.add(day.isoformat())
+                day += timedelta(days=1)
+        if revalidate:
+            covered.difference_update(self.revalidation_due(start, end, today, dims))
+        return covered
+
+    def _where(self, start, end, dims):
+        clause = "account = ? AND dims = ?"
+        params = [self.account, dims]
+        if start:
+            clause += " AND date >= ?"
+            params.append(start)
+        if end:
+            clause += " AND date <= ?"
+            params.append(end)
+        return clause, params
+
+    def totals(self, start=None, end=None, dims=""):
+        """dict {days, impression, revenue, cpm, first, last, pending}"""
+        clause, params = self._where(start, end, dims)
+        days, imp, rev, first, last, pending = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(impression), 0), COALESCE(SUM(revenue), 0.0), "
+            f"MIN(date), MAX(date), COALESCE(SUM(1 - final), 0) FROM stats WHERE {clause}", params
+        ).fetchone()
+        return {
+            "days": days,
+            "impression": imp,
+            "revenue": rev,
+            "cpm": (rev / imp * 1000) if imp else 0.0,
+            "first": first,
+            "last": last,
+            "pending": pending,
+        }
+
+    def monthly(self, start=None, end=None, dims=""):
+        """List dict per bulan (terbaru dulu): month, days, impression, revenue, cpm"""
+        clause, params = self._where(start, end, dims)
+        cur = self.conn.execute(
+            "SELECT substr(date, 1, 7) AS month, COUNT(*), SUM(impression), SUM(revenue) "
+            f"FROM stats WHERE {clause} GROUP BY month ORDER BY month DESC", params
+        )
+        return [
+            {
+                "month": month,
+                "days": days,
+                "impression": imp,
+                "revenue": rev,
+                "cpm": (rev / imp * 1000) if imp else 0.0,
+            }
+            for month, days, imp, rev in cur
+        ]
+
+    def month_signatures(self, start=None, end=None, dims=""):
+        """dict {'YYYY-MM': sidik jari isi bulan}; berubah jika ada hari di bulan itu berubah"""
+        clause, params = self._where(start, end, dims)
+        cur = self.conn.execute(
+            "SELECT substr(date, 1, 7) AS month, "
+            "group_concat(date || ':' || impression || ':' || revenue || ':' || cpm || ':' || final, ';') "
+            f"FROM (SELECT * FROM stats WHERE {clause} ORDER BY date) GROUP BY month", params
+        )
+        return {month: hashlib.sha1(text.encode()).hexdigest()[:16] for month, text in cur}
+
+    def period_totals(self, start, end, today=None, dims=""):
+        """
+        Seperti totals() + avg_daily, untuk periode [start, end] (string ISO).
+        Periode yang sudah tutup dan lengkap di lokal dibaca dari / dibekukan
+        ke tabel `snapshots`; periode berjalan selalu dihitung langsung.
+        """
+        today = today or gmt_today()
+        closed = end < today.isoformat()
+        if closed:
+            row = self.conn.execute(
+                "SELECT days, impression, revenue, cpm, avg_daily, first, last FROM snapshots "
+                "WHERE account = ? AND dims = ? AND start = ? AND end = ?",
+                (self.account, dims, start, end)
+            ).fetchone()
+            if row:
+                days, imp, rev, cpm, avg_daily, first, last = row
+                return {"days": days, "impression": imp, "revenue": rev, "cpm": cpm,
+                        "avg_daily": avg_daily, "first": first, "last": last, "pending": 0}
+
+        t = self.totals(start, end, dims)
+        t["avg_daily"] = t["revenue"] / t["days"] if t["days"] else 0.0
+        if closed and t["days"] and not t["pending"] and self._complete(start, end, today, dims):
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO snapshots (account, dims, start, end, days, impression, revenue, "
+                    "cpm, avg_daily, first, last, frozen) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (self.account, dims, start, end, t["days"], t["impression"], t["revenue"], t["cpm"],
+                     t["avg_daily"], t["first"], t["last"], today.isoformat())
+                )
+        return t
+
+    def _complete(self, start, end, today, dims):
+        """Semua hari di [start, end] sudah final di lokal atau masuk coverage"""
+        first = datetime.strptime(start, "%Y-%m-%d").date()
+        last = datetime.strptime(end, "%Y-%m-%d").date()
+        covered = self.covered_dates(first, last, today, dims, revalidate=False)
+        return len(covered) == (last - first).days + 1
+
+    def period_series(self, start, end, today=None, unit="month", dims=""):
+        """
+        List dict per periode (terbaru dulu) dalam [start, end]: {unit, start,
+        end, days, impression, revenue, cpm, avg_daily}. unit = month | half.
+        Periode penuh yang sudah tutup memakai snapshot; periode yang terpotong
+        batas rentang dan periode berjalan dihitung langsung.
+        """
+        today = today or gmt_today()
+        result = []
+        for key, p_start, p_end in period_bounds(start, end, unit):
+            lo, hi = max(p_start, start), min(p_end, end)
+            if (lo, hi) == (p_start, p_end):
+                t = self.period_totals(lo, hi, today, dims)
+            else:
+                t = self.totals(lo, hi, dims)
+                t["avg_daily"] = t["revenue"] / t["days"] if t["days"] else 0.0
+            if t["days"]:
+                result.append(dict(t, **{unit: key, "start": lo, "end": hi}))
+        result.reverse()
+        return result
+
+    def best_days(self, n=5, start=None, end=None, dims="", worst=False, final_only=True):
+        """List (date, impression, revenue, cpm) dengan revenue tertinggi/terendah"""
+        clause, params = self._where(start, end, dims)
+        if final_only:
+            clause += " AND final = 1"
+        order = "ASC" if worst else "DESC"
+        return self.conn.execute(
+            f"SELECT date, impression, revenue, cpm FROM stats WHERE {clause} "
+            f"ORDER BY revenue {order}, date DESC LIMIT ?", params + [n]
+        ).fetchall()
+
+    def import_history(self, cache=None):
+        """Isi store dari HistoryCache (hari final saja)"""
+        cache = cache or HistoryCache()
+        items = [dict(row, date=date_str) for date_str, row in cache.rows_after(None)]
+        self.upsert_items(items)
+        return len(items)
+
+def period_bounds(start, end, unit="month"):
+    """(kunci, awal, akhir) tiap bulan / half-month yang bersinggungan dengan [start, end]"""
+    day = datetime.strptime(start, "%Y-%m-%d").date()
+    stop = datetime.strptime(end, "%Y-%m-%d").date()
+    day = day.replace(day=1 if unit == "month" or day.day <= 15 else 16)
+    bounds = []
+    while day <= stop:
+        last = calendar.monthrange(day.year, day.month)[1]
+        if unit == "half" and day.day == 1:
+            p_end = day.replace(day=15)
+        else:
+            p_end = day.replace(day=last)
+        key = day.strftime("%Y-%m") if unit == "month" else day.isoformat()
+        bounds.append((key, day.isoformat(), p_end.isoformat()))
+        day = p_end + timedelta(days=1)
+    return bounds
+
+def print_revisions(revisions):
+    """Tampilkan hari final yang direvisi Adsterra"""
+    for date_str, old_imp, old_rev, new_imp, new_rev in revisions:
+        print(f"{Fore.YELLOW}[REVISI] {date_str}: revenue {_usd(old_rev)} -> {_usd(new_rev)}, "
+              f"impresi {_num(old_imp)} -> {_num(new_imp)}")
+
+def open_store(items, today=None):
+    """Store dengan item API terbaru sudah tersimpan (dipakai script laporan)"""
+    store = StatsStore()
+    print_revisions(store.upsert_items(items, today=today))
+    return store
+
+# ==============================================================================
+# CLI (OFFLINE)
+# ==============================================================================
+
+def _usd(val):
+    return f"${float(val):,.3f}"
+
+def _num(val):
+    return f"{int(val):,}".replace(",", ".")
+
+def stream_mode(store, args):
+    """Mode --format: baris mentah ke stdout tanpa tabulate/colorama"""
+    if args.mode == "summary":
+        rows = [store.totals(args.start, args.end)]
+        fields = ("first", "last", "days", "pending", "impression", "cpm", "revenue")
+    elif args.mode == "months":
+        rows = store.monthly(args.start, args.end)
+        fields = ("month", "days", "impression", "cpm", "revenue")
+    elif args.mode == "best":
+        fields = ("date", "impression", "revenue", "cpm")
+        rows = (dict(zip(fields, r)) for r in store.best_days(args.n, args.start, args.end, worst=args.worst))
+    else:
+        fields = ("date", "detected", "old_impression", "old_revenue", "new_impression", "new_revenue")
+        rows = (dict(zip(fields, r)) for r in store.recent_revisions(args.n))
+    stream_rows((_rounded(r) for r in rows), fields)
+
+def _rounded(row):
+    return {k: round(v, 3) if isinstance(v, float) else v for k, v in row.items()}
+
+if __name__ == "__main__":
+    fmt = parse_format_flag()
+
+    from tabulate import tabulate
+    from colorama import init, Style
+    init(autoreset=True)
+
+    parser = argparse.ArgumentParser(description="Query statistik Adsterra dari SQLite lokal")
+    parser.add_argument("mode", choices=["summary", "months", "best", "revisions", "import"])
+    parser.add_argument("--from", dest="start", help="Tanggal awal (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="end", help="Tanggal akhir (YYYY-MM-DD)")
+    parser.add_argument("-n", type=int, default=10, help="Jumlah baris (mode best / revisions)")
+    parser.add_argument("--worst", action="store_true", help="Hari terburuk (mode best)")
+    args = parser.parse_args()
+
+    store = StatsStore()
+
+    if fmt and args.mode != "import":
+        stream_mode(store, args)
+        store.close()
+        sys.exit(0)
+
+    if args.mode == "import":
+        count = store.import_history()
+        print(f"{Fore.GREEN}[OK] {count} hari diimpor ke {store.path}")
+        sys.exit(0)
+
+    if args.mode == "summary":
+        t = store.totals(args.start, args.end)
+        if not t["days"]:
+            print(f"{Fore.YELLOW}[INFO] Store kosong. Jalankan laporan (a/b/c/d/z) atau 'import' dulu.")
+            sys.exit(0)
+        rows = [
+            ["Rentang Data", f"{t['first']} s/d {t['last']}"],
+            ["Total Hari", f"{t['days']} Hari" + (f" ({t['pending']} belum final)" if t["pending"] else "")],
+            ["Total Impressions", _num(t["impression"])],
+            ["Rata-rata CPM", _usd(t["cpm"])],
+            ["Rata-rata Revenue/Hari", _usd(t["revenue"] / t["days"])],
+            ["TOTAL PENDAPATAN", f"{Fore.GREEN}{Style.BRIGHT}{_usd(t['revenue'])}{Style.RESET_ALL}"],
+        ]
+        print(tabulate(rows, tablefmt="plain"))
+
+    elif args.mode == "months":
+        rows = [
+            [m["month"], m["days"], _num(m["impression"]), _usd(m["cpm"]),
+             _usd(m["revenue"] / m["days"]), _usd(m["revenue"])]
+            for m in store.monthly(args.start, args.end)
+        ]
+        headers = ["BULAN", "HARI", "TOT IMPRESS", "AVG CPM", "RATA2 / HARI", "TOT REVENUE"]
+        print(tabulate(rows, headers=headers, tablefmt="simple_grid", stralign="right", disable_numparse=True))
+
+    elif args.mode == "best":
+        rows = [[d, _num(imp), _usd(cpm), _usd(rev)]
+                for d, imp, rev, cpm in store.best_days(args.n, args.start, args.end, worst=args.worst)]
+        headers = ["TANGGAL", "IMPRESSIONS", "CPM", "REVENUE"]
+        print(tabulate(rows, headers=headers, tablefmt="simple_grid", stralign="right", disable_numparse=True))
+
+    elif args.mode == "revisions":
+        rows = [[d, detected, _num(oi), _num(ni), _usd(orv), _usd(nrv), _usd(nrv - orv)]
+                for d, detected, oi, orv, ni, nrv in store.recent_revisions(args.n)]
+        if not rows:
+            print(f"{Fore.GREEN}[OK] Belum ada revisi data yang terdeteksi.")
+        else:
+            headers = ["TANGGAL", "TERDETEKSI", "IMP LAMA", "IMP BARU", "REV LAMA", "REV BARU", "SELISIH"]
+            print(tabulate(rows, headers=headers, tablefmt="simple_grid", stralign="right", disable_numparse=True))
+
+    store.close()
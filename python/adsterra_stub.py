@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Script: Adsterra Stub API Server (v1.0)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Server lokal pengganti api3.adsterratools.com untuk menguji dan
+    mem-benchmark cache, retry, dan fetch paralel tanpa internet dan tanpa
+    menyentuh akun asli. Semua script membaca ADSTERRA_BASE_URL (dan
+    ADSTERRA_API_KEY), jadi cukup arahkan ke server ini.
+
+    [ENDPOINT] GET /publisher/stats.json
+    - Header X-API-Key wajib (403 jika salah).
+    - start_date, finish_date (YYYY-MM-DD), group_by = date | domain |
+      placement | country. Parameter tidak valid dibalas 200 + "errors",
+      seperti yang ditangani AdsterraClient.
+    - Respon di-gzip jika client mengirim Accept-Encoding: gzip.
+
+    [ENDPOINT] GET /publisher/domains.json
+               GET /publisher/domain/{id}/placements.json
+    - Daftar situs & placement ({"items": [{"id", "title"}]}) dengan ID yang
+      sama dengan breakdown group_by=domain / placement.
+
+    [DATA SINTETIS]
+    - Deterministik per (seed, API key, tanggal): rentang yang berbeda
+      selalu memberi angka yang sama untuk hari yang sama, jadi hasil
+      cache/low-data bisa dibandingkan byte-per-byte dengan tarik penuh.
+    - Hari ini (GMT) diskalakan dengan porsi hari yang sudah berjalan,
+      kecuali --today diisi (tanggal beku, hari itu dianggap penuh).
+
+    [GANGGUAN] (diundi dengan RNG ber-seed, jadi urutannya bisa diulang)
+    - --latency / --jitter : jeda tiap respon (ms)
+    - --rate-429           : porsi respon 429 (dengan Retry-After)
+    - --rate-5xx           : porsi respon 500/502/503
+    - --rate-truncate      : porsi body yang terpotong di tengah jalan
+    - --fail-first N       : N request pertama selalu 503
+
+    [RECORD / REPLAY]
+    - --record DIR : teruskan request ke API asli (--upstream), simpan
+                     respon sebagai fixture JSON (API key tidak disimpan).
+    - --replay DIR : layani dari fixture; request tanpa fixture dibalas 404,
+                     atau data sintetis jika --fallback.
+
+    GET /__stats mengembalikan jumlah request per status (untuk benchmark).
+
+Penggunaan:
+    python3 adsterra_stub.py [--port 8799] [--latency 200 --rate-429 0.1]
+    ADSTERRA_BASE_URL=http://127.0.0.1:8799/publisher/stats.json d
+
+    python3 adsterra_stub.py --record fixtures/   (sekali, butuh internet)
+    python3 adsterra_stub.py --replay fixtures/   (selanjutnya offline)
+
+Dependencies:
+    - requests (hanya untuk --record), colorama
+--------------------------------------------------------------------------------
+"""
+
+import os
+import re
+import sys
+import math
+import gzip
+import json
+import time
+import zlib
+import random
+import hashlib
+import argparse
+import threading
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from colorama import init, Fore
+
+from adsterra_api import ApiConfig
+from adsterra_projection import day_fraction
+
+# ==============================================================================
+# 1. KONFIGURASI
+# ==============================================================================
+
+class StubConfig:
+    HOST = "127.0.0.1"
+    PORT = 8799
+    STATS_PATH = "/publisher/stats.json"
+    DOMAINS_PATH = "/publisher/domains.json"
+    PLACEMENTS_PATH = re.compile(r"^/publisher/domain/(\d+)/placements\.json$")
+    UPSTREAM = "https://api3.adsterratools.com"
+
+    # Data sintetis dimulai dari tanggal akun dibuat
+    START_DATE = "2022-10-01"
+    SEED = 1
+
+    GROUP_BY = ("date", "domain", "placement", "country")
+    DOMAINS = ((101, "blog-utama.example"), (102, "tools.example"), (103, "mirror.example"))
+    PLACEMENTS = ((2001, "Popunder"), (2002, "Social Bar"), (2003, "Native Banner"))
+    PLACEMENT_DOMAIN = {2001: 101, 2002: 101, 2003: 102}
+    COUNTRIES = ("ID", "US", "IN", "BR", "MY")
+
+    RETRY_AFTER = 2
+
+# ==============================================================================
+# 2. DATA SINTETIS
+# ==============================================================================
+
+def _key_seed(seed, api_key):
+    return seed * 1000003 + zlib.crc32(api_key.encode())
+
+def synthetic_day(day, seed):
+    """Satu hari sintetis (tren musiman + akhir pekan + noise), deterministik"""
+    rnd = random.Random(seed * 100003 + day.toordinal())
+    base = 10 + 2 * math.sin(day.toordinal() / 30) + (3 if day.weekday() >= 5 else 0)
+    impression = int(2000 * base * rnd.uniform(0.8, 1.2))
+    revenue = round(base * rnd.uniform(0.85, 1.15), 3)
+    clicks = int(impression * rnd.uniform(0.001, 0.004))
+    return {
+        "impression": impression,
+        "clicks": clicks,
+        "ctr": round(clicks / impression * 100, 2),
+        "cpm": round(revenue / impression * 1000, 3),
+        "revenue": revenue,
+    }
+
+def _scale(row, frac):
+    impression = int(row["impression"] * frac)
+    revenue = round(row["revenue"] * frac, 3)
+    clicks = int(row["clicks"] * frac)
+    return {
+        "impression": impression,
+        "clicks": clicks,
+        "ctr": round(clicks / impression * 100, 2) if impression else 0.0,
+        "cpm": round(revenue / impression * 1000, 3) if impression else 0.0,
+        "revenue": revenue,
+    }
+
+def _weights(n, seed, day):
+    rnd = random.Random(seed * 7 + day.toordinal())
+    raw = [rnd.uniform(0.5, 1.5) / (i + 1) for i in range(n)]
+    total = sum(raw)
+    return [w / total for w in raw]
+
+def synthetic_items(start, end, group_by, seed, today, frozen=False):
+    """Item respon stats.json untuk [start, end], dipotong ke [START_DATE, today]"""
+    start = max(start, date.fromisoformat(StubConfig.START_DATE))
+    end = min(end, today)
+    frac = 1.0 if frozen else day_fraction(datetime.now(timezone.utc))
+
+    days = []
+    day = start
+    while day <= end:
+        row = synthetic_day(day, seed)
+        days.append((day, _scale(row, frac) if day == today else row))
+        day += timedelta(days=1)
+
+    if group_by == "date":
+        return [dict(row, date=day.isoformat()) for day, row in days]
+
+    if group_by == "domain":
+        keys = [{"domain_id": i, "domain": name} for i, name in StubConfig.DOMAINS]
+    elif group_by == "placement":
+        keys = [{"placement_id": i, "placement": name} for i, name in StubConfig.PLACEMENTS]
+    else:
+        keys = [{"country": c} for c in StubConfig.COUNTRIES]
+
+    # Pecah total harian ke tiap kunci dengan bobot deterministik, lalu jumlahkan
+    sums = [Counter() for _ in keys]
+    for day, row in days:
+        for acc, w in zip(sums, _weights(len(keys), seed, day)):
+            acc["impression"] += int(row["impression"] * w)
+            acc["clicks"] += int(row["clicks"] * w)
+            acc["revenue"] += row["revenue"] * w
+
+    items = []
+    for key, acc in zip(keys, sums):
+        imp = acc["impression"]
+        rev = round(acc["revenue"], 3)
+        items.append(dict(
+            key,
+            impression=imp,
+            clicks=acc["clicks"],
+            ctr=round(acc["clicks"] / imp * 100, 2) if imp else 0.0,
+            cpm=round(rev / imp * 1000, 3) if imp else 0.0,
+            revenue=rev,
+        ))
+    return items
+
+def meta_items(path):
+    """Item domains.json / placements.json untuk `path`, atau None jika bukan endpoint metadata"""
+    if path == StubConfig.DOMAINS_PATH:
+        return [{"id": i, "title": name} for i, name in StubConfig.DOMAINS]
+    match = StubConfig.PLACEMENTS_PATH.match(path)
+    if match:
+        domain_id = int(match.group(1))
+        return [
+            {"id": i, "title": name, "alias": name.lower().replace(" ", "_")}
+            for i, name in StubConfig.PLACEMENTS if StubConfig.PLACEMENT_DOMAIN.get(i) == domain_id
+        ]
+    return None
+
+# ==============================================================================
+# 3. GANGGUAN (LATENCY, 429, 5XX, BODY TERPOTONG)
+# ==============================================================================
+
+class Faults:
+    def __init__(self, latency=0, jitter=0, rate_429=0.0, rate_5xx=0.0, rate_truncate=0.0,
+                 fail_first=0, seed=StubConfig.SEED):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.rate_truncate = rate_truncate
+        self.fail_first = fail_first
+        self.rnd = random.Random(seed)
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def draw(self):
+        """(jeda_detik, gangguan) untuk request berikutnya; gangguan None|429|5xx|truncate"""
+        with self.lock:
+            self.count += 1
+            delay = (self.latency + self.rnd.uniform(-self.jitter, self.jitter)) / 1000.0
+            roll = self.rnd.random()
+            if self.count <= self.fail_first:
+                fault = 503
+            elif roll < self.rate_429:
+                fault = 429
+            elif roll < self.rate_429 + self.rate_5xx:
+                fault = self.rnd.choice((500, 502, 503))
+            elif roll < self.rate_429 + self.rate_5xx + self.rate_truncate:
+                fault = "truncate"
+            else:
+                fault = None
+        return max(delay, 0.0), fault
+
+# ==============================================================================
+# 4. FIXTURE (RECORD / REPLAY)
+# ==============================================================================
+
+def fixture_path(directory, path, params):
+    """Nama file fixture dari path + parameter (urut); API key tidak ikut"""
+    query = urlencode(sorted(params.items()))
+    digest = hashlib.sha1(f"{path}?{query}".encode()).hexdigest()[:16]
+    return os.path.join(directory, f"{digest}.json")
+
+def save_fixture(directory, path, params, status, content_type, body):
+    os.makedirs(directory, exist_ok=True)
+    fixture = {
+        "path": path,
+        "params": params,
+        "status": status,
+        "content_type": content_type,
+        "body": body.decode("utf-8", errors="replace"),
+    }
+    with open(fixture_path(directory, path, params), "w", encoding="utf-8") as f:
+        json.dump(fixture, f, indent=2)
+
+def load_fixture(directory, path, params):
+    try:
+        with open(fixture_path(directory, path, params), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+# ==============================================================================
+# 5. SERVER
+# ==============================================================================
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "AdsterraStub/1.0"
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json", headers=None, truncate=False):
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            headers = dict(headers or {}, **{"Content-Encoding": "gzip"})
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, str(v))
+        if truncate:
+            # Content-Length penuh, tapi koneksi ditutup setelah separuh body
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body[:len(body) // 2] if truncate else body)
+        self.server.record(status if not truncate else "truncate", len(body))
+        if not self.server.quiet:
+            tag = "TERPOTONG" if truncate else status
+            color = Fore.GREEN if status == 200 and not truncate else Fore.YELLOW
+            print(f"{color}[STUB] {tag} {self.path} ({len(body)} B)")
+
+    def _json(self, status, obj, headers=None, truncate=False):
+        self._send(status, json.dumps(obj).encode("utf-8"), headers=headers, truncate=truncate)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query))
+
+        if url.path == "/__stats":
+            return self._json(200, self.server.stats())
+        meta = meta_items(url.path)
+        if url.path != StubConfig.STATS_PATH and meta is None:
+            return self._json(404, {"message": "Not Found"})
+
+        delay, fault = self.server.faults.draw()
+        if delay:
+            time.sleep(delay)
+        if fault == 429:
+            return self._json(429, {"message": "Too Many Requests"}, {"Retry-After": StubConfig.RETRY_AFTER})
+        if isinstance(fault, int):
+            return self._json(fault, {"message": "Server Error"})
+
+        api_key = self.headers.get("X-API-Key", "")
+        if self.server.record_dir:
+            return self._proxy(url.path, params, api_key)
+        if self.server.keys and api_key not in self.server.keys:
+            return self._json(403, {"message": "Forbidden"})
+
+        if self.server.replay_dir:
+            fixture = load_fixture(self.server.replay_dir, url.path, params)
+            if fixture is not None:
+                return self._send(fixture["status"], fixture["body"].encode("utf-8"),
+                                  fixture.get("content_type", "application/json"), truncate=fault == "truncate")
+            if not self.server.fallback:
+                return self._json(404, {"errors": [f"Fixture tidak ada untuk {url.path}?{url.query}"]})
+
+        if meta is not None:
+            return self._json(200, {"items": meta}, truncate=fault == "truncate")
+
+        errors = []
+        try:
+            start = date.fromisoformat(params.get("start_date", ""))
+            finish = date.fromisoformat(params.get("finish_date", ""))
+        except ValueError:
+            errors.append("start_date dan finish_date wajib berformat YYYY-MM-DD")
+        group_by = params.get("group_by", "date")
+        if group_by not in StubConfig.GROUP_BY:
+            errors.append(f"group_by tidak dikenal: {group_by}")
+        if errors:
+            return self._json(200, {"errors": errors})
+
+        items = synthetic_items(start, finish, group_by, _key_seed(self.server.seed, api_key),
+                                self.server.today or datetime.now(timezone.utc).date(),
+                                frozen=self.server.today is not None)
+        self._json(200, {"items": items, "dbDateTime": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")},
+                   truncate=fault == "truncate")
+
+    def _proxy(self, path, params, api_key):
+        import requests
+
+        try:
+            resp = requests.get(self.server.upstream + path, params=params, timeout=ApiConfig.TIMEOUT,
+                                headers={"X-API-Key": api_key, "User-Agent": ApiConfig.USER_AGENT})
+        except requests.exceptions.RequestException as e:
+            return self._json(502, {"message": f"Upstream gagal: {e}"})
+        content_type = resp.headers.get("Content-Type", "application/json")
+        if resp.status_code == 200:
+            save_fixture(self.server.record_dir, path, params, resp.status_code, content_type, resp.content)
+        self._send(resp.status_code, resp.content, content_type)
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, faults, keys=(), seed=StubConfig.SEED, today=None,
+                 record_dir=None, replay_dir=None, fallback=False, upstream=StubConfig.UPSTREAM, quiet=False):
+        super().__init__(address, StubHandler)
+        self.faults = faults
+        self.keys = set(keys)
+        self.seed = seed
+        self.today = today
+        self.record_dir = record_dir
+        self.replay_dir = replay_dir
+        self.fallback = fallback
+        self.upstream = upstream.rstrip("/")
+        self.quiet = quiet
+        self.counts = Counter()
+        self.bytes_out = 0
+        self.count_lock = threading.Lock()
+
+    def record(self, status, size):
+        with self.count_lock:
+            self.counts[str(status)] += 1
+            self.bytes_out += size
+
+    def stats(self):
+        with self.count_lock:
+            return {"requests": sum(self.counts.values()), "by_status": dict(self.counts), "bytes": self.bytes_out}
+
+if __name__ == "__main__":
+    init(autoreset=True)
+
+    parser = argparse.ArgumentParser(description="Server stub API Adsterra (offline)")
+    parser.add_argument("--host", default=StubConfig.HOST)
+    parser.add_argument("--port", type=int, default=StubConfig.PORT)
+    parser.add_argument("--key", action="append", help="API key yang diterima (default: key bawaan)")
+    parser.add_argument("--any-key", action="store_true", help="Terima API key apa pun")
+    parser.add_argument("--seed", type=int, default=StubConfig.SEED, help="Seed data sintetis & gangguan")
+    parser.add_argument("--today", help="Bekukan 'hari ini' (YYYY-MM-DD) agar data sepenuhnya tetap")
+    parser.add_argument("--latency", type=float, default=0, help="Jeda tiap respon (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="Variasi jeda +/- (ms)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Porsi respon 429 (0..1)")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="Porsi respon 5xx (0..1)")
+    parser.add_argument("--rate-truncate", type=float, default=0.0, help="Porsi body terpotong (0..1)")
+    parser.add_argument("--fail-first", type=int, default=0, help="N request pertama dibalas 503")
+    parser.add_argument("--record", metavar="DIR", help="Teruskan ke API asli & simpan fixture")
+    parser.add_argument("--replay", metavar="DIR", help="Layani dari fixture")
+    parser.add_argument("--fallback", action="store_true", help="Data sintetis jika fixture tidak ada")
+    parser.add_argument("--upstream", default=StubConfig.UPSTREAM, help="Host API asli untuk --record")
+    parser.add_argument("--quiet", action="store_true", help="Tanpa log per request")
+    args = parser.parse_args()
+
+    if args.record and args.replay:
+        print(f"{Fore.RED}[ERROR] --record dan --replay tidak bisa dipakai bersamaan.")
+        sys.exit(1)
+
+    faults = Faults(args.latency, args.jitter, args.rate_429, args.rate_5xx, args.rate_truncate,
+                    args.fail_first, args.seed)
+    keys = () if args.any_key else (args.key or [ApiConfig.API_KEY])
+    today = date.fromisoformat(args.today) if args.today else None
+
+    server = StubServer((args.host, args.port), faults, keys, args.seed, today,
+                        args.record, args.replay, args.fallback, args.upstream, args.quiet)
+    mode = "record" if args.record else "replay" if args.replay else "sintetis"
+    print(f"{Fore.CYAN}[STUB] Mode {mode} di http://{args.host}:{args.port}{StubConfig.STATS_PATH}")
+    print(f"{Fore.LIGHTBLACK_EX}       export ADSTERRA_BASE_URL=http://{args.host}:{args.port}{StubConfig.STATS_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n{Fore.CYAN}[STUB] Selesai: {server.stats()}")
+    finally:
+        server.server_close()
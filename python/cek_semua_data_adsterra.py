@@ -22,6 +22,7 @@ Dependencies:
 --------------------------------------------------------------------------------
 """
 
+import os
 import sys
 import json
 import requests
@@ -40,16 +41,29 @@ except ImportError as e:
     print("Solusi: Jalankan perintah 'pip install tabulate colorama requests'")
     sys.exit(1)
 
+# Modul pendamping (satu folder dengan script ini)
+from adsterra_anomaly import find_anomalies, mark_date, print_anomaly_summary
+from adsterra_spark import print_trends
+from adsterra_cache import HistoryCache
+from adsterra_records import load_records, print_records
+from adsterra_alerts import on_new_data
+from adsterra_store import open_store
+from adsterra_render import render_table
+from adsterra_net import make_session, parse_net_flags
+from adsterra_output import parse_format_flag, stream_items
+from adsterra_memory import parse_mem_flag, report_peak
+from adsterra_jsonlib import response_json
+
 # ==============================================================================
 # 1. KONFIGURASI GLOBAL (USER SETTINGS)
 # ==============================================================================
 
 class Config:
     # Kredensial API
-    API_KEY = "d99b6eb88c389817b16af23dd030f280"
+    API_KEY = os.environ.get("ADSTERRA_API_KEY", "d99b6eb88c389817b16af23dd030f280")
     
     # Endpoint API v3 (Menggunakan domain tools untuk stabilitas)
-    BASE_URL = "https://api3.adsterratools.com/publisher/stats.json"
+    BASE_URL = os.environ.get("ADSTERRA_BASE_URL", "https://api3.adsterratools.com/publisher/stats.json")
     
     # User Agent agar request terdeteksi sebagai browser/client valid
     USER_AGENT = "WahyuKurniawan_Bot/3.3 (Android/Termux)"
@@ -70,7 +84,7 @@ class AdsterraClient:
     
     def __init__(self, api_key):
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = make_session()
         
         # Konfigurasi Header HTTP
         # Token dikirim via header 'X-API-Key' (Wajib untuk API v3)
@@ -117,7 +131,7 @@ class AdsterraClient:
 
             # Parsing JSON
             if response.status_code == 200:
-                data = response.json()
+                data = response_json(response)
                 
                 # Cek logical error dari API
                 if "errors" in data and data["errors"]:
@@ -155,6 +169,30 @@ def format_number(value):
     """Format Angka: 1.000.000"""
     return f"{int(value):,}".replace(",", ".")
 
+def render_daily_row(date, imp, cpm, rev, day_anomalies):
+    """Sel satu baris tabel harian: Date | Impression | CPM | Revenue"""
+
+    # Logika Pewarnaan Baris (Highlight Profit)
+    # Jika Revenue hari itu > $0, warnai revenue hijau
+    rev_str = format_currency(rev)
+    if rev > 0:
+        rev_str = f"{Fore.GREEN}{rev_str}{Style.RESET_ALL}"
+    else:
+        rev_str = f"{Fore.LIGHTBLACK_EX}{rev_str}{Style.RESET_ALL}"
+        
+    # Jika CPM tinggi (> $0.5), tandai kuning
+    cpm_str = format_currency(cpm)
+    if cpm > 0.5:
+        cpm_str = f"{Fore.YELLOW}{cpm_str}{Style.RESET_ALL}"
+
+    # Menyusun Baris Tabel (Tanpa Clicks & CTR)
+    return [
+        mark_date(date, day_anomalies),
+        format_number(imp),
+        cpm_str,
+        rev_str
+    ]
+
 def display_clean_report(data):
     """
     Menampilkan data tanpa kolom Clicks dan CTR.
@@ -175,14 +213,22 @@ def display_clean_report(data):
     # List penampung baris tabel
     table_rows = []
     
-    # Variabel Akumulasi (Total)
-    total_imp = 0
-    total_rev = 0.0
-    # Kita tidak perlu hitung Clicks/CTR lagi
-    
     # Sorting: Urutkan dari tanggal terlama ke terbaru
     sorted_items = sorted(items, key=lambda x: x.get('date', '0000-00-00'))
 
+    # Deteksi hari tidak wajar (riwayat cache dipakai sebagai baseline) &
+    # perbarui papan rekor secara inkremental dari hari final yang baru
+    cache = HistoryCache()
+    anomalies = find_anomalies(sorted_items, cache)
+    records = load_records(cache)
+    try:
+        cache.save()
+    except OSError as e:
+        print(f"{Fore.LIGHTBLACK_EX}[CACHE] Gagal menyimpan cache: {e}")
+
+    # Simpan ke SQLite lokal; total & hari terbaik dihitung lewat query
+    store = open_store(sorted_items)
+
     print(f"\n{Fore.WHITE}Memproses {total_days} hari data transaksi...\n")
 
     for item in sorted_items:
@@ -192,55 +238,43 @@ def display_clean_report(data):
         cpm = item.get("cpm", 0.0)
         rev = item.get("revenue", 0.0)
 
-        # Update Total
-        total_imp += imp
-        total_rev += rev
-
-        # Logika Pewarnaan Baris (Highlight Profit)
-        # Jika Revenue hari itu > $0, warnai revenue hijau
-        rev_str = format_currency(rev)
-        if rev > 0:
-            rev_str = f"{Fore.GREEN}{rev_str}{Style.RESET_ALL}"
-        else:
-            rev_str = f"{Fore.LIGHTBLACK_EX}{rev_str}{Style.RESET_ALL}"
-            
-        # Jika CPM tinggi (> $0.5), tandai kuning
-        cpm_str = format_currency(cpm)
-        if cpm > 0.5:
-            cpm_str = f"{Fore.YELLOW}{cpm_str}{Style.RESET_ALL}"
-
         # Menyusun Baris Tabel (Tanpa Clicks & CTR)
-        table_rows.append([
-            date,
-            format_number(imp),
-            cpm_str,
-            rev_str
-        ])
+        table_rows.append((date, render_daily_row(date, imp, cpm, rev, anomalies.get(date))))
 
     # --- RENDER TABEL DATA ---
     headers = ["TANGGAL", "IMPRESSIONS", "CPM", "REVENUE"]
     
-    # Menggunakan format 'simple_grid' agar rapi di layar HP (Termux)
-    print(tabulate(table_rows, headers=headers, tablefmt="simple_grid", stralign="right"))
+    # Format 'simple_grid' agar rapi di layar HP (Termux); baris hari final dari render cache
+    print(render_table(table_rows, headers, store, "alltime"))
+    print_anomaly_summary(anomalies)
+    print_trends(sorted_items, "TREN ALL-TIME")
 
     # --- RENDER KOTAK TOTAL (SUMMARY) ---
     print("\n" + "="*40)
     print(f"{Back.BLUE}{Fore.WHITE}  LIFETIME REVENUE SUMMARY  {Style.RESET_ALL}")
     print("="*40)
     
-    # Menghitung Rata-rata Harian
-    avg_daily_rev = total_rev / total_days if total_days > 0 else 0
+    # Total & Rata-rata Harian (agregasi SQL)
+    totals = store.totals(sorted_items[0]["date"], sorted_items[-1]["date"])
+    total_imp = totals["impression"]
+    total_rev = totals["revenue"]
+    avg_daily_rev = total_rev / totals["days"] if totals["days"] > 0 else 0
+
+    best = store.best_days(1, sorted_items[0]["date"], sorted_items[-1]["date"])
+    store.close()
     
     summary_data = [
         ["Periode Data", f"{Config.START_DATE_ALL_TIME} s/d Hari Ini"],
         ["Total Hari Aktif", f"{total_days} Hari"],
         ["Total Impressions", format_number(total_imp)],
         ["Rata-rata Revenue/Hari", format_currency(avg_daily_rev)],
+        ["Hari Terbaik", f"{best[0][0]} ({format_currency(best[0][2])})" if best else "-"],
         ["-----------------------", "----------------"], # Separator
         ["TOTAL PENDAPATAN (ALL)", f"{Fore.GREEN}{Style.BRIGHT}{format_currency(total_rev)}{Style.RESET_ALL}"]
     ]
     
     print(tabulate(summary_data, tablefmt="plain"))
+    print_records(records)
     print("="*40 + "\n")
 
 # ==============================================================================
@@ -248,24 +282,40 @@ def display_clean_report(data):
 # ==============================================================================
 
 if __name__ == "__main__":
-    # Header Logo ASCII (Raw String)
-    print(f"\n{Fore.BLUE}{Style.BRIGHT}")
-    print(r"   _  _  _  _  _  _  _   ")
-    print(r"  / \/ \/ \/ \/ \/ \/ \  ")
-    print(r" ( A | L | L | T | I | M | E ) ")
-    print(r"  \_/\_/\_/\_/\_/\_/\_/  ")
-    print(f"{Style.RESET_ALL}")
+    # --profile / --low-data (lihat adsterra_net.py)
+    parse_net_flags()
+    # --format json|jsonl|csv|tsv (lihat adsterra_output.py)
+    fmt = parse_format_flag()
+    # --memory: puncak memori per 1.000 hari (lihat adsterra_memory.py)
+    parse_mem_flag()
+
+    if not fmt:
+        # Header Logo ASCII (Raw String)
+        print(f"\n{Fore.BLUE}{Style.BRIGHT}")
+        print(r"   _  _  _  _  _  _  _   ")
+        print(r"  / \/ \/ \/ \/ \/ \/ \  ")
+        print(r" ( A | L | L | T | I | M | E ) ")
+        print(r"  \_/\_/\_/\_/\_/\_/\_/  ")
+        print(f"{Style.RESET_ALL}")
     
-    print(f"User: Wahyu Kurniawan | Mode: Clean & Full History")
-    print("-" * 50)
+        print(f"User: Wahyu Kurniawan | Mode: Clean & Full History")
+        print("-" * 50)
 
     # Inisialisasi & Eksekusi
     client = AdsterraClient(Config.API_KEY)
     
     # Ambil data
     json_result = client.get_stats()
+
+    # Evaluasi aturan peringatan (~/.config/adsterra/alerts.json) pada data baru
+    if json_result:
+        on_new_data(json_result.get("items", []))
     
     # Tampilkan
     if json_result:
-        display_clean_report(json_result)
+        if fmt:
+            stream_items(json_result.get("items", []))
+        else:
+            display_clean_report(json_result)
+        report_peak("alltime", len(json_result.get("items", [])))
         
\ No newline at end of file
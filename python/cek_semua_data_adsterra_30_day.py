@@ -21,6 +21,7 @@ Dependencies:
 --------------------------------------------------------------------------------
 """
 
+import os
 import sys
 import json
 import requests
@@ -39,16 +40,25 @@ except ImportError as e:
     print("Solusi: Jalankan perintah 'pip install tabulate colorama requests'")
     sys.exit(1)
 
+# Modul pendamping (satu folder dengan script ini)
+from adsterra_anomaly import find_anomalies, mark_date, print_anomaly_summary
+from adsterra_spark import print_trends
+from adsterra_alerts import on_new_data
+from adsterra_store import open_store
+from adsterra_net import make_session, parse_net_flags
+from adsterra_output import parse_format_flag, stream_items
+from adsterra_jsonlib import response_json
+
 # ==============================================================================
 # 1. KONFIGURASI GLOBAL
 # ==============================================================================
 
 class Config:
     # Kredensial API
-    API_KEY = "d99b6eb88c389817b16af23dd030f280"
+    API_KEY = os.environ.get("ADSTERRA_API_KEY", "d99b6eb88c389817b16af23dd030f280")
     
     # Endpoint API v3
-    BASE_URL = "https://api3.adsterratools.com/publisher/stats.json"
+    BASE_URL = os.environ.get("ADSTERRA_BASE_URL", "https://api3.adsterratools.com/publisher/stats.json")
     
     # User Agent
     USER_AGENT = "WahyuKurniawan_Bot/3.4 (30DaysMode)"
@@ -67,7 +77,7 @@ class AdsterraClient:
     
     def __init__(self, api_key):
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = make_session()
         
         # Header Autentikasi (Wajib X-API-Key)
         self.session.headers.update({
@@ -112,7 +122,7 @@ class AdsterraClient:
             print(f"{Fore.GREEN}[SUCCESS] Data diterima dalam {duration:.2f} detik.")
 
             if response.status_code == 200:
-                data = response.json()
+                data = response_json(response)
                 if "errors" in data and data["errors"]:
                     print(f"{Fore.RED}[API ERROR] {data['errors']}")
                     return None
@@ -160,13 +170,15 @@ def display_clean_report(data):
 
     table_rows = []
     
-    # Variabel Total
-    total_imp = 0
-    total_rev = 0.0
-    
     # Sorting Tanggal
     sorted_items = sorted(items, key=lambda x: x.get('date', '0000-00-00'))
 
+    # Deteksi hari tidak wajar (riwayat cache dipakai sebagai baseline)
+    anomalies = find_anomalies(sorted_items)
+
+    # Simpan ke SQLite lokal; total dihitung lewat query
+    store = open_store(sorted_items)
+
     print(f"\n{Fore.WHITE}Menampilkan statistik harian...\n")
 
     for item in sorted_items:
@@ -175,9 +187,6 @@ def display_clean_report(data):
         cpm = item.get("cpm", 0.0)
         rev = item.get("revenue", 0.0)
 
-        total_imp += imp
-        total_rev += rev
-
         # Logika Warna Baris
         rev_str = format_currency(rev)
         if rev > 0:
@@ -190,7 +199,7 @@ def display_clean_report(data):
             cpm_str = f"{Fore.YELLOW}{cpm_str}{Style.RESET_ALL}"
 
         table_rows.append([
-            date,
+            mark_date(date, anomalies.get(date)),
             format_number(imp),
             cpm_str,
             rev_str
@@ -199,13 +208,19 @@ def display_clean_report(data):
     # Render Tabel
     headers = ["TANGGAL", "IMPRESSIONS", "CPM", "REVENUE"]
     print(tabulate(table_rows, headers=headers, tablefmt="simple_grid", stralign="right"))
+    print_anomaly_summary(anomalies)
+    print_trends(sorted_items, "TREN 30 HARI")
 
     # Render Summary
     print("\n" + "="*40)
     print(f"{Back.BLUE}{Fore.WHITE}  30 DAYS REVENUE SUMMARY  {Style.RESET_ALL}")
     print("="*40)
     
-    avg_daily_rev = total_rev / total_days if total_days > 0 else 0
+    totals = store.totals(sorted_items[0]["date"], sorted_items[-1]["date"])
+    store.close()
+    total_imp = totals["impression"]
+    total_rev = totals["revenue"]
+    avg_daily_rev = total_rev / totals["days"] if totals["days"] > 0 else 0
     
     summary_data = [
         ["Periode", "30 Hari Terakhir"],
@@ -223,21 +238,34 @@ def display_clean_report(data):
 # ==============================================================================
 
 if __name__ == "__main__":
-    # Header ASCII 30 Days
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}")
-    print(r"  ____   ___   ____    _ __   __ ____  ")
-    print(r" |___ \ / _ \ |  _ \  / \\ \ / // ___| ")
-    print(r"   __) | | | || | | |/ _ \\ V / \___ \ ")
-    print(r"  / __/| |_| || |_| / ___ \| |   ___) |")
-    print(r" |_____|\___/ |____/_/   \_\_|  |____/ ")
-    print(f"{Style.RESET_ALL}")
+    # --profile / --low-data (lihat adsterra_net.py)
+    parse_net_flags()
+    # --format json|jsonl|csv|tsv (lihat adsterra_output.py)
+    fmt = parse_format_flag()
+
+    if not fmt:
+        # Header ASCII 30 Days
+        print(f"\n{Fore.CYAN}{Style.BRIGHT}")
+        print(r"  ____   ___   ____    _ __   __ ____  ")
+        print(r" |___ \ / _ \ |  _ \  / \\ \ / // ___| ")
+        print(r"   __) | | | || | | |/ _ \\ V / \___ \ ")
+        print(r"  / __/| |_| || |_| / ___ \| |   ___) |")
+        print(r" |_____|\___/ |____/_/   \_\_|  |____/ ")
+        print(f"{Style.RESET_ALL}")
     
-    print(f"User: Wahyu Kurniawan | Mode: Last 30 Days Only")
-    print("-" * 50)
+        print(f"User: Wahyu Kurniawan | Mode: Last 30 Days Only")
+        print("-" * 50)
 
     client = AdsterraClient(Config.API_KEY)
     json_result = client.get_stats()
+
+    # Evaluasi aturan peringatan (~/.config/adsterra/alerts.json) pada data baru
+    if json_result:
+        on_new_data(json_result.get("items", []))
     
     if json_result:
-        display_clean_report(json_result)
+        if fmt:
+            stream_items(json_result.get("items", []))
+        else:
+            display_clean_report(json_result)
         
\ No newline at end of file
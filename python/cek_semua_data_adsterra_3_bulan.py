@@ -22,9 +22,9 @@ Dependencies:
 --------------------------------------------------------------------------------
 """
 
+import os
 import sys
 import json
-import requests
 from datetime import datetime, timedelta
 import time
 
@@ -38,13 +38,23 @@ except ImportError:
     print("Run: pip install tabulate colorama requests")
     sys.exit(1)
 
+# Modul pendamping (satu folder dengan script ini)
+from adsterra_anomaly import find_anomalies, mark_date, print_anomaly_summary
+from adsterra_spark import print_trends
+from adsterra_alerts import on_new_data
+from adsterra_store import open_store
+from adsterra_render import render_table
+from adsterra_net import make_session, parse_net_flags
+from adsterra_output import parse_format_flag, stream_items
+from adsterra_jsonlib import response_json
+
 # ==============================================================================
 # 1. KONFIGURASI
 # ==============================================================================
 
 class Config:
-    API_KEY = "d99b6eb88c389817b16af23dd030f280"
-    BASE_URL = "https://api3.adsterratools.com/publisher/stats.json"
+    API_KEY = os.environ.get("ADSTERRA_API_KEY", "d99b6eb88c389817b16af23dd030f280")
+    BASE_URL = os.environ.get("ADSTERRA_BASE_URL", "https://api3.adsterratools.com/publisher/stats.json")
     USER_AGENT = "WahyuBot/4.1 (MonthlyAvgDaily)"
     
     # 90 Hari (3 Bulan)
@@ -56,7 +66,7 @@ class Config:
 
 class AdsterraClient:
     def __init__(self, api_key):
-        self.session = requests.Session()
+        self.session = make_session()
         self.session.headers.update({
             "X-API-Key": api_key,
             "User-Agent": Config.USER_AGENT,
@@ -84,7 +94,7 @@ class AdsterraClient:
             
             print(f"{Fore.GREEN}[SUCCESS] Data diterima ({duration:.2f} detik).")
             if resp.status_code == 200:
-                return resp.json()
+                return response_json(resp)
             return None
         except Exception as e:
             print(f"{Fore.RED}[CONN] Error: {e}")
@@ -116,6 +126,18 @@ def get_indo_month(date_str):
     except:
         return date_str
 
+def render_daily_row(date, imp, cpm, rev, day_anomalies):
+    """Sel satu baris tabel harian"""
+    rev_str = format_usd(rev)
+    if rev > 12.0: rev_str = f"{Fore.GREEN}{Style.BRIGHT}{rev_str}{Style.RESET_ALL}"
+    elif rev > 0: rev_str = f"{Fore.GREEN}{rev_str}{Style.RESET_ALL}"
+    else: rev_str = f"{Fore.LIGHTBLACK_EX}{rev_str}{Style.RESET_ALL}"
+    
+    cpm_str = format_usd(cpm)
+    if cpm > 0.8: cpm_str = f"{Fore.YELLOW}{cpm_str}{Style.RESET_ALL}"
+
+    return [mark_date(date, day_anomalies), format_num(imp), cpm_str, rev_str]
+
 def show_report(data):
     if not data or "items" not in data:
         print(f"{Fore.RED}Data kosong.")
@@ -123,12 +145,15 @@ def show_report(data):
 
     items = data["items"]
     items = sorted(items, key=lambda x: x.get('date', '0000-00-00'))
+
+    # Deteksi hari tidak wajar (riwayat cache dipakai sebagai baseline)
+    anomalies = find_anomalies(items)
+
+    # Simpan ke SQLite lokal; rekap bulanan dihitung lewat GROUP BY
+    store = open_store(items)
     
     daily_rows = []
     
-    # Dictionary Akumulasi: {'2026-02': {'imp': 0, 'rev': 0, 'days': 0}}
-    monthly_agg = {} 
-    
     print(f"\n{Fore.WHITE}Memproses statistik...\n")
 
     for item in items:
@@ -139,30 +164,15 @@ def show_report(data):
         rev = float(item.get("revenue", 0.0))
 
         # 1. TABEL HARIAN
-        rev_str = format_usd(rev)
-        if rev > 12.0: rev_str = f"{Fore.GREEN}{Style.BRIGHT}{rev_str}{Style.RESET_ALL}"
-        elif rev > 0: rev_str = f"{Fore.GREEN}{rev_str}{Style.RESET_ALL}"
-        else: rev_str = f"{Fore.LIGHTBLACK_EX}{rev_str}{Style.RESET_ALL}"
-        
-        cpm_str = format_usd(cpm)
-        if cpm > 0.8: cpm_str = f"{Fore.YELLOW}{cpm_str}{Style.RESET_ALL}"
-
-        daily_rows.append([date, format_num(imp), cpm_str, rev_str])
-
-        # 2. LOGIKA META BULANAN
-        month_key = date[:7] # Ambil YYYY-MM
-        
-        if month_key not in monthly_agg:
-            monthly_agg[month_key] = {'imp': 0, 'rev': 0, 'days': 0}
-            
-        monthly_agg[month_key]['imp'] += imp
-        monthly_agg[month_key]['rev'] += rev
-        monthly_agg[month_key]['days'] += 1 # Tambah 1 hari setiap kali data ditemukan
+        daily_rows.append((date, render_daily_row(date, imp, cpm, rev, anomalies.get(date))))
 
     # --- RENDER TABEL HARIAN ---
     print(f"{Fore.CYAN}=== RINCIAN HARIAN (90 HARI TERAKHIR) ==={Style.RESET_ALL}")
     headers_daily = ["TANGGAL", "IMPRESSIONS", "CPM", "REVENUE"]
-    print(tabulate(daily_rows, headers=headers_daily, tablefmt="simple_grid", stralign="right"))
+    # Baris hari final diambil dari render cache (lihat adsterra_render.py)
+    print(render_table(daily_rows, headers_daily, store, "3bulan"))
+    print_anomaly_summary(anomalies)
+    print_trends(items, "TREN 90 HARI")
 
     # --- RENDER TABEL META BULANAN (UPDATE FITUR BARU) ---
     print("\n" + "="*60)
@@ -170,23 +180,23 @@ def show_report(data):
     print("="*60)
     
     monthly_rows = []
-    sorted_months = sorted(monthly_agg.keys(), reverse=True)
+    # Rekap per bulan (terbaru dulu); bulan yang sudah tutup dibaca dari snapshot
+    monthly_agg = store.period_series(items[0]["date"], items[-1]["date"]) if items else []
+    store.close()
     
     grand_total_rev = 0
     grand_total_imp = 0
 
-    for m_key in sorted_months:
-        data_bulan = monthly_agg[m_key]
+    for data_bulan in monthly_agg:
+        m_key = data_bulan['month']
         
-        t_imp = data_bulan['imp']
-        t_rev = data_bulan['rev']
+        t_imp = data_bulan['impression']
+        t_rev = data_bulan['revenue']
         t_days = data_bulan['days'] # Jumlah hari aktif di bulan itu
         
-        # Hitung Real CPM
-        real_avg_cpm = (t_rev / t_imp * 1000) if t_imp > 0 else 0
-        
-        # Hitung Rata-rata Revenue Per Hari (Fitur Baru)
-        avg_daily_rev = (t_rev / t_days) if t_days > 0 else 0
+        # Real CPM & Rata-rata Revenue Per Hari (Fitur Baru)
+        real_avg_cpm = data_bulan['cpm']
+        avg_daily_rev = data_bulan['avg_daily']
         
         # Formatting Tampilan
         nama_bulan = get_indo_month(m_key)
@@ -221,12 +231,25 @@ def show_report(data):
 # ==============================================================================
 
 if __name__ == "__main__":
-    print(f"\n{Fore.MAGENTA}{Style.BRIGHT}ADSTERRA ANALYTICS PRO (v4.1){Style.RESET_ALL}")
-    print("-" * 35)
-    
+    # --profile / --low-data (lihat adsterra_net.py)
+    parse_net_flags()
+    # --format json|jsonl|csv|tsv (lihat adsterra_output.py)
+    fmt = parse_format_flag()
+
+    if not fmt:
+        print(f"\n{Fore.MAGENTA}{Style.BRIGHT}ADSTERRA ANALYTICS PRO (v4.1){Style.RESET_ALL}")
+        print("-" * 35)
+
     client = AdsterraClient(Config.API_KEY)
     res = client.get_stats()
+
+    # Evaluasi aturan peringatan (~/.config/adsterra/alerts.json) pada data baru
+    if res:
+        on_new_data(res.get("items", []))
     
     if res:
-        show_report(res)
+        if fmt:
+            stream_items(res.get("items", []))
+        else:
+            show_report(res)
         
\ No newline at end of file
@@ -19,9 +19,9 @@ Dependencies:
 --------------------------------------------------------------------------------
 """
 
+import os
 import sys
 import json
-import requests
 from datetime import datetime, timedelta
 import time
 
@@ -35,13 +35,22 @@ except ImportError:
     print("Run: pip install tabulate colorama requests")
     sys.exit(1)
 
+# Modul pendamping (satu folder dengan script ini)
+from adsterra_anomaly import find_anomalies, mark_date, print_anomaly_summary
+from adsterra_spark import print_trends
+from adsterra_alerts import on_new_data
+from adsterra_store import open_store
+from adsterra_net import make_session, parse_net_flags
+from adsterra_output import parse_format_flag, stream_items
+from adsterra_jsonlib import response_json
+
 # ==============================================================================
 # 1. KONFIGURASI (8 DAYS MODE)
 # ==============================================================================
 
 class Config:
-    API_KEY = "d99b6eb88c389817b16af23dd030f280"
-    BASE_URL = "https://api3.adsterratools.com/publisher/stats.json"
+    API_KEY = os.environ.get("ADSTERRA_API_KEY", "d99b6eb88c389817b16af23dd030f280")
+    BASE_URL = os.environ.get("ADSTERRA_BASE_URL", "https://api3.adsterratools.com/publisher/stats.json")
     USER_AGENT = "WahyuBot/3.7 (8DaysMode)"
     
     # MUNDUR 7 HARI DARI HARI INI
@@ -54,7 +63,7 @@ class Config:
 
 class AdsterraClient:
     def __init__(self, api_key):
-        self.session = requests.Session()
+        self.session = make_session()
         self.session.headers.update({
             "X-API-Key": api_key,
             "User-Agent": Config.USER_AGENT,
@@ -86,7 +95,7 @@ class AdsterraClient:
             print(f"{Fore.GREEN}[SUCCESS] Data diterima dalam {duration:.2f} detik.")
 
             if resp.status_code == 200:
-                return resp.json()
+                return response_json(resp)
             else:
                 print(f"{Fore.RED}[ERROR] HTTP Code: {resp.status_code}")
                 return None
@@ -112,10 +121,17 @@ def show_report(data):
     items = data["items"]
     # Urutkan tanggal (Ascending)
     items = sorted(items, key=lambda x: x.get('date', '0000-00-00'))
+    if not items:
+        print(f"{Fore.RED}Data kosong.")
+        return
+
+    # Deteksi hari tidak wajar (riwayat cache dipakai sebagai baseline)
+    anomalies = find_anomalies(items)
+
+    # Simpan ke SQLite lokal; total dihitung lewat query
+    store = open_store(items)
     
     table_data = []
-    total_rev = 0.0
-    total_imp = 0
     
     print(f"\n{Fore.WHITE}Rincian Harian (8 Hari):\n")
 
@@ -125,9 +141,6 @@ def show_report(data):
         cpm = item.get("cpm", 0.0)
         rev = item.get("revenue", 0.0)
 
-        total_rev += rev
-        total_imp += imp
-
         # --- LOGIKA PEWARNAAN ---
         
         # Revenue Hijau jika > 0
@@ -145,7 +158,7 @@ def show_report(data):
             cpm_str = f"{Fore.YELLOW}{cpm_str}{Style.RESET_ALL}"
 
         table_data.append([
-            date,
+            mark_date(date, anomalies.get(date)),
             format_num(imp),
             cpm_str,
             rev_str
@@ -154,15 +167,22 @@ def show_report(data):
     # Tampilkan Tabel
     headers = ["TANGGAL", "IMPRESSIONS", "CPM", "REVENUE"]
     print(tabulate(table_data, headers=headers, tablefmt="simple_grid", stralign="right"))
+    print_anomaly_summary(anomalies)
+    print_trends(items, "TREN 8 HARI")
 
     # Summary Box
     print("\n" + "="*35)
     print(f"{Back.BLUE}{Fore.WHITE} TOTAL PENDAPATAN (8 HARI) {Style.RESET_ALL}")
     print("="*35)
     
+    totals = store.totals(items[0]["date"], items[-1]["date"])
+    store.close()
+    total_imp = totals["impression"]
+    total_rev = totals["revenue"]
+
     summary = [
         ["Total Impressions", format_num(total_imp)],
-        ["Rata-rata Harian", format_usd(total_rev / len(items) if items else 0)],
+        ["Rata-rata Harian", format_usd(total_rev / totals["days"] if totals["days"] else 0)],
         ["TOTAL REVENUE", f"{Fore.GREEN}{Style.BRIGHT}{format_usd(total_rev)}{Style.RESET_ALL}"]
     ]
     
@@ -174,21 +194,34 @@ def show_report(data):
 # ==============================================================================
 
 if __name__ == "__main__":
-    # Header ASCII "8 DAYS"
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}")
-    print(r"   ___    ____    ____  __   __ ____  ")
-    print(r"  ( _ )  |  _ \  / /\ \ \ \ / // ___| ")
-    print(r"  / _ \  | | | |/ /  \ \ \ V / \___ \ ")
-    print(r" | (_) | | |_| / /   / /  | |   ___) |")
-    print(r"  \___/  |____/_/   /_/   |_|  |____/ ")
-    print(f"{Style.RESET_ALL}")
-    
-    print(f"User: Wahyu Kurniawan | Target: 8 Days (Inc. Today)")
-    print("-" * 50)
+    # --profile / --low-data (lihat adsterra_net.py)
+    parse_net_flags()
+    # --format json|jsonl|csv|tsv (lihat adsterra_output.py)
+    fmt = parse_format_flag()
+
+    if not fmt:
+        # Header ASCII "8 DAYS"
+        print(f"\n{Fore.CYAN}{Style.BRIGHT}")
+        print(r"   ___    ____    ____  __   __ ____  ")
+        print(r"  ( _ )  |  _ \  / /\ \ \ \ / // ___| ")
+        print(r"  / _ \  | | | |/ /  \ \ \ V / \___ \ ")
+        print(r" | (_) | | |_| / /   / /  | |   ___) |")
+        print(r"  \___/  |____/_/   /_/   |_|  |____/ ")
+        print(f"{Style.RESET_ALL}")
     
+        print(f"User: Wahyu Kurniawan | Target: 8 Days (Inc. Today)")
+        print("-" * 50)
+
     client = AdsterraClient(Config.API_KEY)
     res = client.get_8days_stats()
+
+    # Evaluasi aturan peringatan (~/.config/adsterra/alerts.json) pada data baru
+    if res:
+        on_new_data(res.get("items", []))
     
     if res:
-        show_report(res)
+        if fmt:
+            stream_items(res.get("items", []))
+        else:
+            show_report(res)
         
\ No newline at end of file
@@ -14,21 +14,33 @@ Description:
 
     [FITUR BARU]
     - Auto-detect 'Best Day' (Hari dengan pendapatan tertinggi).
+    - Papan rekor di meta.highlights.records (top/bottom hari, bulan &
+      periode terbaik, streak) dari adsterra_records, tanpa scan ulang.
     - Menghitung rata-rata harian secara otomatis di Meta.
     - Output harian ramping (hemat size file).
+    - Decode/encode JSON memakai orjson/ujson jika terpasang (adsterra_jsonlib).
+    - --format json|jsonl|csv|tsv: baris harian langsung ke stdout (tanpa file).
+    - --memory: puncak memori per 1.000 hari (adsterra_memory).
 
 Dependencies:
-    - requests, json
+    - requests, json (opsional: orjson / ujson)
 --------------------------------------------------------------------------------
 """
 
 import sys
-import json
-import requests
 import os
 import time
 from datetime import datetime
 
+# Modul pendamping (satu folder dengan script ini)
+from adsterra_net import make_session, parse_net_flags
+from adsterra_jsonlib import response_json, dumps
+from adsterra_cache import HistoryCache
+from adsterra_records import load_records, highlights
+from adsterra_fileio import atomic_write
+from adsterra_output import parse_format_flag, stream_rows, item_rows
+from adsterra_memory import parse_mem_flag, report_peak
+
 # Pewarnaan Terminal
 class Col:
     CYAN = '\033[96m'
@@ -43,8 +55,8 @@ class Col:
 # ==============================================================================
 
 class Config:
-    API_KEY = "d99b6eb88c389817b16af23dd030f280"
-    BASE_URL = "https://api3.adsterratools.com/publisher/stats.json"
+    API_KEY = os.environ.get("ADSTERRA_API_KEY", "d99b6eb88c389817b16af23dd030f280")
+    BASE_URL = os.environ.get("ADSTERRA_BASE_URL", "https://api3.adsterratools.com/publisher/stats.json")
     START_DATE = "2022-10-01" # Sejak Awal
     OUTPUT_DIR = "output_json"
 
@@ -59,7 +71,7 @@ def get_stats_from_api():
     print(f"\n{Col.BOLD}=== EKSPOR DATA ADSTERRA (CLEAN MODE) ==={Col.RESET}")
     print(f"{Col.CYAN}[API] Mengambil data dari {Config.START_DATE} s/d {end_date}...{Col.RESET}")
 
-    session = requests.Session()
+    session = make_session()
     session.headers.update({
         "X-API-Key": Config.API_KEY,
         "User-Agent": "AdsterraCleanExporter/3.0"
@@ -74,7 +86,7 @@ def get_stats_from_api():
     try:
         resp = session.get(Config.BASE_URL, params=params, timeout=60)
         if resp.status_code == 200:
-            data = resp.json()
+            data = response_json(resp)
             if "items" in data:
                 return data["items"]
         
@@ -84,11 +96,23 @@ def get_stats_from_api():
         print(f"{Col.RED}[CONN ERROR] {e}{Col.RESET}")
         return None
 
-def process_smart_json(raw_items):
+def update_records(raw_items):
+    """Simpan hari final ke cache riwayat lalu ambil papan rekor (inkremental)"""
+    cache = HistoryCache()
+    cache.merge(raw_items)
+    records = load_records(cache)
+    try:
+        cache.save()
+    except OSError as e:
+        print(f"{Col.YELLOW}[CACHE] Gagal menyimpan cache: {e}{Col.RESET}")
+    return records
+
+def process_smart_json(raw_items, records=None):
     """
     Mengolah data:
     - Meta: Detail & Lengkap
     - Items: Bersih & Minimalis
+    records: papan rekor (adsterra_records); tanpa ini 'Best Day' dicari manual
     """
     print(f"{Col.YELLOW}[PROCESS] Mengkalkulasi statistik & membersihkan data...{Col.RESET}")
 
@@ -117,8 +141,8 @@ def process_smart_json(raw_items):
         total_imp += imp
         total_cpm_accum += cpm
         
-        # Cek Rekor (Best Day)
-        if rev > best_day["revenue"]:
+        # Cek Rekor (Best Day) jika papan rekor tidak tersedia
+        if records is None and rev > best_day["revenue"]:
             best_day = {"date": date, "revenue": rev, "cpm": cpm}
 
         # Masukkan ke list bersih (HANYA 4 FIELD INI)
@@ -129,6 +153,10 @@ def process_smart_json(raw_items):
             "revenue": rev
         })
 
+    if records is not None and records.top_days():
+        date, rev, cpm = records.top_days()[0]
+        best_day = {"date": date, "revenue": rev, "cpm": cpm}
+
     # 3. Hitung Rata-rata
     days_count = len(clean_daily_data)
     avg_rev = total_rev / days_count if days_count > 0 else 0
@@ -163,6 +191,10 @@ def process_smart_json(raw_items):
         "daily_stats": clean_daily_data
     }
 
+    # Top/bottom hari, bulan & periode terbaik, streak
+    if records is not None:
+        final_structure["meta"]["highlights"]["records"] = highlights(records)
+
     return final_structure
 
 def save_file(data):
@@ -173,8 +205,8 @@ def save_file(data):
     filepath = os.path.join(Config.OUTPUT_DIR, filename)
 
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2) # Indent 2 agar hemat space tapi terbaca
+        # Indent 2 agar hemat space tapi terbaca; temp + rename agar file tidak pernah setengah jadi
+        atomic_write(filepath, dumps(data, indent=True))
             
         print("-" * 50)
         print(f"{Col.GREEN}✅ SUKSES! File JSON tersimpan.{Col.RESET}")
@@ -190,8 +222,19 @@ def save_file(data):
 # ==============================================================================
 
 if __name__ == "__main__":
+    # --profile / --low-data (lihat adsterra_net.py)
+    parse_net_flags()
+    # --format json|jsonl|csv|tsv: baris daily_stats ke stdout, bukan ke file
+    fmt = parse_format_flag()
+    # --memory: puncak memori per 1.000 hari (lihat adsterra_memory.py)
+    parse_mem_flag()
+
     raw = get_stats_from_api()
-    if raw:
-        clean_json = process_smart_json(raw)
+    if raw and fmt:
+        stream_rows(item_rows(raw), ("date", "impression", "cpm", "revenue"))
+    elif raw:
+        clean_json = process_smart_json(raw, update_records(raw))
         save_file(clean_json)
+    if raw:
+        report_peak("export", len(raw))
         
\ No newline at end of file
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Script: Git Quick Sync 'p' (v2.0)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Pengganti versi bash dari perintah 'p' (pull, add ., commit, push).
+
+    [ALUR BARU]
+    1. Cek perubahan dulu (git status --porcelain -z).
+    2. Stage HANYA path yang berubah, bukan 'git add .' ke seluruh tree.
+    3. Commit hanya jika ada perubahan (tidak ada commit kosong).
+    4. Satu kali 'git fetch', lalu fast-forward atau rebase ke upstream.
+    5. Push hanya jika ada commit lokal yang belum ada di remote.
+    6. Laporan durasi per langkah untuk melihat bagian mana yang lambat.
+
+Penggunaan:
+    p ["pesan commit"] [--no-fetch]
+
+Dependencies:
+    - git (Python standard library saja)
+--------------------------------------------------------------------------------
+"""
+
+import sys
+import time
+import argparse
+import subprocess
+from contextlib import contextmanager
+
+# Pewarnaan Terminal (disamakan dengan script bash 'p')
+class Col:
+    RESET = '\033[0m'
+    RED = '\033[0;31m'
+    GREEN = '\033[0;32m'
+    YELLOW = '\033[1;33m'
+    CYAN = '\033[0;36m'
+    GRAY = '\033[0;90m'
+
+# ==============================================================================
+# 1. KONFIGURASI
+# ==============================================================================
+
+class Config:
+    DEFAULT_MESSAGE = "p"
+
+# ==============================================================================
+# 2. GIT RUNNER + PENCATAT WAKTU
+# ==============================================================================
+
+class GitError(Exception):
+    """Perintah git gagal (exit code != 0)"""
+
+class StepTimer:
+    """Mencatat durasi setiap langkah sinkronisasi"""
+
+    def __init__(self):
+        self.steps = []
+
+    @contextmanager
+    def step(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, time.perf_counter() - start, None))
+
+    def skip(self, name, reason):
+        self.steps.append((name, None, reason))
+
+    def report(self):
+        print(f"\n{Col.CYAN}[*] Laporan Waktu:{Col.RESET}")
+        total = 0.0
+        for name, duration, reason in self.steps:
+            if duration is None:
+                print(f"    {name:<10} {Col.GRAY}{'-':>7}     ({reason}){Col.RESET}")
+                continue
+            total += duration
+            print(f"    {name:<10} {duration * 1000:>7.0f} ms")
+        print(f"    {'TOTAL':<10} {total * 1000:>7.0f} ms")
+
+def git(*args, cwd=".", input_data=None, check=True):
+    """Menjalankan git; melempar GitError jika gagal dan `check` aktif"""
+    result = subprocess.run(["git", *args], cwd=cwd, input=input_data,
+                            capture_output=True, text=True)
+    if check and result.returncode != 0:
+        raise GitError(f"git {' '.join(args)}: {result.stderr.strip() or result.stdout.strip()}")
+    return result
+
+# ==============================================================================
+# 3. LANGKAH-LANGKAH SINKRONISASI
+# ==============================================================================
+
+def repo_root(cwd="."):
+    """Folder teratas repository (path di `git status` relatif ke sini)"""
+    return git("rev-parse", "--show-toplevel", cwd=cwd).stdout.strip()
+
+def changed_paths(cwd="."):
+    """Semua path yang berubah (relatif ke root repo) (termasuk untracked, hapus, dan kedua sisi rename)"""
+    out = git("status", "--porcelain", "-z", "--untracked-files=all", cwd=cwd).stdout
+    paths = []
+    entries = iter(out.split("\0"))
+    for entry in entries:
+        if not entry:
+            continue
+        status, path = entry[:2], entry[3:]
+        paths.append(path)
+        # Entri rename/copy diikuti path asal; penghapusannya sudah ada di
+        # index (rename ter-stage), jadi cukup dilewati
+        if status[0] in "RC":
+            next(entries, "")
+    return paths
+
+def stage_paths(paths, cwd="."):
+    """
+    Stage daftar path lewat stdin (aman untuk ribuan file & nama aneh).
+    Path relatif ke root repo (:(top)), jadi benar dari subfolder mana pun.
+    """
+    git("add", "-A", "--pathspec-from-file=-", "--pathspec-file-nul",
+        cwd=cwd, input_data="".join(f":(top,literal){p}\0" for p in paths))
+
+def get_upstream(cwd="."):
+    """Mengembalikan (remote, branch_remote) dari upstream branch aktif, atau None"""
+    result = git("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}", cwd=cwd, check=False)
+    if result.returncode != 0:
+        return None
+    remote = git("config", "--get", f"branch.{current_branch(cwd)}.remote", cwd=cwd, check=False).stdout.strip()
+    upstream = result.stdout.strip()
+    return remote or upstream.split("/", 1)[0], upstream
+
+def current_branch(cwd="."):
+    return git("rev-parse", "--abbrev-ref", "HEAD", cwd=cwd).stdout.strip()
+
+def ahead_behind(cwd="."):
+    out = git("rev-list", "--left-right", "--count", "HEAD...@{u}", cwd=cwd).stdout.split()
+    return int(out[0]), int(out[1])
+
+def sync(message=Config.DEFAULT_MESSAGE, fetch=True, cwd=".", timer=None, log=print):
+    """
+    Menjalankan satu siklus sinkronisasi. Mengembalikan dict ringkasan:
+    {'changed': n_path, 'committed': bool, 'pulled': n_commit, 'pushed': n_commit}
+    """
+    timer = timer or StepTimer()
+    summary = {"changed": 0, "committed": False, "pulled": 0, "pushed": 0}
+
+    with timer.step("status"):
+        # Semua perintah dijalankan dari root repo, walau 'p' dipanggil dari subfolder
+        cwd = repo_root(cwd)
+        paths = changed_paths(cwd)
+        upstream = get_upstream(cwd)
+    summary["changed"] = len(paths)
+
+    # --- STAGE & COMMIT (hanya jika ada perubahan) ---
+    if paths:
+        log(f"{Col.GREEN}[*] Stage {len(paths)} path yang berubah...{Col.RESET}")
+        with timer.step("stage"):
+            stage_paths(paths, cwd)
+        log(f"{Col.GREEN}[*] Git Commit dengan pesan: '{message}'...{Col.RESET}")
+        with timer.step("commit"):
+            git("commit", "-q", "-m", message, cwd=cwd)
+        summary["committed"] = True
+    else:
+        log(f"{Col.YELLOW}[INFO] Working tree bersih, tidak ada yang di-commit.{Col.RESET}")
+        timer.skip("stage", "tidak ada perubahan")
+        timer.skip("commit", "tidak ada perubahan")
+
+    if upstream is None:
+        log(f"{Col.YELLOW}[WARN] Branch ini belum punya upstream, fetch & push dilewati.{Col.RESET}")
+        timer.skip("fetch", "tanpa upstream")
+        timer.skip("push", "tanpa upstream")
+        return summary
+
+    remote, upstream_ref = upstream
+
+    # --- SATU KALI FETCH + INTEGRASI ---
+    if fetch:
+        log(f"{Col.GREEN}[*] Git Fetch dari {upstream_ref}...{Col.RESET}")
+        with timer.step("fetch"):
+            git("fetch", "-q", remote, cwd=cwd)
+    else:
+        timer.skip("fetch", "--no-fetch")
+
+    with timer.step("integrate"):
+        ahead, behind = ahead_behind(cwd)
+        if behind and not ahead:
+            git("merge", "-q", "--ff-only", "@{u}", cwd=cwd)
+            log(f"{Col.GREEN}[*] Fast-forward {behind} commit dari remote.{Col.RESET}")
+        elif behind:
+            log(f"{Col.GREEN}[*] Rebase {ahead} commit lokal di atas {behind} commit remote...{Col.RESET}")
+            result = git("rebase", "-q", "@{u}", cwd=cwd, check=False)
+            if result.returncode != 0:
+                git("rebase", "--abort", cwd=cwd, check=False)
+                raise GitError(f"Rebase konflik, dibatalkan. Selesaikan manual dengan 'git pull --rebase'.\n{result.stderr.strip()}")
+        summary["pulled"] = behind
+
+    # --- PUSH (hanya jika ada commit lokal) ---
+    if ahead:
+        log(f"{Col.GREEN}[*] Git Push {ahead} commit ke {upstream_ref}...{Col.RESET}")
+        with timer.step("push"):
+            git("push", "-q", remote, f"HEAD:{upstream_ref.split('/', 1)[1]}", cwd=cwd)
+        summary["pushed"] = ahead
+    else:
+        timer.skip("push", "tidak ada commit baru")
+
+    return summary
+
+# ==============================================================================
+# 4. MAIN
+# ==============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Git Quick Sync (p)")
+    parser.add_argument("message", nargs="?", default=Config.DEFAULT_MESSAGE, help="Pesan commit (default: 'p')")
+    parser.add_argument("--no-fetch", action="store_true", help="Lewati fetch (tanpa jaringan kecuali push)")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    timer = StepTimer()
+
+    try:
+        sync(args.message, fetch=not args.no_fetch, timer=timer)
+    except GitError as e:
+        print(f"{Col.RED}[ERROR] {e}{Col.RESET}")
+        timer.report()
+        sys.exit(1)
+
+    timer.report()
+    print(f"{Col.GREEN}[*] Selesai!{Col.RESET}")
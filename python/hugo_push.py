@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Script: Hugo Smart Update Date - Watch Mode (v1.0)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Versi long-running dari perintah 'push'. Script ini memantau folder konten
+    Hugo dan langsung memperbarui parameter 'date:' di Front Matter setiap kali
+    file Markdown (.md) disimpan, tanpa perlu memindai ulang seluruh folder.
+
+    [LOGIKA BATCH]
+    - Event simpan beruntun (auto-save editor) digabung menjadi satu antrean.
+    - Commit + Push hanya dijalankan setelah folder "tenang" selama
+      DEBOUNCE_SEC detik, atau paling lambat setiap MAX_BATCH_SEC detik.
+    - Remote tidak menerima satu push per sekali simpan.
+
+    [MODE PEMANTAUAN]
+    - inotify (Linux/Android) via ctypes, tanpa library tambahan.
+    - Fallback polling mtime jika inotify tidak tersedia.
+
+Penggunaan:
+    push --watch
+    python3 hugo_push.py --watch [--target DIR] [--debounce DETIK] [--no-push] [--poll]
+
+Dependencies:
+    - git (Python standard library saja)
+--------------------------------------------------------------------------------
+"""
+
+import os
+import re
+import sys
+import time
+import struct
+import select
+import argparse
+import subprocess
+from datetime import datetime
+
+# Pewarnaan Terminal (disamakan dengan script bash 'push')
+class Col:
+    RESET = '\033[0m'
+    RED = '\033[1;31m'
+    GREEN = '\033[1;32m'
+    CYAN = '\033[1;36m'
+    YELLOW = '\033[1;33m'
+    MAGENTA = '\033[1;35m'
+    BLUE = '\033[1;34m'
+
+# ==============================================================================
+# 1. KONFIGURASI
+# ==============================================================================
+
+class Config:
+    TARGET_DIR = "./content/game"
+
+    # Offset zona waktu yang ditulis ke Front Matter (WIB)
+    TZ_SUFFIX = "+07:00"
+
+    # Commit dijalankan setelah tidak ada event simpan selama N detik
+    DEBOUNCE_SEC = 30
+
+    # Batas maksimal antrean ditahan walau event terus berdatangan
+    MAX_BATCH_SEC = 300
+
+    # Interval pemindaian untuk mode polling (fallback)
+    POLL_INTERVAL_SEC = 2
+
+# ==============================================================================
+# 2. FRONT MATTER DATE UPDATER
+# ==============================================================================
+
+# Baris pertama 'date:' / 'date =' di Front Matter (YAML atau TOML)
+DATE_LINE_RE = re.compile(r"^(date[ \t]*([:=])[ \t]*)(.*?)([ \t]*)$")
+
+def format_hugo_date(mtime):
+    """Format ISO 8601 sama seperti `date -r FILE "+%Y-%m-%dT%H:%M:%S+07:00"`"""
+    return datetime.fromtimestamp(mtime).strftime("%Y-%m-%dT%H:%M:%S") + Config.TZ_SUFFIX
+
+def update_front_matter_date(path):
+    """
+    Menyelaraskan 'date' di Front Matter dengan waktu modifikasi file.
+    Mengembalikan tuple (nilai_lama, nilai_baru) jika file diubah, None jika
+    sudah sinkron atau tidak memiliki baris 'date'.
+    """
+    st = os.stat(path)
+    new_date_str = format_hugo_date(st.st_mtime)
+
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+
+    for idx, line in enumerate(lines):
+        body = line.rstrip("\r\n")
+        match = DATE_LINE_RE.match(body)
+        if not match:
+            continue
+
+        prefix, _sep, old_val, trailing = match.groups()
+        quote = old_val[0] if old_val[:1] in ("'", '"') else ""
+        old_val_raw = old_val.strip("'\"")
+
+        # Bandingkan 16 karakter pertama (YYYY-MM-DDTHH:MM), sama seperti 'push'
+        if new_date_str[:16] == old_val_raw[:16]:
+            return None
+
+        eol = line[len(body):]
+        lines[idx] = f"{prefix}{quote}{new_date_str}{quote}{trailing}{eol}"
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+
+        # Kembalikan mtime asli agar 'date' tetap mencerminkan waktu simpan
+        # editor, dan event tulis dari script ini tidak memicu update ulang.
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        return old_val_raw, new_date_str
+
+    return None
+
+# ==============================================================================
+# 3. GIT HELPER
+# ==============================================================================
+
+def git(*args, cwd="."):
+    """Menjalankan perintah git dan mengembalikan CompletedProcess"""
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+
+def changed_markdown_files(target_dir, cwd="."):
+    """
+    Daftar file .md di dalam `target_dir` yang modified/untracked menurut Git
+    (sama seperti script 'push'). git status me-refresh cache stat index lebih
+    dulu, jadi file yang hanya tersentuh tanpa perubahan isi tidak ikut.
+    """
+    result = git("status", "--porcelain", "-z", "--untracked-files=all", "--", target_dir, cwd=cwd)
+    if result.returncode != 0:
+        return []
+
+    files = []
+    entries = iter(result.stdout.split("\0"))
+    for entry in entries:
+        if not entry:
+            continue
+        status, path = entry[:2], entry[3:]
+        # Entri rename/copy diikuti path asal, buang field tersebut
+        if status[0] in "RC":
+            next(entries, None)
+        if "D" in status or not path.endswith(".md"):
+            continue
+        full_path = os.path.join(cwd, path)
+        if os.path.isfile(full_path):
+            files.append(os.path.normpath(full_path))
+    return files
+
+def unpushed_commits(cwd="."):
+    """Jumlah commit lokal yang belum ada di upstream (0 jika tanpa upstream)"""
+    result = git("rev-list", "--count", "@{u}..HEAD", cwd=cwd)
+    if result.returncode != 0:
+        return 0
+    return int(result.stdout.strip() or 0)
+
+def commit_and_push(paths, push=True, cwd="."):
+    """Stage hanya file yang berubah, commit, lalu push (opsional)"""
+    git("add", "--", *paths, cwd=cwd)
+
+    # Lewati commit jika ternyata tidak ada perubahan yang ter-stage
+    if git("diff", "--cached", "--quiet", cwd=cwd).returncode == 0:
+        # ...tapi push ulang commit dari batch sebelumnya yang gagal di-push
+        ahead = unpushed_commits(cwd) if push else 0
+        if not ahead:
+            print(f"{Col.YELLOW}[INFO] Tidak ada perubahan untuk di-commit.{Col.RESET}")
+            return True
+        print(f"{Col.YELLOW}[INFO] Tidak ada perubahan baru, {ahead} commit belum ter-push. Push ulang...{Col.RESET}")
+    else:
+        commit_msg = f"Auto-update content & timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} WIB"
+        result = git("commit", "-m", commit_msg, cwd=cwd)
+        if result.returncode != 0:
+            print(f"{Col.RED}✘ GAGAL COMMIT: {result.stderr.strip()}{Col.RESET}")
+            return False
+        print(f"{Col.BLUE} -> Commit: {Col.CYAN}\"{commit_msg}\" ({len(paths)} file){Col.RESET}")
+
+        if not push:
+            return True
+
+    result = git("push", cwd=cwd)
+    if result.returncode != 0:
+        print(f"{Col.RED}✘ GAGAL MELAKUKAN GIT PUSH!{Col.RESET}")
+        print(f"{Col.YELLOW}{result.stderr.strip()}{Col.RESET}")
+        return False
+    print(f"{Col.GREEN}✔ Push selesai.{Col.RESET}")
+    return True
+
+# ==============================================================================
+# 4. PEMANTAU FILE (INOTIFY & POLLING)
+# ==============================================================================
+
+class InotifyWatcher:
+    """Pemantau rekursif berbasis inotify (via ctypes, tanpa dependensi)"""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+
+    WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, root):
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._ctypes = ctypes
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 gagal")
+
+        self.wd_to_dir = {}
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            self._add_watch(dirpath)
+
+    def _add_watch(self, path):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.WATCH_MASK)
+        if wd < 0:
+            raise OSError(self._ctypes.get_errno(), f"inotify_add_watch gagal: {path}")
+        self.wd_to_dir[wd] = path
+
+    def read(self, timeout):
+        """
+        Menunggu event hingga `timeout` detik.
+        Mengembalikan (set_path_md, overflow).
+        """
+        changed = set()
+        overflow = False
+
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return changed, overflow
+
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed, overflow
+
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _cookie, name_len = self.EVENT_HEADER.unpack_from(buf, offset)
+            offset += self.EVENT_HEADER.size
+            name = os.fsdecode(buf[offset:offset + name_len].rstrip(b"\0"))
+            offset += name_len
+
+            if mask & self.IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & self.IN_IGNORED:
+                self.wd_to_dir.pop(wd, None)
+                continue
+
+            parent = self.wd_to_dir.get(wd)
+            if parent is None or not name:
+                continue
+            path = os.path.join(parent, name)
+
+            if mask & self.IN_ISDIR:
+                # Folder baru: pasang watch juga untuk isinya
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and not name.startswith("."):
+                    for dirpath, dirnames, filenames in os.walk(path):
+                        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                        self._add_watch(dirpath)
+                        changed.update(os.path.join(dirpath, f) for f in filenames if f.endswith(".md"))
+                continue
+
+            if mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO) and name.endswith(".md"):
+                changed.add(path)
+
+        return changed, overflow
+
+    def close(self):
+        os.close(self.fd)
+
+class PollingWatcher:
+    """Fallback: membandingkan mtime file .md setiap POLL_INTERVAL_SEC detik"""
+
+    def __init__(self, root):
+        self.root = root
+        self.mtimes = dict(self._scan())
+
+    def _scan(self):
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                if name.endswith(".md"):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        yield path, os.stat(path).st_mtime_ns
+                    except FileNotFoundError:
+                        continue
+
+    def read(self, timeout):
+        time.sleep(min(timeout, Config.POLL_INTERVAL_SEC))
+        current = dict(self._scan())
+        changed = {p for p, m in current.items() if self.mtimes.get(p) != m}
+        self.mtimes = current
+        return changed, False
+
+    def close(self):
+        pass
+
+def create_watcher(root, force_poll=False):
+    if not force_poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root), "inotify"
+        except (OSError, AttributeError) as e:
+            print(f"{Col.YELLOW}[WARN] inotify tidak tersedia ({e}), beralih ke polling.{Col.RESET}")
+    return PollingWatcher(root), "polling"
+
+# ==============================================================================
+# 5. LOOP WATCH + BATCH COMMIT
+# ==============================================================================
+
+def handle_changed_file(path, target_dir, self_written):
+    """Update date satu file dan cetak log. Mengembalikan True jika file valid"""
+    try:
+        # Event dari tulisan script ini sendiri (mtime sudah dikembalikan)
+        if self_written.pop(path, None) == os.stat(path).st_mtime_ns:
+            return False
+        result = update_front_matter_date(path)
+    except FileNotFoundError:
+        return False
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"{Col.RED}✘ GAGAL   : {Col.RESET}{os.path.relpath(path, target_dir)} ({e})")
+        return False
+
+    rel = os.path.relpath(path, target_dir)
+    if result:
+        old_val, new_val = result
+        self_written[path] = os.stat(path).st_mtime_ns
+        print(f"{Col.GREEN}✔ UPDATED : {Col.RESET}{rel}")
+        print(f"   {Col.RED}Lama : {old_val}{Col.RESET}")
+        print(f"   {Col.GREEN}Baru : {new_val}{Col.RESET}")
+    else:
+        print(f"{Col.CYAN}• TERSIMPAN: {Col.RESET}{rel}")
+    return True
+
+def watch(target_dir, debounce, max_batch, push=True, force_poll=False):
+    watcher, mode = create_watcher(target_dir, force_poll)
+
+    print(f"{Col.CYAN}======================================================{Col.RESET}")
+    print(f"{Col.MAGENTA}   S M A R T   U P D A T E   D A T E   ( W A T C H )  {Col.RESET}")
+    print(f"{Col.CYAN}======================================================{Col.RESET}")
+    print(f"{Col.CYAN} -> Target Folder : {Col.RESET}{target_dir}")
+    print(f"{Col.CYAN} -> Mode Pantau   : {Col.RESET}{mode}")
+    print(f"{Col.CYAN} -> Debounce      : {Col.RESET}{debounce} detik (maks {max_batch} detik)")
+    print(f"{Col.CYAN} -> Auto Push     : {Col.RESET}{'Ya' if push else 'Tidak'}")
+    print(f"{Col.YELLOW}[*] Menunggu perubahan file... (Ctrl+C untuk berhenti){Col.RESET}\n")
+
+    pending = set()
+    self_written = {}
+    first_event = last_event = None
+
+    def process(paths):
+        nonlocal first_event, last_event
+        for path in sorted({os.path.normpath(p) for p in paths}):
+            if handle_changed_file(path, target_dir, self_written):
+                pending.add(path)
+                last_event = time.time()
+                first_event = first_event or last_event
+
+    # Catch-up: file yang sudah berubah sebelum watch dimulai
+    backlog = changed_markdown_files(target_dir)
+    if backlog:
+        print(f"{Col.YELLOW}[*] {len(backlog)} file .md belum di-commit, diproses lebih dulu...{Col.RESET}")
+        process(backlog)
+
+    try:
+        while True:
+            # Tunggu hanya selama sisa waktu debounce agar flush tepat waktu
+            if pending:
+                now = time.time()
+                timeout = max(0.0, min(last_event + debounce, first_event + max_batch) - now)
+            else:
+                timeout = 60.0
+
+            changed, overflow = watcher.read(timeout)
+            if overflow:
+                print(f"{Col.YELLOW}[WARN] Antrean event penuh, menanyakan file yang berubah ke Git...{Col.RESET}")
+                changed.update(changed_markdown_files(target_dir))
+            process(changed)
+
+            if not pending:
+                continue
+
+            now = time.time()
+            if now - last_event >= debounce or now - first_event >= max_batch:
+                print(f"\n{Col.YELLOW}[*] Mengirim batch {len(pending)} file...{Col.RESET}")
+                if commit_and_push(sorted(pending), push=push):
+                    pending.clear()
+                    first_event = last_event = None
+                else:
+                    # Coba lagi pada siklus debounce berikutnya
+                    first_event = last_event = now
+                print()
+    except KeyboardInterrupt:
+        if pending:
+            print(f"\n{Col.YELLOW}[*] Berhenti, mengirim sisa {len(pending)} file...{Col.RESET}")
+            commit_and_push(sorted(pending), push=push)
+        print(f"\n{Col.GREEN}[INFO] Watch mode dihentikan.{Col.RESET}")
+    finally:
+        watcher.close()
+
+# ==============================================================================
+# 6. MAIN
+# ==============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Smart Update Date & Push (Watch Mode)")
+    parser.add_argument("--watch", action="store_true", help="Pantau folder dan commit secara batch")
+    parser.add_argument("--target", default=Config.TARGET_DIR, help="Folder konten Markdown")
+    parser.add_argument("--debounce", type=float, default=Config.DEBOUNCE_SEC, help="Jeda tenang sebelum commit (detik)")
+    parser.add_argument("--max-batch", type=float, default=Config.MAX_BATCH_SEC, help="Batas maksimal menahan antrean (detik)")
+    parser.add_argument("--no-push", action="store_true", help="Commit saja tanpa push")
+    parser.add_argument("--poll", action="store_true", help="Paksa mode polling (tanpa inotify)")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if not args.watch:
+        print(f"{Col.YELLOW}Gunakan 'push' untuk sekali jalan, atau tambahkan --watch.{Col.RESET}")
+        sys.exit(1)
+
+    if not os.path.isdir(args.target):
+        print(f"{Col.RED}[ERROR] Folder {args.target} tidak ditemukan!{Col.RESET}")
+        print(f"{Col.YELLOW}Pastikan Anda menjalankan perintah ini di root direktori Hugo Anda.{Col.RESET}")
+        sys.exit(1)
+
+    if not os.path.isdir(".git"):
+        print(f"{Col.RED}[ERROR] Direktori ini bukan repository Git! (.git tidak ditemukan){Col.RESET}")
+        sys.exit(1)
+
+    watch(args.target, args.debounce, args.max_batch, push=not args.no_push, force_poll=args.poll)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Script: Multi-Site Push Orchestrator (v1.0)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Menjalankan alur 'push' (update 'date' Front Matter + commit + fetch/rebase
+    + push) untuk BANYAK repository Hugo sekaligus secara paralel.
+
+    [FITUR]
+    - Paralel dengan batas jumlah worker (--jobs), total waktu kira-kira
+      setara repository yang paling lambat.
+    - Log terpisah per repository (tidak saling tumpang tindih di layar),
+      juga disimpan ke file di LOG_DIR.
+    - Tabel ringkasan gabungan di akhir eksekusi.
+
+Penggunaan:
+    python3 multi_push.py /path/site-a /path/site-b ...
+    python3 multi_push.py --list ~/.config/my-terminal-tools/sites.txt --jobs 3
+
+    File daftar berisi satu path repository per baris ('#' untuk komentar).
+
+Dependencies:
+    - git, hugo_push.py & git_sync.py (satu folder dengan script ini)
+--------------------------------------------------------------------------------
+"""
+
+import os
+import re
+import sys
+import time
+import hashlib
+import argparse
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import hugo_push
+import git_sync
+from git_sync import Col
+
+# ==============================================================================
+# 1. KONFIGURASI
+# ==============================================================================
+
+class Config:
+    SITES_FILE = os.path.expanduser("~/.config/my-terminal-tools/sites.txt")
+    LOG_DIR = os.path.expanduser("~/.cache/my-terminal-tools/multi_push")
+    TARGET_DIR = hugo_push.Config.TARGET_DIR
+    MAX_JOBS = 4
+
+ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+
+# ==============================================================================
+# 2. PROSES SATU REPOSITORY
+# ==============================================================================
+
+class RepoResult:
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.basename(os.path.abspath(path))
+        self.ok = False
+        self.error = None
+        self.md_updated = 0
+        self.summary = {}
+        self.duration = 0.0
+        self.lines = []
+
+    def log(self, line):
+        self.lines.append(line)
+
+def process_repo(path, target_dir, push=True):
+    """Update Front Matter + sync untuk satu repository; tidak pernah melempar"""
+    result = RepoResult(path)
+    start = time.perf_counter()
+    timer = git_sync.StepTimer()
+
+    try:
+        if not os.path.isdir(os.path.join(path, ".git")):
+            raise git_sync.GitError("bukan repository Git (.git tidak ditemukan)")
+
+        # --- 1. Update 'date' hanya pada file .md yang berubah menurut Git ---
+        with timer.step("frontmatter"):
+            for md_file in hugo_push.changed_markdown_files(target_dir, cwd=path):
+                changed = hugo_push.update_front_matter_date(md_file)
+                if changed:
+                    result.md_updated += 1
+                    result.log(f"{Col.GREEN}✔ UPDATED : {Col.RESET}{os.path.relpath(md_file, path)} "
+                               f"({changed[0]} -> {changed[1]})")
+
+        # --- 2. Commit + fetch/rebase + push ---
+        message = f"Auto-update content & timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} WIB"
+        if push:
+            result.summary = git_sync.sync(message, cwd=path, timer=timer, log=result.log)
+        else:
+            result.summary = _commit_only(message, path, timer, result.log)
+        result.ok = True
+    except Exception as e:
+        # Error apa pun (misal .md bukan UTF-8) hanya menggagalkan repo ini, bukan seluruh batch
+        text = str(e) if isinstance(e, (git_sync.GitError, OSError)) else f"{type(e).__name__}: {e}"
+        result.error = (text.splitlines() or [type(e).__name__])[0]
+        result.log(f"{Col.RED}[ERROR] {text}{Col.RESET}")
+
+    result.duration = time.perf_counter() - start
+    for name, duration, reason in timer.steps:
+        timing = f"{duration * 1000:.0f} ms" if duration is not None else f"- ({reason})"
+        result.log(f"{Col.GRAY}    {name:<12} {timing}{Col.RESET}")
+    return result
+
+def _commit_only(message, path, timer, log):
+    """Mode --no-push: stage & commit saja tanpa jaringan"""
+    summary = {"changed": 0, "committed": False, "pulled": 0, "pushed": 0}
+    with timer.step("status"):
+        paths = git_sync.changed_paths(path)
+    summary["changed"] = len(paths)
+    if paths:
+        with timer.step("commit"):
+            git_sync.stage_paths(paths, path)
+            git_sync.git("commit", "-q", "-m", message, cwd=path)
+        summary["committed"] = True
+        log(f"{Col.GREEN}[*] Commit {len(paths)} path (tanpa push).{Col.RESET}")
+    return summary
+
+def log_filename(path):
+    """Nama file log per repository; hash path agar repo dengan nama folder sama tidak bercampur"""
+    abspath = os.path.abspath(path)
+    return f"{os.path.basename(abspath)}-{hashlib.sha1(abspath.encode()).hexdigest()[:8]}.log"
+
+def write_log(result, log_dir):
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, log_filename(result.path))
+    with open(log_path, "a", encoding="utf-8") as f:
+        f.write(f"=== {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} {os.path.abspath(result.path)} ===\n")
+        for line in result.lines:
+            f.write(ANSI_RE.sub("", line) + "\n")
+    return log_path
+
+# ==============================================================================
+# 3. ORKESTRASI PARALEL & RINGKASAN
+# ==============================================================================
+
+def run_all(repos, target_dir, jobs, push=True, log_dir=Config.LOG_DIR):
+    results = []
+    print_lock = threading.Lock()
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = {pool.submit(process_repo, repo, target_dir, push): repo for repo in repos}
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            log_path = write_log(result, log_dir)
+
+            # Cetak log per repository sebagai satu blok utuh
+            with print_lock:
+                status = f"{Col.GREEN}OK" if result.ok else f"{Col.RED}GAGAL"
+                print(f"\n{Col.CYAN}=== {result.name} {Col.RESET}[{status}{Col.RESET}] "
+                      f"{Col.GRAY}{result.duration:.2f}s -> {log_path}{Col.RESET}")
+                for line in result.lines:
+                    print(f"  {line}")
+
+    # Urutkan sesuai urutan input agar tabel konsisten
+    order = {repo: idx for idx, repo in enumerate(repos)}
+    results.sort(key=lambda r: order[r.path])
+    return results
+
+def print_summary(results, wall_time):
+    headers = ["REPOSITORY", "STATUS", ".MD", "PATH", "PULL", "PUSH", "DURASI"]
+    rows = []
+    for r in results:
+        s = r.summary
+        rows.append([
+            r.name,
+            "OK" if r.ok else f"GAGAL: {r.error}"[:40],
+            str(r.md_updated),
+            str(s.get("changed", "-")),
+            str(s.get("pulled", "-")),
+            str(s.get("pushed", "-")),
+            f"{r.duration:.2f}s",
+        ])
+
+    widths = [max(len(h), *(len(row[i]) for row in rows)) for i, h in enumerate(headers)]
+    line = "  ".join("-" * w for w in widths)
+
+    print(f"\n{Col.CYAN}{'=' * len(line)}{Col.RESET}")
+    print("  ".join(h.ljust(w) for h, w in zip(headers, widths)))
+    print(line)
+    for row, r in zip(rows, results):
+        color = Col.GREEN if r.ok else Col.RED
+        print(color + "  ".join(v.ljust(w) for v, w in zip(row, widths)) + Col.RESET)
+    print(f"{Col.CYAN}{'=' * len(line)}{Col.RESET}")
+
+    total_serial = sum(r.duration for r in results)
+    failed = sum(1 for r in results if not r.ok)
+    print(f"Total waktu: {wall_time:.2f}s (serial: {total_serial:.2f}s) | "
+          f"{len(results) - failed} sukses, {failed} gagal")
+
+# ==============================================================================
+# 4. MAIN
+# ==============================================================================
+
+def read_sites_file(path):
+    repos = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                repos.append(os.path.expanduser(line))
+    return repos
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Push banyak repository Hugo secara paralel")
+    parser.add_argument("repos", nargs="*", help="Path repository (default: isi --list)")
+    parser.add_argument("--list", default=Config.SITES_FILE, help="File daftar repository")
+    parser.add_argument("--jobs", "-j", type=int, default=Config.MAX_JOBS, help="Jumlah repository paralel")
+    parser.add_argument("--target", default=Config.TARGET_DIR, help="Folder konten relatif terhadap root repo")
+    parser.add_argument("--no-push", action="store_true", help="Commit lokal saja tanpa fetch/push")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    repos = args.repos
+    if not repos:
+        if not os.path.isfile(args.list):
+            print(f"{Col.RED}[ERROR] Tidak ada repository. Berikan path atau buat file {args.list}{Col.RESET}")
+            sys.exit(1)
+        repos = read_sites_file(args.list)
+
+    print(f"{Col.YELLOW}[*] Memproses {len(repos)} repository (paralel maks {args.jobs})...{Col.RESET}")
+    wall_start = time.perf_counter()
+    results = run_all(repos, args.target, args.jobs, push=not args.no_push)
+    print_summary(results, time.perf_counter() - wall_start)
+
+    sys.exit(0 if all(r.ok for r in results) else 1)
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+--------------------------------------------------------------------------------
+Script: My Terminal Tools Updater (v1.0)
+Author: Wahyu Kurniawan
+Date: 2026-10-18
+Description:
+    Installer/updater inkremental untuk seluruh tools di repository ini,
+    menggantikan 'curl -sL' satu per satu di start.sh.
+
+    [ALUR]
+    1. Unduh manifest.json (berisi hash SHA-256 setiap file). Jika server
+       menjawab 304 (ETag / Last-Modified sama), manifest lama dipakai.
+    2. Bandingkan hash dengan file lokal, unduh HANYA file yang berubah
+       secara paralel.
+    3. Verifikasi checksum, tulis ke file sementara lalu os.replace()
+       (atomic) agar file lama tidak pernah setengah tertulis.
+    4. Tulis ulang wrapper di bin hanya jika isinya berbeda.
+    5. Byte-compile script Python yang berubah.
+
+Penggunaan:
+    python3 updater.py                    (update dari GitHub)
+    python3 updater.py --base-url http://127.0.0.1:8000   (server lokal)
+    python3 updater.py --build-manifest   (dijalankan di root repository)
+
+Dependencies:
+    - Python standard library saja (bisa jalan sebelum pip install)
+--------------------------------------------------------------------------------
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import tempfile
+import py_compile
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# Pewarnaan Terminal (disamakan dengan start.sh)
+class Col:
+    RED = '\033[0;31m'
+    GREEN = '\033[0;32m'
+    CYAN = '\033[0;36m'
+    YELLOW = '\033[1;33m'
+    RESET = '\033[0m'
+
+# ==============================================================================
+# 1. KONFIGURASI
+# ==============================================================================
+
+class Config:
+    BASE_URL = os.environ.get(
+        "MTT_BASE_URL",
+        "https://raw.githubusercontent.com/wahyu6070/my-terminal-tools/main"
+    )
+    PREFIX = os.environ.get("PREFIX", "/data/data/com.termux/files/usr")
+    MANIFEST_NAME = "manifest.json"
+    STATE_NAME = ".installed.json"
+    MAX_WORKERS = 6
+    TIMEOUT = 30
+
+    # Pemetaan perintah terminal -> file Python (sebelumnya ada di start.sh)
+    WRAPPERS = {
+        "a": "cek_semua_data_adsterra_8_day.py",
+        "b": "cek_semua_data_adsterra_30_day.py",
+        "c": "cek_semua_data_adsterra_3_bulan.py",
+        "d": "cek_semua_data_adsterra.py",
+        "z": "z.py",
+        "pushall": "multi_push.py",
+        "alert": "adsterra_alerts.py",
+        "stats": "adsterra_store.py",
+        "r": "adsterra_range.py",
+        "dash": "adsterra_dashboard.py",
+        "collect": "adsterra_collect.py",
+        "sites": "adsterra_meta.py",
+    }
+
+def install_dirs(prefix):
+    return {
+        "python": os.path.join(prefix, "mypython"),
+        "script": os.path.join(prefix, "bin"),
+    }
+
+# ==============================================================================
+# 2. MANIFEST
+# ==============================================================================
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b""):
+                h.update(chunk)
+    except FileNotFoundError:
+        return None
+    return h.hexdigest()
+
+def build_manifest(repo_root):
+    """Membuat manifest.json dari isi folder python/ dan script/"""
+    files = {}
+    for folder in ("python", "script"):
+        base = os.path.join(repo_root, folder)
+        for name in sorted(os.listdir(base)):
+            path = os.path.join(base, name)
+            if not os.path.isfile(path) or name.endswith((".pyc", ".pyo")):
+                continue
+            files[f"{folder}/{name}"] = {
+                "sha256": sha256_file(path),
+                "size": os.path.getsize(path),
+            }
+
+    manifest = {
+        "files": files,
+        "wrappers": Config.WRAPPERS,
+    }
+    out_path = os.path.join(repo_root, Config.MANIFEST_NAME)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"{Col.GREEN}[OK] {out_path} ({len(files)} file){Col.RESET}")
+
+# ==============================================================================
+# 3. DOWNLOAD & ATOMIC INSTALL
+# ==============================================================================
+
+def http_get(url, validators=None):
+    """
+    GET sederhana dengan conditional request (ETag / Last-Modified).
+    Mengembalikan (status, body, validators_baru).
+    """
+    req = urllib.request.Request(url, headers={"User-Agent": "MyTerminalTools-Updater/1.0"})
+    validators = validators or {}
+    if validators.get("etag"):
+        req.add_header("If-None-Match", validators["etag"])
+    if validators.get("last_modified"):
+        req.add_header("If-Modified-Since", validators["last_modified"])
+    try:
+        with urllib.request.urlopen(req, timeout=Config.TIMEOUT) as resp:
+            new_validators = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            }
+            return resp.status, resp.read(), new_validators
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, b"", validators
+        raise
+
+def atomic_write(path, data, mode=None):
+    """Tulis ke file sementara di folder yang sama, lalu os.replace()"""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def fetch_and_install(base_url, rel_path, meta, dest):
+    """Unduh satu file, verifikasi SHA-256, lalu pasang secara atomic"""
+    _, body, _ = http_get(f"{base_url}/{rel_path}")
+    digest = hashlib.sha256(body).hexdigest()
+    if digest != meta["sha256"]:
+        raise ValueError(f"checksum tidak cocok untuk {rel_path} ({digest[:12]} != {meta['sha256'][:12]})")
+    mode = 0o755 if rel_path.startswith("script/") else 0o644
+    atomic_write(dest, body, mode)
+    return rel_path
+
+def wrapper_content(prefix, python_dir, py_file):
+    return (
+        f"#!{prefix}/bin/bash\n"
+        f"# Auto-generated wrapper untuk {py_file}\n"
+        f"python3 \"{python_dir}/{py_file}\" \"$@\"\n"
+    )
+
+# ==============================================================================
+# 4. PROSES UPDATE
+# ==============================================================================
+
+def update(base_url, prefix, force=False):
+    dirs = install_dirs(prefix)
+    for d in dirs.values():
+        os.makedirs(d, exist_ok=True)
+
+    state_path = os.path.join(dirs["python"], Config.STATE_NAME)
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (FileNotFoundError, ValueError):
+        state = {}
+
+    start = time.perf_counter()
+
+    # --- 1. Manifest (conditional GET dengan ETag) ---
+    print(f"{Col.CYAN} -> Mengecek manifest: {base_url}/{Config.MANIFEST_NAME}{Col.RESET}")
+    known = state.get("validators") if state.get("manifest") and not force else None
+    status, body, validators = http_get(f"{base_url}/{Config.MANIFEST_NAME}", known)
+    if status == 304:
+        manifest = state["manifest"]
+        print(f"{Col.GREEN} -> Manifest tidak berubah (304).{Col.RESET}")
+    else:
+        manifest = json.loads(body)
+
+    # --- 2. Cari file yang berbeda dengan lokal ---
+    pending = []
+    for rel_path, meta in sorted(manifest["files"].items()):
+        folder, name = rel_path.split("/", 1)
+        dest = os.path.join(dirs[folder], name)
+        if force or sha256_file(dest) != meta["sha256"]:
+            pending.append((rel_path, meta, dest))
+
+    # --- 3. Unduh paralel ---
+    changed_py = []
+    errors = []
+    if pending:
+        print(f"{Col.YELLOW} -> Mengunduh {len(pending)} file yang berubah...{Col.RESET}")
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as pool:
+            futures = [(rel, pool.submit(fetch_and_install, base_url, rel, meta, dest))
+                       for rel, meta, dest in pending]
+            for rel, future in futures:
+                try:
+                    future.result()
+                    print(f"{Col.GREEN}    ✔ {rel}{Col.RESET}")
+                    if rel.endswith(".py"):
+                        changed_py.append(os.path.join(dirs["python"], rel.split("/", 1)[1]))
+                except (OSError, ValueError) as e:
+                    errors.append(rel)
+                    print(f"{Col.RED}    ✘ {rel}: {e}{Col.RESET}")
+    else:
+        print(f"{Col.GREEN} -> Semua file sudah versi terbaru.{Col.RESET}")
+
+    # --- 4. Wrapper di bin (hanya jika isinya berubah) ---
+    for cmd, py_file in sorted(manifest.get("wrappers", {}).items()):
+        wrapper_path = os.path.join(dirs["script"], cmd)
+        content = wrapper_content(prefix, dirs["python"], py_file).encode("utf-8")
+        try:
+            with open(wrapper_path, "rb") as f:
+                if f.read() == content:
+                    continue
+        except FileNotFoundError:
+            pass
+        atomic_write(wrapper_path, content, 0o755)
+        print(f"{Col.CYAN}    ✔ wrapper '{cmd}' -> {py_file}{Col.RESET}")
+
+    # --- 5. Byte-compile ---
+    for py_path in changed_py:
+        try:
+            py_compile.compile(py_path, doraise=True)
+        except py_compile.PyCompileError as e:
+            print(f"{Col.RED}    ✘ compile {os.path.basename(py_path)}: {e.msg}{Col.RESET}")
+
+    # Simpan state hanya jika semua file terpasang (agar 304 tidak menipu)
+    if not errors:
+        atomic_write(state_path, json.dumps({"validators": validators, "manifest": manifest}).encode("utf-8"))
+
+    duration = time.perf_counter() - start
+    print(f"{Col.GREEN} -> Selesai dalam {duration:.2f} detik "
+          f"({len(pending) - len(errors)} diperbarui, {len(errors)} gagal).{Col.RESET}")
+    return not errors
+
+# ==============================================================================
+# 5. MAIN
+# ==============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Installer/updater My Terminal Tools")
+    parser.add_argument("--base-url", default=Config.BASE_URL, help="URL dasar raw repository")
+    parser.add_argument("--prefix", default=Config.PREFIX, help="Prefix instalasi (default: $PREFIX)")
+    parser.add_argument("--force", action="store_true", help="Unduh ulang semua file")
+    parser.add_argument("--build-manifest", metavar="REPO_ROOT", nargs="?", const=".",
+                        help="Buat manifest.json dari folder repository")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    if args.build_manifest:
+        build_manifest(args.build_manifest)
+        sys.exit(0)
+
+    try:
+        ok = update(args.base_url.rstrip("/"), args.prefix, force=args.force)
+    except (OSError, ValueError) as e:
+        print(f"{Col.RED}[ERROR] Update gagal: {e}{Col.RESET}")
+        sys.exit(1)
+    sys.exit(0 if ok else 1)
@@ -15,12 +15,15 @@ Description:
     - Menampilkan ringkasan total dari "Periode Sebelumnya".
     - Menampilkan rincian harian untuk "Periode Saat Ini" (hingga kemarin).
     - Menampilkan performa "Hari Ini" secara terpisah karena data belum final.
+    - Proyeksi akhir periode & akhir bulan (laju, profil hari, progres hari ini)
+      dari riwayat yang di-cache lokal (lihat adsterra_cache.py).
 
 Dependencies:
     - requests, tabulate, colorama
 --------------------------------------------------------------------------------
 """
 
+import os
 import sys
 import json
 import time
@@ -40,14 +43,25 @@ except ImportError:
     print("pip install tabulate colorama requests")
     sys.exit(1)
 
+# Modul pendamping (satu folder dengan script ini)
+from adsterra_cache import HistoryCache
+from adsterra_projection import load_model, project_total
+from adsterra_anomaly import find_anomalies, mark_date, print_anomaly_summary
+from adsterra_spark import print_trends
+from adsterra_alerts import on_new_data
+from adsterra_store import open_store
+from adsterra_net import make_session, parse_net_flags
+from adsterra_output import parse_format_flag, stream_items
+from adsterra_jsonlib import response_json
+
 # ==============================================================================
 # 1. KONFIGURASI (HALF-MONTH MODE)
 # ==============================================================================
 
 class Config:
     # Kredensial API Adsterra
-    API_KEY = "d99b6eb88c389817b16af23dd030f280"
-    BASE_URL = "https://api3.adsterratools.com/publisher/stats.json"
+    API_KEY = os.environ.get("ADSTERRA_API_KEY", "d99b6eb88c389817b16af23dd030f280")
+    BASE_URL = os.environ.get("ADSTERRA_BASE_URL", "https://api3.adsterratools.com/publisher/stats.json")
     USER_AGENT = "WahyuBot/4.0 (HalfMonthMode)"
     
     # Pengaturan Zona Waktu (GMT = UTC+0)
@@ -101,7 +115,8 @@ class TimeManager:
             "prev_end": prev_end,
             "curr_start": curr_start,
             "curr_end": curr_end,
-            "today": self.today_date
+            "today": self.today_date,
+            "now": self.now
         }
 
 # ==============================================================================
@@ -110,7 +125,7 @@ class TimeManager:
 
 class AdsterraClient:
     def __init__(self, api_key):
-        self.session = requests.Session()
+        self.session = make_session()
         self.session.headers.update({
             "X-API-Key": api_key,
             "User-Agent": Config.USER_AGENT,
@@ -137,7 +152,7 @@ class AdsterraClient:
             
             if resp.status_code == 200:
                 print(f"{Fore.GREEN}[SUCCESS] Data diterima dalam {duration:.2f} detik.")
-                return resp.json()
+                return response_json(resp)
             else:
                 print(f"{Fore.RED}[ERROR] HTTP Code: {resp.status_code}")
                 print(f"{Fore.RED}[ERROR] Response: {resp.text}")
@@ -203,16 +218,64 @@ class ReportFormatter:
             elif periods["curr_start"] <= item_date < periods["today"]:
                 curr_data.append(item)
 
-        # 4.2 Menampilkan Laporan PERIODE SEBELUMNYA
-        self._print_previous_period_summary(prev_data, periods)
+        # 4.2 Simpan hari final ke cache, deteksi anomali & hitung proyeksi (inkremental)
+        cache = HistoryCache()
+        anomalies = find_anomalies(items, cache, periods["today"])
+        projection = self._build_projection(cache, items, prev_data, curr_data, today_data, periods)
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"{Fore.LIGHTBLACK_EX}[CACHE] Gagal menyimpan cache: {e}")
+
+        # Simpan ke SQLite lokal; total periode dihitung lewat query ber-index
+        store = open_store(items, periods["today"])
+        yesterday = (periods["today"] - timedelta(days=1)).isoformat()
+        # Periode sebelumnya sudah tutup: dibekukan ke snapshot sekali, lalu dibaca ulang
+        prev_totals = store.period_totals(periods["prev_start"].isoformat(), periods["prev_end"].isoformat(),
+                                          periods["today"])
+        curr_totals = store.totals(periods["curr_start"].isoformat(), yesterday)
+        store.close()
+
+        # 4.3 Menampilkan Laporan PERIODE SEBELUMNYA
+        self._print_previous_period_summary(prev_data, periods, prev_totals)
         
-        # 4.3 Menampilkan Laporan PERIODE SAAT INI (Hingga Kemarin)
-        self._print_current_period_table(curr_data, periods)
+        # 4.4 Menampilkan Laporan PERIODE SAAT INI (Hingga Kemarin)
+        self._print_current_period_table(curr_data, periods, projection, anomalies, curr_totals)
+        print_anomaly_summary(anomalies)
+        print_trends(sorted(items, key=lambda x: x.get('date', '0000-00-00')), "TREN 2 PERIODE")
         
-        # 4.4 Menampilkan Laporan HARI INI
+        # 4.5 Menampilkan Laporan HARI INI
         self._print_today_live(today_data, periods)
 
-    def _print_previous_period_summary(self, prev_data, periods):
+    def _build_projection(self, cache, items, prev_data, curr_data, today_data, periods):
+        """Proyeksi total periode & bulan berjalan dari model yang di-cache"""
+        cache.merge(items, periods["today"])
+        model = load_model(cache)
+
+        today = periods["today"]
+        month_start = today.replace(day=1)
+        month_end = today.replace(day=calendar.monthrange(today.year, today.month)[1])
+
+        # Hari final pada bulan berjalan (periode 1-15 ikut jika sekarang periode kedua)
+        month_sum = sum(
+            i.get("revenue", 0.0) for i in items
+            if month_start.isoformat() <= i.get("date", "") < today.isoformat()
+        )
+        curr_sum = sum(i.get("revenue", 0.0) for i in curr_data)
+
+        # Cadangan jika model belum punya riwayat: rata-rata harian yang ada
+        basis = curr_data or prev_data
+        fallback = sum(i.get("revenue", 0.0) for i in basis) / len(basis) if basis else 0.0
+        today_rev = today_data.get("revenue", 0.0) if today_data else None
+
+        return {
+            "period": project_total(model, curr_sum, today_rev, periods["now"], periods["curr_end"], fallback),
+            "month": project_total(model, month_sum, today_rev, periods["now"], month_end, fallback),
+            "month_end": month_end,
+            "history_days": model.n,
+        }
+
+    def _print_previous_period_summary(self, prev_data, periods, totals):
         print("\n" + "="*55)
         print(f"{Back.MAGENTA}{Fore.WHITE} [1] RINGKASAN PERIODE SEBELUMNYA {Style.RESET_ALL}")
         print(f"{Fore.MAGENTA}Rentang: {periods['prev_start'].strftime('%d %b %Y')} s/d {periods['prev_end'].strftime('%d %b %Y')}{Style.RESET_ALL}")
@@ -222,10 +285,10 @@ class ReportFormatter:
             print(f"{Fore.LIGHTBLACK_EX}Tidak ada data untuk periode sebelumnya.")
             return
 
-        tot_rev = sum(i.get("revenue", 0.0) for i in prev_data)
-        tot_imp = sum(i.get("impression", 0) for i in prev_data)
+        tot_rev = totals["revenue"]
+        tot_imp = totals["impression"]
         avg_cpm = self.calculate_cpm(tot_rev, tot_imp)
-        hari_berjalan = len(prev_data)
+        hari_berjalan = totals["days"]
         avg_daily = tot_rev / hari_berjalan if hari_berjalan > 0 else 0.0
 
         summary = [
@@ -236,7 +299,7 @@ class ReportFormatter:
         ]
         print(tabulate(summary, tablefmt="plain"))
 
-    def _print_current_period_table(self, curr_data, periods):
+    def _print_current_period_table(self, curr_data, periods, projection, anomalies, totals):
         print("\n" + "="*55)
         print(f"{Back.BLUE}{Fore.WHITE} [2] RINCIAN PERIODE SAAT INI (Hingga Kemarin) {Style.RESET_ALL}")
         print(f"{Fore.BLUE}Rentang: {periods['curr_start'].strftime('%d %b %Y')} s/d (Maks Kemarin){Style.RESET_ALL}")
@@ -249,8 +312,6 @@ class ReportFormatter:
             curr_data = sorted(curr_data, key=lambda x: x.get('date', '0000-00-00'))
             
             table_data = []
-            tot_rev = 0.0
-            tot_imp = 0
             
             for item in curr_data:
                 date_str = item.get("date", "-")
@@ -258,9 +319,6 @@ class ReportFormatter:
                 cpm = item.get("cpm", 0.0)
                 rev = item.get("revenue", 0.0)
 
-                tot_rev += rev
-                tot_imp += imp
-
                 # Logika Pewarnaan (Detail visual)
                 rev_str = self.format_usd(rev)
                 if rev > 12.0:
@@ -275,7 +333,7 @@ class ReportFormatter:
                     cpm_str = f"{Fore.YELLOW}{cpm_str}{Style.RESET_ALL}"
 
                 table_data.append([
-                    date_str,
+                    mark_date(date_str, anomalies.get(date_str)),
                     self.format_num(imp),
                     cpm_str,
                     rev_str
@@ -285,8 +343,10 @@ class ReportFormatter:
             print(tabulate(table_data, headers=headers, tablefmt="simple_grid", stralign="right"))
 
             # Menampilkan Ringkasan Periode Saat Ini
+            tot_rev = totals["revenue"]
+            tot_imp = totals["impression"]
             avg_cpm = self.calculate_cpm(tot_rev, tot_imp)
-            hari_berjalan = len(curr_data)
+            hari_berjalan = totals["days"]
             avg_daily = tot_rev / hari_berjalan if hari_berjalan > 0 else 0.0
 
             print("\n--- ESTIMASI SEMENTARA PERIODE INI ---")
@@ -297,6 +357,28 @@ class ReportFormatter:
             ]
             print(tabulate(curr_summary, tablefmt="plain"))
 
+        self._print_projection(projection, periods)
+
+    def _print_projection(self, projection, periods):
+        period = projection["period"]
+        month = projection["month"]
+
+        def band(p):
+            return f"{Fore.LIGHTBLACK_EX}(90%: {self.format_usd(p['low'])} - {self.format_usd(p['high'])}){Style.RESET_ALL}"
+
+        print("\n--- PROYEKSI AKHIR PERIODE (Laju + Profil Harian) ---")
+        rentang = f"{periods['curr_start'].strftime('%d')}-{periods['curr_end'].strftime('%d %b')}"
+        proj_summary = [
+            [f"Proyeksi Periode ({rentang})", f"{Fore.CYAN}{Style.BRIGHT}{self.format_usd(period['total'])}{Style.RESET_ALL}", band(period)],
+            [f"Proyeksi Bulan {projection['month_end'].strftime('%b %Y')}", f"{Fore.CYAN}{self.format_usd(month['total'])}{Style.RESET_ALL}", band(month)],
+            ["Estimasi Hari Ini (Full)", self.format_usd(period["today_estimate"]), ""],
+            ["Sisa Hari Periode", f"{period['remaining_days']} Hari", ""]
+        ]
+        print(tabulate(proj_summary, tablefmt="plain"))
+
+        if projection["history_days"] < 14:
+            print(f"{Fore.LIGHTBLACK_EX}* Model masih belajar ({projection['history_days']} hari riwayat di cache).")
+
     def _print_today_live(self, today_data, periods):
         print("\n" + "="*55)
         print(f"{Back.YELLOW}{Fore.BLACK}{Style.BRIGHT} [3] LIVE STATS HARI INI (Data Belum Final) {Style.RESET_ALL}")
@@ -324,19 +406,25 @@ class ReportFormatter:
 # ==============================================================================
 
 if __name__ == "__main__":
-    # Header ASCII "HALF MONTH"
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}")
-    print(r"  _   _    _    _     _____   __  __  ___  _   _ _____ _   _ ")
-    print(r" | | | |  / \  | |   |  ___| |  \/  |/ _ \| \ | |_   _| | | |")
-    print(r" | |_| | / _ \ | |   | |_    | |\/| | | | |  \| | | | | |_| |")
-    print(r" |  _  |/ ___ \| |___|  _|   | |  | | |_| | |\  | | | |  _  |")
-    print(r" |_| |_/_/   \_\_____|_|     |_|  |_|\___/|_| \_| |_| |_| |_|")
-    print(f"{Style.RESET_ALL}")
-    
-    print(f"User   : Wahyu Kurniawan")
-    print(f"Sistem : Siklus 15-Harian (Pisah Hari Ini - GMT)")
-    print("-" * 61)
+    # --profile / --low-data (lihat adsterra_net.py)
+    parse_net_flags()
+    # --format json|jsonl|csv|tsv (lihat adsterra_output.py)
+    fmt = parse_format_flag()
+
+    if not fmt:
+        # Header ASCII "HALF MONTH"
+        print(f"\n{Fore.CYAN}{Style.BRIGHT}")
+        print(r"  _   _    _    _     _____   __  __  ___  _   _ _____ _   _ ")
+        print(r" | | | |  / \  | |   |  ___| |  \/  |/ _ \| \ | |_   _| | | |")
+        print(r" | |_| | / _ \ | |   | |_    | |\/| | | | |  \| | | | | |_| |")
+        print(r" |  _  |/ ___ \| |___|  _|   | |  | | |_| | |\  | | | |  _  |")
+        print(r" |_| |_/_/   \_\_____|_|     |_|  |_|\___/|_| \_| |_| |_| |_|")
+        print(f"{Style.RESET_ALL}")
     
+        print(f"User   : Wahyu Kurniawan")
+        print(f"Sistem : Siklus 15-Harian (Pisah Hari Ini - GMT)")
+        print("-" * 61)
+
     # 1. Inisialisasi Pengelola Waktu
     time_mgr = TimeManager()
     periods = time_mgr.get_periods()
@@ -349,9 +437,16 @@ if __name__ == "__main__":
     # 2. Inisialisasi Client dan Tarik Data
     client = AdsterraClient(Config.API_KEY)
     raw_data = client.get_stats(start_api_date, finish_api_date)
+
+    # Evaluasi aturan peringatan (~/.config/adsterra/alerts.json) pada data baru
+    if raw_data:
+        on_new_data(raw_data.get("items", []))
     
     # 3. Format dan Tampilkan
     if raw_data:
-        formatter = ReportFormatter()
-        formatter.process_and_show(raw_data, periods)
+        if fmt:
+            stream_items(raw_data.get("items", []), periods["today"])
+        else:
+            formatter = ReportFormatter()
+            formatter.process_and_show(raw_data, periods)
         
\ No newline at end of file
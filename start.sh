@@ -5,6 +5,8 @@
 # Description: Mengunduh script Python dari GitHub ke folder khusus (mypython),
 #              membuat wrapper eksekusi (a, b, c, d, z) di folder bin,
 #              serta mengunduh tools Git (p, push) dari GitHub.
+#              Proses unduh dilakukan oleh updater.py berdasarkan manifest.json:
+#              hanya file yang berubah yang diunduh ulang (paralel + checksum).
 # ==============================================================================
 
 # ------------------------------------------------------------------------------
@@ -13,8 +15,8 @@
 BIN_DIR="$PREFIX/bin"
 PYTHON_DIR="$PREFIX/mypython"
 
-BASE_URL_PYTHON="https://raw.githubusercontent.com/wahyu6070/my-terminal-tools/main/python"
-BASE_URL_SCRIPT="https://raw.githubusercontent.com/wahyu6070/my-terminal-tools/main/script"
+BASE_URL="${MTT_BASE_URL:-https://raw.githubusercontent.com/wahyu6070/my-terminal-tools/main}"
+BASE_URL_PYTHON="$BASE_URL/python"
 
 # Konfigurasi Warna Terminal
 MERAH='\033[0;31m'
@@ -28,7 +30,7 @@ echo -e "${BIRU}[*] Memulai Setup Environment Terisolasi Termux...${NC}"
 # ------------------------------------------------------------------------------
 # 2. MEMBUAT DIREKTORI KHUSUS PYTHON
 # ------------------------------------------------------------------------------
-echo -e "\n${KUNING}[1/4] Menyiapkan direktori khusus Python ($PYTHON_DIR)...${NC}"
+echo -e "\n${KUNING}[1/3] Menyiapkan direktori khusus Python ($PYTHON_DIR)...${NC}"
 if [ ! -d "$PYTHON_DIR" ]; then
     mkdir -p "$PYTHON_DIR"
     echo -e "${HIJAU} -> Direktori berhasil dibuat.${NC}"
@@ -37,62 +39,32 @@ else
 fi
 
 # ------------------------------------------------------------------------------
-# 3. MENGUNDUH SCRIPT PYTHON DARI GITHUB KE /MYPYTHON
+# 3. MENGUNDUH UPDATER (BOOTSTRAP)
 # ------------------------------------------------------------------------------
-echo -e "\n${KUNING}[2/4] Mengunduh script Python Adsterra dari GitHub...${NC}"
+# Hanya diunduh jika belum ada; setelah itu updater.py memperbarui dirinya
+# sendiri bersama file lain berdasarkan manifest.json.
+echo -e "\n${KUNING}[2/3] Menyiapkan updater...${NC}"
 
-download_python() {
-    FILE_NAME=$1
-    echo -e "${BIRU} -> Mengunduh: ${KUNING}$FILE_NAME${NC}"
-    curl -sL "$BASE_URL_PYTHON/$FILE_NAME" -o "$PYTHON_DIR/$FILE_NAME"
-}
-
-download_python "cek_semua_data_adsterra_8_day.py"
-download_python "cek_semua_data_adsterra_30_day.py"
-download_python "cek_semua_data_adsterra_3_bulan.py"
-download_python "cek_semua_data_adsterra.py"
-download_python "z.py"
-
-# ------------------------------------------------------------------------------
-# 4. MEMBUAT WRAPPER EXECUTABLE (a, b, c, d, z) DI /BIN
-# ------------------------------------------------------------------------------
-echo -e "\n${KUNING}[3/4] Membuat executable command di Termux bin...${NC}"
-
-# Fungsi untuk membuat wrapper yang bersih tanpa perintah 'cd'
-create_wrapper() {
-    CMD_NAME=$1
-    PY_FILE=$2
-    
-    echo -e "${BIRU} -> Menulis perintah: ${KUNING}$CMD_NAME${NC}"
-    cat << EOF > "$BIN_DIR/$CMD_NAME"
-#!/data/data/com.termux/files/usr/bin/bash
-# Auto-generated wrapper untuk $PY_FILE
-python3 "$PYTHON_DIR/$PY_FILE" "\$@"
-EOF
-    chmod +x "$BIN_DIR/$CMD_NAME"
-}
-
-# Mapping perintah terminal ke file Python
-create_wrapper "a" "cek_semua_data_adsterra_8_day.py"
-create_wrapper "b" "cek_semua_data_adsterra_30_day.py"
-create_wrapper "c" "cek_semua_data_adsterra_3_bulan.py"
-create_wrapper "d" "cek_semua_data_adsterra.py"
-create_wrapper "z" "z.py"
+if [ ! -f "$PYTHON_DIR/updater.py" ]; then
+    echo -e "${BIRU} -> Mengunduh: ${KUNING}updater.py${NC}"
+    curl -sL "$BASE_URL_PYTHON/updater.py" -o "$PYTHON_DIR/updater.py"
+else
+    echo -e "${HIJAU} -> updater.py sudah ada, melanjutkan...${NC}"
+fi
 
 # ------------------------------------------------------------------------------
-# 5. MENGUNDUH SCRIPT BASH (p & push) DARI GITHUB
+# 4. SINKRONISASI SCRIPT & WRAPPER (INKREMENTAL + PARALEL)
 # ------------------------------------------------------------------------------
-echo -e "\n${KUNING}[4/4] Mengunduh bash script Git Automation...${NC}"
-
-echo -e "${BIRU} -> Mengunduh 'p'...${NC}"
-curl -sL "$BASE_URL_SCRIPT/p" -o "$BIN_DIR/p"
-chmod +x "$BIN_DIR/p"
-
-echo -e "${BIRU} -> Mengunduh 'push'...${NC}"
-curl -sL "$BASE_URL_SCRIPT/push" -o "$BIN_DIR/push"
-chmod +x "$BIN_DIR/push"
-
-echo -e "${HIJAU} -> Selesai. Semua file bash siap digunakan.${NC}"
+# Updater membandingkan hash SHA-256 di manifest.json dengan file lokal,
+# mengunduh hanya file yang berubah secara paralel, memverifikasi checksum,
+# memasangnya secara atomic, menulis wrapper (a, b, c, d, z, ...) di bin
+# hanya jika berbeda, lalu melakukan byte-compile.
+echo -e "\n${KUNING}[3/3] Sinkronisasi script Python, wrapper & tools Git...${NC}"
+
+if ! python3 "$PYTHON_DIR/updater.py" --base-url "$BASE_URL" --prefix "$PREFIX"; then
+    echo -e "${MERAH} -> Update gagal. Periksa koneksi internet lalu jalankan ulang start.sh.${NC}"
+    exit 1
+fi
 
 # ------------------------------------------------------------------------------
 # 6. PENYELESAIAN
@@ -109,5 +81,7 @@ echo -e " - ${HIJAU}b${NC}    : Laporan 30 Hari"
 echo -e " - ${HIJAU}c${NC}    : Laporan 3 Bulan (90 Hari)"
 echo -e " - ${HIJAU}d${NC}    : Laporan Seluruh Data (All-Time)"
 echo -e " - ${HIJAU}z${NC}    : Laporan 15 Harian (Half-Month)"
-echo -e " - ${HIJAU}p${NC}    : Git Auto Pull, Add, Commit & Push"
+echo -e " - ${HIJAU}p${NC}    : Git Sync Cepat (Stage Perubahan, Fetch+Rebase, Push)"
 echo -e " - ${HIJAU}push${NC} : Smart Update Date (.md) & Git Push"
+echo -e " - ${HIJAU}push --watch${NC} : Pantau .md & Commit/Push Otomatis (Batch)"
+echo -e " - ${HIJAU}pushall${NC} : Push Banyak Website Hugo Sekaligus (Paralel)"
@@ -0,0 +1,33 @@
+import os
+import sys
+import atexit
+import shutil
+import tempfile
+import threading
+
+import pytest
+
+# Modul ada di python/ (datar, saling import langsung)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python"))
+
+# CACHE_DIR dibaca saat import: arahkan ke folder sementara sebelum modul apa pun
+# di-import, agar uji tidak pernah menyentuh ~/.cache/adsterra
+_TMP = tempfile.mkdtemp(prefix="adsterra_test_")
+os.environ["ADSTERRA_CACHE_DIR"] = os.path.join(_TMP, "cache")
+os.environ["ADSTERRA_CONFIG_DIR"] = os.path.join(_TMP, "config")
+atexit.register(shutil.rmtree, _TMP, True)
+
+@pytest.fixture
+def stub():
+    """Server stub Adsterra di port acak; mengembalikan URL stats.json"""
+    from adsterra_api import ApiConfig
+    from adsterra_stub import StubServer, Faults, StubConfig
+
+    server = StubServer(("127.0.0.1", 0), Faults(), keys=(ApiConfig.API_KEY,), quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}{StubConfig.STATS_PATH}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,62 @@
+"""Aturan peringatan: baris hari ini yang parsial & lock state antar-run"""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+import adsterra_fileio
+from adsterra_alerts import BelowStreak, open_engine
+from adsterra_fileio import LockTimeout
+
+TODAY = date(2026, 10, 18)
+# 1/4 hari GMT sudah berjalan
+NOW = datetime(2026, 10, 18, 6, 0, tzinfo=timezone.utc)
+
+def item(day, revenue):
+    return {"date": day.isoformat(), "impression": 1000, "clicks": 1, "ctr": 0.1,
+            "cpm": revenue, "revenue": revenue}
+
+@pytest.fixture
+def files(tmp_path):
+    rules = tmp_path / "alerts.json"
+    rules.write_text(json.dumps({"rules": [
+        {"name": "Revenue rendah", "type": "below_streak", "metric": "revenue", "threshold": 1.0, "days": 3},
+    ], "actions": {}}))
+    return str(rules), str(tmp_path / "alerts_state.json")
+
+def test_partial_today_row_uses_scaled_threshold():
+    rule = BelowStreak({"type": "below_streak", "metric": "revenue", "threshold": 1.0, "days": 3},
+                       {"streak": 2})
+    # $0.30 di jam 06:00 GMT = laju $1.20/hari, di atas ambang
+    assert rule.check(TODAY, {"revenue": 0.30}, frac=0.25) is None
+    assert rule.check(TODAY, {"revenue": 0.10}, frac=0.25)
+    # Hari final tetap dibandingkan dengan ambang penuh
+    assert rule.check(TODAY, {"revenue": 0.30})
+
+def test_provisional_alert_fires_once_across_runs(files):
+    rules, state = files
+    items = [item(TODAY - timedelta(days=n), 0.5) for n in (4, 3, 2, 1)] + [item(TODAY, 0.05)]
+
+    with open_engine(rules, state) as engine:
+        # Run pertama hanya menjadi dasar (streak 2)
+        engine.evaluate(items[:2], now=NOW)
+        first = engine.evaluate(items, now=NOW)
+    with open_engine(rules, state) as engine:
+        second = engine.evaluate(items, now=NOW)
+
+    assert [(a[1], a[3]) for a in first] == [
+        ((TODAY - timedelta(days=2)).isoformat(), False),
+        ((TODAY - timedelta(days=1)).isoformat(), False),
+        (TODAY.isoformat(), True),
+    ]
+    assert second == []
+
+def test_overlapping_run_waits_for_state_lock(files, monkeypatch):
+    rules, state = files
+    monkeypatch.setattr(adsterra_fileio.IOConfig, "LOCK_TIMEOUT", 0.1)
+
+    with open_engine(rules, state):
+        with pytest.raises(LockTimeout):
+            with open_engine(rules, state):
+                pass
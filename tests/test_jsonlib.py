@@ -0,0 +1,43 @@
+"""Backend JSON (stdlib/orjson/ujson) menghasilkan data & file ekspor yang sama"""
+
+import json
+
+import pytest
+
+from adsterra_cache import HistoryCache
+from adsterra_jsonlib import load_backend, synthetic_payload
+from adsterra_records import load_records
+from cek_semua_data_adsterra_json import process_smart_json
+
+@pytest.fixture(params=["stdlib", "orjson", "ujson"])
+def backend(request):
+    if request.param != "stdlib":
+        pytest.importorskip(request.param)
+    return load_backend(request.param)
+
+@pytest.fixture(scope="module")
+def payload():
+    return synthetic_payload(365 * 3)
+
+@pytest.fixture
+def export(payload, tmp_path):
+    """Struktur ekspor (meta + daily_stats + papan rekor) dari decode stdlib"""
+    items = json.loads(payload)["items"]
+    cache = HistoryCache(str(tmp_path))
+    cache.merge(items)
+    return process_smart_json(items, load_records(cache))
+
+def test_api_payload_decodes_identically(backend, payload):
+    loads, _ = backend
+    assert loads(payload) == json.loads(payload)
+
+def test_export_encodes_byte_identical(backend, export):
+    loads, dumps = backend
+    assert export["meta"] and export["daily_stats"]
+    assert dumps(export, True) == json.dumps(export, indent=2).encode("utf-8")
+    assert loads(dumps(export, True)) == export
+
+def test_compact_cache_round_trip(backend, export):
+    loads, dumps = backend
+    assert loads(dumps(export)) == export
+    assert json.loads(dumps(export)) == export
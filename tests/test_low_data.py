@@ -0,0 +1,96 @@
+"""Mode hemat data (--low-data) terhadap server stub: batas byte & revalidasi"""
+
+import sqlite3
+from datetime import timedelta
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+import adsterra_store
+from adsterra_api import ApiConfig
+from adsterra_cache import gmt_today
+from adsterra_jsonlib import response_json
+from adsterra_net import METER, NetConfig, make_session
+
+DAYS = 365
+# Run hangat setahun: hanya hari yang belum final / jatuh tempo yang ditarik
+WARM_BUDGET_BYTES = 1024
+
+@pytest.fixture
+def fetch(stub, tmp_path, monkeypatch):
+    monkeypatch.setattr(adsterra_store, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(METER, "responses", [])
+    monkeypatch.setattr(METER, "skipped_requests", 0)
+    today = gmt_today()
+
+    def run(start_ago=DAYS - 1, end_ago=0, low_data=True):
+        """(item per tanggal, total bandwidth, rentang yang ditarik) untuk satu GET"""
+        monkeypatch.setattr(NetConfig, "LOW_DATA", low_data)
+        METER.responses.clear()
+        session = make_session()
+        session.headers["X-API-Key"] = ApiConfig.API_KEY
+        resp = session.get(stub, params={
+            "start_date": (today - timedelta(days=start_ago)).isoformat(),
+            "finish_date": (today - timedelta(days=end_ago)).isoformat(),
+            "group_by": "date",
+        })
+        assert resp.status_code == 200
+        items = {i["date"]: (int(i["impression"]), round(float(i["revenue"]), 3))
+                 for i in response_json(resp)["items"]}
+        ranges = []
+        for r in METER.responses:
+            q = parse_qs(urlsplit(r.request.url).query)
+            ranges.append((q["start_date"][0], q["finish_date"][0]))
+        return items, METER.totals(), ranges
+
+    run.today = today
+    run.db = tmp_path / adsterra_store.DB_FILENAME
+    return run
+
+def _final(items, today):
+    return {d: v for d, v in items.items() if d < today.isoformat()}
+
+def test_warm_run_stays_within_byte_budget(fetch):
+    full, full_net, _ = fetch(low_data=False)
+    cold, cold_net, _ = fetch()
+    warm, warm_net, ranges = fetch()
+
+    assert cold_net["received"] == pytest.approx(full_net["received"], rel=0.05)
+    assert warm_net["requests"] == 1
+    assert warm_net["received"] <= WARM_BUDGET_BYTES
+    assert warm_net["received"] * 10 < cold_net["received"]
+    # Hanya jendela revalidasi harian terdekat (usia <= 3 hari) + hari ini
+    assert ranges == [((fetch.today - timedelta(days=3)).isoformat(), fetch.today.isoformat())]
+    # Data gabungan lokal + API sama dengan tarik penuh
+    assert len(warm) == DAYS
+    assert _final(warm, fetch.today) == _final(full, fetch.today)
+
+def test_days_due_for_revalidation_are_refetched(fetch):
+    fetch()
+    today = fetch.today
+    daily = (today - timedelta(days=10)).isoformat()
+    weekly = (today - timedelta(days=30)).isoformat()
+    with sqlite3.connect(fetch.db) as conn:
+        # Jadwal (14, 1): usia 10 hari, terakhir dicek kemarin -> jatuh tempo
+        conn.execute("UPDATE stats SET checked = ? WHERE date = ?",
+                     ((today - timedelta(days=1)).isoformat(), daily))
+        # Jadwal (60, 7): usia 30 hari, terakhir dicek 8 hari lalu -> jatuh tempo
+        conn.execute("UPDATE stats SET checked = ? WHERE date = ?",
+                     ((today - timedelta(days=8)).isoformat(), weekly))
+
+    items, net, ranges = fetch()
+    assert (daily, daily) in ranges
+    assert (weekly, weekly) in ranges
+    assert net["requests"] == 3
+    assert len(items) == DAYS
+
+    # Sudah dicek ulang hari ini: run berikutnya kembali ke satu request kecil
+    _, net, ranges = fetch()
+    assert net["requests"] == 1
+
+def test_fully_local_range_makes_no_request(fetch):
+    fetch()
+    items, net, _ = fetch(start_ago=300, end_ago=200)
+    assert net["requests"] == 0
+    assert METER.skipped_requests == 1
+    assert len(items) == 101
@@ -0,0 +1,14 @@
+"""Batas memori mode all-time & ekspor JSON (sama dengan adsterra_memory.py --check)"""
+
+import pytest
+
+from adsterra_memory import MemConfig, check
+
+@pytest.mark.parametrize("days", MemConfig.CHECK_DAYS)
+def test_peak_within_budget(days):
+    ok, results = check([days], quiet=True)
+
+    assert sorted(path for path, *_ in results) == ["alltime", "export"]
+    for path, n, peak, limit in results:
+        assert peak / 1024.0 <= limit, f"{path} {n} hari: puncak {peak / 1024:,.0f} KB > batas {limit:,.0f} KB"
+    assert ok
@@ -0,0 +1,91 @@
+"""multi_push terhadap repository bare lokal (tanpa jaringan)"""
+
+import os
+import subprocess
+
+import pytest
+
+import multi_push
+
+TARGET = "./content/game"
+OLD_DATE = "2020-01-01T00:00:00+07:00"
+
+def git(*args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+def make_site(root, name="site"):
+    """Clone dari remote bare baru, berisi satu post yang sudah di-push"""
+    os.makedirs(root, exist_ok=True)
+    remote = os.path.join(root, f"{name}.git")
+    work = os.path.join(root, name)
+    git("init", "-q", "--bare", remote, cwd=root)
+    git("clone", "-q", remote, work, cwd=root)
+    git("config", "user.email", "test@example.com", cwd=work)
+    git("config", "user.name", "Test", cwd=work)
+    os.makedirs(os.path.join(work, "content", "game"))
+    write(work, "post.md", f"---\ntitle: Post\ndate: {OLD_DATE}\n---\nisi\n")
+    git("add", "-A", cwd=work)
+    git("commit", "-q", "-m", "init", cwd=work)
+    git("push", "-q", "-u", "origin", "HEAD", cwd=work)
+    return work, remote
+
+def write(work, name, text, mode="w"):
+    with open(os.path.join(work, "content", "game", name), mode) as f:
+        f.write(text)
+
+@pytest.fixture
+def log_dir(tmp_path):
+    return str(tmp_path / "logs")
+
+def test_changed_post_is_dated_committed_and_pushed(tmp_path, log_dir):
+    work, remote = make_site(str(tmp_path))
+    write(work, "post.md", "tambahan\n", mode="a")
+
+    [result] = multi_push.run_all([work], TARGET, jobs=2, log_dir=log_dir)
+
+    assert result.ok, result.lines
+    assert result.md_updated == 1
+    assert result.summary["pushed"] == 1
+    assert git("rev-parse", "HEAD", cwd=work) == git("rev-parse", "HEAD", cwd=remote)
+    with open(os.path.join(work, "content", "game", "post.md")) as f:
+        assert OLD_DATE not in f.read()
+
+def test_no_push_commits_locally_only(tmp_path, log_dir):
+    work, remote = make_site(str(tmp_path))
+    write(work, "baru.md", f"---\ndate: {OLD_DATE}\n---\n")
+
+    [result] = multi_push.run_all([work], TARGET, jobs=1, push=False, log_dir=log_dir)
+
+    assert result.ok and result.summary["committed"]
+    assert git("rev-parse", "HEAD", cwd=work) != git("rev-parse", "HEAD", cwd=remote)
+
+def test_failing_repo_does_not_abort_batch(tmp_path, log_dir):
+    good, good_remote = make_site(str(tmp_path / "a"))
+    bad, _ = make_site(str(tmp_path / "b"))
+    not_repo = str(tmp_path / "bukan-repo")
+    os.makedirs(not_repo)
+    write(good, "post.md", "tambahan\n", mode="a")
+    # .md bukan UTF-8: update_front_matter_date melempar UnicodeDecodeError
+    with open(os.path.join(bad, "content", "game", "rusak.md"), "wb") as f:
+        f.write(b"---\ndate: x\n---\n\xff\xfe\n")
+
+    results = multi_push.run_all([good, bad, not_repo], TARGET, jobs=3, log_dir=log_dir)
+
+    assert [r.path for r in results] == [good, bad, not_repo]
+    assert results[0].ok
+    assert git("rev-parse", "HEAD", cwd=good) == git("rev-parse", "HEAD", cwd=good_remote)
+    assert not results[1].ok and results[1].error.startswith("UnicodeDecodeError")
+    assert not results[2].ok
+
+def test_same_basename_repos_get_separate_logs(tmp_path, log_dir):
+    first, _ = make_site(str(tmp_path / "x"))
+    second, _ = make_site(str(tmp_path / "y"))
+
+    multi_push.run_all([first, second], TARGET, jobs=2, log_dir=log_dir)
+
+    logs = sorted(os.listdir(log_dir))
+    assert len(logs) == 2 and all(name.startswith("site-") for name in logs)
+    for name, path in zip(logs, sorted([first, second], key=multi_push.log_filename)):
+        with open(os.path.join(log_dir, name)) as f:
+            text = f.read()
+        assert text.count("\n=== ") + text.startswith("=== ") == 1 and path in text
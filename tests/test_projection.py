@@ -0,0 +1,58 @@
+"""Model proyeksi mengikuti revisi / backfill riwayat di HistoryCache"""
+
+from datetime import date, datetime, timedelta
+
+from adsterra_cache import HistoryCache
+from adsterra_projection import STATE_KEY, load_model, project_total
+
+TODAY = date(2026, 10, 18)
+NOW = datetime(2026, 10, 18, 6, 0)
+END = date(2026, 10, 31)
+GAP = (TODAY - timedelta(days=10)).isoformat()
+
+def item(day, revenue):
+    return {"date": day.isoformat(), "impression": 1000, "clicks": 1, "ctr": 0.1,
+            "cpm": revenue, "revenue": revenue}
+
+def history(tmp_path):
+    """60 hari final ($1/hari) dengan satu hari yang belum masuk (GAP)"""
+    cache = HistoryCache(str(tmp_path))
+    days = [TODAY - timedelta(days=n) for n in range(60, 0, -1)]
+    cache.merge([item(d, 1.0) for d in days if d.isoformat() != GAP], today=TODAY)
+    cache.save()
+    return cache
+
+def projection(cache):
+    return project_total(load_model(cache), 0.0, 0.5, NOW, END)["total"]
+
+def test_backfilled_day_rebuilds_model(tmp_path):
+    cache = history(tmp_path)
+    before = projection(cache)
+    state = dict(cache.state[STATE_KEY])
+
+    # Hari yang telat datang, sebelum tanggal final terakhir
+    cache.merge([item(date.fromisoformat(GAP), 40.0)], today=TODAY)
+    cache.save()
+    reloaded = HistoryCache(str(tmp_path))
+    after = projection(reloaded)
+
+    assert after != before
+    assert reloaded.state[STATE_KEY]["n"] == state["n"] + 1
+    assert reloaded.state[STATE_KEY]["var"] > state["var"]
+
+def test_revised_day_rebuilds_model(tmp_path):
+    cache = history(tmp_path)
+    before = projection(cache)
+
+    cache.merge([item(TODAY - timedelta(days=20), 40.0)], today=TODAY)
+    assert projection(cache) != before
+
+def test_unchanged_history_keeps_state(tmp_path):
+    cache = history(tmp_path)
+    projection(cache)
+    state = dict(cache.state[STATE_KEY])
+    cache.dirty = False
+
+    projection(cache)
+    assert cache.state[STATE_KEY] == state
+    assert not cache.dirty
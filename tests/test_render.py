@@ -0,0 +1,96 @@
+"""Render cache tabel harian: output identik dengan tabulate tanpa cache"""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+from tabulate import tabulate
+
+import adsterra_render
+from adsterra_anomaly import Anomaly
+from adsterra_jsonlib import synthetic_payload
+from adsterra_render import TABLE, render_table
+from adsterra_store import StatsStore
+from cek_semua_data_adsterra import render_daily_row as alltime_row
+from cek_semua_data_adsterra_3_bulan import render_daily_row as bulan_row
+
+HEADERS = ["TANGGAL", "IMPRESSIONS", "CPM", "REVENUE"]
+
+@pytest.fixture
+def store(tmp_path):
+    store = StatsStore(path=str(tmp_path / "stats.sqlite3"))
+    yield store
+    store.close()
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Jumlah baris yang diproses tabulate per panggilan render_table"""
+    seen = []
+
+    def counting(rows, *args, **kwargs):
+        seen.append(len(rows))
+        return tabulate(rows, *args, **kwargs)
+
+    monkeypatch.setattr(adsterra_render, "tabulate", counting)
+    return seen
+
+def make_rows(items, row_fn=alltime_row, anomalies=None):
+    anomalies = anomalies or {}
+    return [(i["date"], row_fn(i["date"], i["impression"], i["cpm"], i["revenue"], anomalies.get(i["date"])))
+            for i in items]
+
+def plain(rows):
+    return tabulate([cells for _, cells in rows], headers=HEADERS, **TABLE)
+
+def synthetic(days):
+    items = json.loads(synthetic_payload(days))["items"]
+    return items, date.fromisoformat(items[-1]["date"])
+
+@pytest.mark.parametrize("row_fn", [alltime_row, bulan_row])
+def test_warm_render_matches_and_skips_finalized_rows(store, calls, row_fn):
+    items, today = synthetic(400)
+    rows = make_rows(items, row_fn)
+
+    assert render_table(rows, HEADERS, store, "uji", today) == plain(rows)
+    assert render_table(rows, HEADERS, store, "uji", today) == plain(rows)
+    # Run hangat: hanya baris hari ini + 2 baris pin lewat tabulate
+    assert calls == [400, 3]
+
+def test_new_day_and_revised_day(store, calls):
+    items, today = synthetic(120)
+    render_table(make_rows(items), HEADERS, store, "uji", today)
+
+    tomorrow = today + timedelta(days=1)
+    items[50] = dict(items[50], revenue=items[50]["revenue"] + 1.0)
+    items.append(dict(items[-1], date=tomorrow.isoformat()))
+    rows = make_rows(items)
+
+    assert render_table(rows, HEADERS, store, "uji", tomorrow) == plain(rows)
+    # Hari ini kemarin (kini final), hari ini baru, dan hari yang direvisi
+    assert calls[-1] == 3 + 2
+
+def test_anomaly_marker_change_is_rerendered(store):
+    items, today = synthetic(60)
+    render_table(make_rows(items), HEADERS, store, "uji", today)
+
+    marked = {items[10]["date"]: [Anomaly(items[10]["date"], "revenue", items[10]["revenue"], 1.0, -4.0)]}
+    rows = make_rows(items, anomalies=marked)
+    assert render_table(rows, HEADERS, store, "uji", today) == plain(rows)
+
+def test_column_widening_and_shrinking(store):
+    items, today = synthetic(90)
+    render_table(make_rows(items), HEADERS, store, "uji", today)
+
+    # Hari baru dengan impresi jauh lebih lebar dari semua baris di cache
+    wide = items + [dict(items[-1], date=(today + timedelta(days=1)).isoformat(), impression=123456789)]
+    rows = make_rows(wide)
+    assert render_table(rows, HEADERS, store, "uji", today + timedelta(days=2)) == plain(rows)
+
+    # Jendela bergeser dan baris terlebar keluar dari tabel: kolom kembali menyempit
+    rows = make_rows(items[1:])
+    assert render_table(rows, HEADERS, store, "uji", today) == plain(rows)
+
+def test_thousand_separated_cells_are_not_reparsed(store):
+    items = [{"date": f"2026-01-{d:02d}", "impression": 12300, "cpm": 0.5, "revenue": 6.15} for d in range(1, 6)]
+    table = render_table(make_rows(items), HEADERS, store, "uji", date(2026, 1, 6))
+    assert "12.300" in table
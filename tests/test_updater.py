@@ -0,0 +1,86 @@
+"""updater.py terhadap server HTTP lokal: checksum, pemasangan atomic, 304"""
+
+import os
+import sys
+import json
+import hashlib
+import subprocess
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+UPDATER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python", "updater.py")
+
+GOOD = b"print('baik')\n"
+BAD = b"print('asli')\n"
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+@pytest.fixture
+def server(tmp_path):
+    """Folder repo palsu yang dilayani http.server; mengembalikan (root, base_url)"""
+    root = tmp_path / "repo"
+    (root / "python").mkdir(parents=True)
+    (root / "python" / "good.py").write_bytes(GOOD)
+    # Isi di server berbeda dengan hash di manifest (file rusak / diubah di tengah jalan)
+    (root / "python" / "bad.py").write_bytes(b"print('diubah')\n")
+    manifest = {
+        "files": {
+            "python/good.py": {"sha256": sha256(GOOD), "size": len(GOOD)},
+            "python/bad.py": {"sha256": sha256(BAD), "size": len(BAD)},
+        },
+        "wrappers": {"good": "good.py"},
+    }
+    (root / "manifest.json").write_text(json.dumps(manifest))
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=str(root)))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield root, f"http://127.0.0.1:{httpd.server_address[1]}"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+def run_updater(base_url, prefix):
+    return subprocess.run([sys.executable, UPDATER, "--base-url", base_url, "--prefix", str(prefix)],
+                          capture_output=True, text=True, timeout=60)
+
+def test_good_file_installed_and_tampered_file_rejected(server, tmp_path):
+    root, base_url = server
+    prefix = tmp_path / "prefix"
+    installed = prefix / "mypython"
+
+    result = run_updater(base_url, prefix)
+
+    assert result.returncode == 1, result.stdout
+    assert (installed / "good.py").read_bytes() == GOOD
+    assert "checksum tidak cocok untuk python/bad.py" in result.stdout
+    assert not (installed / "bad.py").exists()
+    # Tidak ada file sementara yang tertinggal, dan state tidak disimpan (run berikutnya mencoba lagi)
+    assert sorted(os.listdir(installed)) == ["__pycache__", "good.py"]
+    assert not (installed / ".installed.json").exists()
+    assert (prefix / "bin" / "good").read_text().endswith(f'python3 "{installed}/good.py" "$@"\n')
+
+def test_fixed_file_installed_then_manifest_not_modified(server, tmp_path):
+    root, base_url = server
+    prefix = tmp_path / "prefix"
+    run_updater(base_url, prefix)
+
+    (root / "python" / "bad.py").write_bytes(BAD)
+    result = run_updater(base_url, prefix)
+    assert result.returncode == 0, result.stdout
+    assert (prefix / "mypython" / "bad.py").read_bytes() == BAD
+    assert "1 diperbarui, 0 gagal" in result.stdout
+
+    result = run_updater(base_url, prefix)
+    assert result.returncode == 0, result.stdout
+    assert "Manifest tidak berubah (304)" in result.stdout
+    assert "Semua file sudah versi terbaru" in result.stdout